@@ -39,6 +39,9 @@ class Configuration:
     # See: https://github.com/swagger-atlas/atlas/blob/master/docs/profiles.md for more details
     LOAD_TEST_SCENARIOS = {}
 
+    # Run the operations which do not depend upon each other as Artillery "parallel" steps, instead of one by one
+    LOAD_TEST_PARALLEL_STEPS = False
+
     # #### Load Test Settings
 
     SPAWN_RATE = 1    # Rate at which VUs will spawn
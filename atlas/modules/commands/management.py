@@ -14,6 +14,7 @@ COMMANDS = {
     "transform": "atlas.modules.transformer.commands.converter.Converter",
     "validate": "atlas.modules.helpers.commands.validate.Validate",
     "generate_routes": "atlas.modules.helpers.commands.generate_routes.Generator",
+    "spec_cache": "atlas.modules.helpers.commands.spec_cache.SpecCacheInfo",
     "detect_resources": "atlas.modules.resource_creator.commands.generate.Generate",
     "fetch_data": "atlas.modules.resource_data_generator.commands.generate.Generate",
     "setup": "atlas.modules.transformer.commands.setup.Setup",
@@ -0,0 +1,89 @@
+fs = require('fs');
+
+// Reads resource pools written by ATLAS build (atlas/modules/resource_pool.py has the details of format)
+
+const MAGIC = "ATRP";
+const VERSION = 1;
+
+const INT32 = 1;
+const INT64 = 2;
+const FLOAT64 = 3;
+const STRING = 4;
+const JSON_VALUES = 5;
+
+
+exports.decode = function decode(buffer) {
+    // Values of each pool, keyed on name of pool
+
+    if (buffer.length < 12 || buffer.toString('latin1', 0, 4) !== MAGIC) {
+        throw new Error("Not a resource pool file");
+    }
+
+    const version = buffer.readUInt32LE(4);
+    if (version !== VERSION) {
+        throw new Error(`Unsupported resource pool version ${version}`);
+    }
+
+    const count = buffer.readUInt32LE(8);
+    let offset = 12;
+    const pools = {};
+
+    for (let poolIndex = 0; poolIndex < count; poolIndex++) {
+        const keyLength = buffer.readUInt32LE(offset);
+        offset += 4;
+        const key = buffer.toString('utf8', offset, offset + keyLength);
+        offset += keyLength;
+
+        const type = buffer.readUInt8(offset);
+        const valueCount = buffer.readUInt32LE(offset + 1);
+        offset += 5;
+
+        let values = new Array(valueCount);
+
+        switch (type) {
+            case INT32:
+                for (let idx = 0; idx < valueCount; idx++, offset += 4) {
+                    values[idx] = buffer.readInt32LE(offset);
+                }
+                break;
+            case INT64:
+                // Numbers in JS are doubles, so IDs beyond 2^53 lose precision, as they would in JSON
+                for (let idx = 0; idx < valueCount; idx++, offset += 8) {
+                    values[idx] = Number(buffer.readBigInt64LE(offset));
+                }
+                break;
+            case FLOAT64:
+                for (let idx = 0; idx < valueCount; idx++, offset += 8) {
+                    values[idx] = buffer.readDoubleLE(offset);
+                }
+                break;
+            case STRING: {
+                let start = offset + 4 * valueCount;
+                for (let idx = 0; idx < valueCount; idx++) {
+                    const end = start + buffer.readUInt32LE(offset + 4 * idx);
+                    values[idx] = buffer.toString('utf8', start, end);
+                    start = end;
+                }
+                offset = start;
+                break;
+            }
+            case JSON_VALUES: {
+                const length = buffer.readUInt32LE(offset);
+                offset += 4;
+                values = JSON.parse(buffer.toString('utf8', offset, offset + length));
+                offset += length;
+                break;
+            }
+            default:
+                throw new Error(`Unknown type ${type} of resource pool ${key}`);
+        }
+
+        pools[key] = values;
+    }
+
+    return pools;
+};
+
+exports.read = function read(poolFile) {
+    return exports.decode(fs.readFileSync(poolFile));
+};
@@ -1,5 +1,7 @@
 _ = require('lodash');
+path = require('path');
 settings = require('./settings');
+resourcePool = require('./resourcePool');
 
 const singleton = Symbol();
 const singletonEnforcer = Symbol();
@@ -71,6 +73,17 @@ exports.Resource = class Resource {
         }
     }
 
+    loadPool(poolFile) {
+        // Pools are keyed on Resource.getKey(profile, resourceKey)
+        const pools = resourcePool.read(poolFile);
+
+        for (const [key, values] of Object.entries(pools)) {
+            if (!_.isEmpty(values)) {
+                this.resources[key] = new Set(values);
+            }
+        }
+    }
+
     deleteResource(profile, resourceKey, resourceValue) {
         this.resources[Resource.getKey(profile, resourceKey)].delete(resourceValue);
     }
@@ -0,0 +1,25 @@
+from atlas.modules.commands.base import BaseCommand
+from atlas.modules.commands.utils import add_bool_arg
+from atlas.modules.helpers import spec_cache
+
+
+class SpecCacheInfo(BaseCommand):
+
+    help = "Shows the Hit/Miss counts for parsed Swagger cache. Optionally, clears the cache"
+
+    def add_arguments(self, parser):
+        add_bool_arg(parser, "clear", default=False)
+
+    def handle(self, **options):
+        cache = spec_cache.SpecCache()
+
+        if options.get("clear"):
+            cache.clear()
+            return "Spec cache cleared\n"
+
+        info = cache.info()
+        return (
+            f"Entries: {info['entries']} ({info['size']} bytes)\n"
+            f"Hits: {info[spec_cache.HITS]}\n"
+            f"Misses: {info[spec_cache.MISSES]}\n"
+        )
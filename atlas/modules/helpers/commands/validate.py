@@ -1,5 +1,5 @@
 from atlas.modules.commands.base import BaseCommand
-from atlas.modules.helpers import open_api_reader, swagger
+from atlas.modules.helpers import pipeline, swagger
 
 
 class Validate(BaseCommand):
@@ -7,6 +7,6 @@ class Validate(BaseCommand):
     help = "Validates the Swagger File"
 
     def handle(self, **options):
-        specs = open_api_reader.SpecsFile().inp_file_load()
-        validator = swagger.Swagger(specs)
+        context = options.get("context") or pipeline.PipelineContext()
+        validator = swagger.Swagger(context.input_specs)
         validator.validate()
@@ -1,21 +1,27 @@
-from copy import deepcopy
+from types import MappingProxyType
 
 from atlas.conf import settings
 from atlas.modules import constants
 
 
 class ElementConfig:
+    """
+    Read-only view over configuration of an element in spec.
+    It does not copy the configuration, since views are created for every property of every definition.
+    """
+
+    __slots__ = ("config", "resolved_config")
 
     def __init__(self, config):
         self.config = config
         self.resolved_config = self.resolve_config()
 
     def resolve_config(self):
-        config = deepcopy(self.config)
+        config = self.config
         _type = config.get(constants.TYPE)
         if _type == constants.ARRAY:
             config = config.get(constants.ITEMS, {})
-        return config
+        return MappingProxyType(config)
 
     @property
     def ref(self):
@@ -24,6 +30,8 @@ class ElementConfig:
 
 class ReferenceField(ElementConfig):
 
+    __slots__ = ("name",)
+
     def __init__(self, name, config):
         super().__init__(config=config)
         self.name = name
@@ -47,6 +55,8 @@ class Schema:
     https://github.com/OAI/OpenAPI-Specification/blob/master/versions/2.0.md#schemaObject
     """
 
+    __slots__ = ("config", "specs")
+
     def __init__(self, schema_config, specs=None):
         self.config = schema_config
         self.specs = specs or {}
@@ -3,13 +3,14 @@ import json
 import os
 
 import six
-import yaml
 
 from atlas.modules import (
     constants,
     exceptions,
     utils,
+    yaml_io,
 )
+from atlas.modules.helpers import spec_cache
 from atlas.conf import settings
 
 
@@ -17,17 +18,19 @@ class SpecsFile:
 
     CONVERTER = {
         constants.JSON: json.load,
-        constants.YAML: yaml.safe_load
+        constants.YAML: yaml_io.load
     }
 
-    def __init__(self, spec_file=None, converter=None):
+    def __init__(self, spec_file=None, converter=None, use_cache=None):
         """
         :param spec_file: Specification File Name
         :param converter: Which converter to use (JSON or YAML). Leave Null to let converter identify on its own
+        :param use_cache: Whether to use parsed spec cache. Leave Null to pick it from settings
         """
 
         self.spec_file = spec_file or settings.SWAGGER_FILE
         self.converter = converter
+        self.use_cache = settings.SPEC_CACHE if use_cache is None else use_cache
 
         if isinstance(self.converter, six.string_types):
             self.converter = self.converter.lower()
@@ -44,18 +47,19 @@ class SpecsFile:
         else:
             raise exceptions.ImproperSwaggerException("Incorrect extension for {}".format(self.spec_file))
 
-    def file_load(self):
-        _file = os.path.join(utils.get_project_path(), settings.OUTPUT_FOLDER, self.spec_file)
+    def load(self, folder):
+        _file = os.path.join(utils.get_project_path(), folder, self.spec_file)
+
+        if self.use_cache:
+            return spec_cache.SpecCache().load(_file, self.converter, self.CONVERTER[self.converter])
 
         with open(_file) as open_api_file:
             ret_stream = self.CONVERTER[self.converter](open_api_file)
 
         return ret_stream
 
-    def inp_file_load(self):
-        _file = os.path.join(utils.get_project_path(), settings.INPUT_FOLDER, self.spec_file)
-
-        with open(_file) as open_api_file:
-            ret_stream = self.CONVERTER[self.converter](open_api_file)
+    def file_load(self):
+        return self.load(settings.OUTPUT_FOLDER)
 
-        return ret_stream
+    def inp_file_load(self):
+        return self.load(settings.INPUT_FOLDER)
@@ -0,0 +1,81 @@
+from atlas.modules import mixins, yaml_io
+from atlas.modules.helpers import open_api_reader, profiler as build_profiler, references
+from atlas.conf import settings
+
+
+class PipelineContext(mixins.YAMLReadWriteMixin):
+    """
+    In-memory state shared by stages of a build (Validation, Resource Detection, Data Fetch, Conversion).
+
+    Every stage used to read its inputs from disk, even when previous stage had just written them.
+    Context loads Specs, Resource Map and Profiles at most once, and stages hand over their updated data to it.
+    Files are still written by stages, since they are part of build (and distribution) output.
+
+    Everything is loaded lazily, so a stage which runs stand-alone only reads what it needs.
+
+    Sample Usage:
+        context = PipelineContext()
+        validate.Validate().handle(context=context)
+        create_resource.Generate().handle(context=context)
+    """
+
+    def __init__(self, profiler=None):
+        """
+        :param profiler: BuildProfiler which stages could use to record their sub-stages and counts
+        """
+        super().__init__()
+        self.profiler = profiler or build_profiler.BuildProfiler(enabled=False)
+        self._input_specs = None
+        self._specs = None
+        self._resource_map = None
+        self._profiles = None
+
+        # Resources fetched for each profile in this build, keyed on Profile name
+        self.profile_resources = {}
+
+    @property
+    def input_specs(self) -> dict:
+        """
+        Swagger from INPUT folder. Resource Detection updates it in-place
+        """
+        if self._input_specs is None:
+            self._input_specs = open_api_reader.SpecsFile().inp_file_load()
+        return self._input_specs
+
+    @property
+    def specs(self) -> dict:
+        """
+        Swagger updated by Resource Detection. If detection has not run in this build, it is read from OUTPUT folder
+        """
+        if self._specs is None:
+            self._specs = open_api_reader.SpecsFile().file_load()
+        return self._specs
+
+    @specs.setter
+    def specs(self, specs: dict):
+        # Subsequent stages depend on order of keys (for eg: ordering of operations)
+        # So we keep them same as they would be if specs were read back from file
+        for old_specs in [self._input_specs, self._specs]:
+            if old_specs is not None:
+                references.forget(old_specs)
+        self._specs = yaml_io.normalize(specs)
+
+    @property
+    def resource_map(self) -> dict:
+        if self._resource_map is None:
+            self._resource_map = self.read_file_from_input(settings.MAPPING_FILE) or {}
+        return self._resource_map
+
+    @resource_map.setter
+    def resource_map(self, resource_map: dict):
+        self._resource_map = yaml_io.normalize(resource_map)
+
+    @property
+    def profiles(self) -> dict:
+        if self._profiles is None:
+            self._profiles = self.read_file_from_input(settings.PROFILES_FILE, {})
+        return self._profiles
+
+    def set_profile_resources(self, profile_resources: dict):
+        for profile, resources in profile_resources.items():
+            self.profile_resources[profile] = yaml_io.normalize(resources)
@@ -0,0 +1,200 @@
+from collections import Counter
+import contextlib
+from io import open
+import json
+import os
+import time
+import tracemalloc
+
+from atlas.modules import utils
+from atlas.conf import settings
+
+try:
+    import resource
+except ImportError:     # Not available on Windows
+    resource = None
+
+
+REPORT_FILE = "profile.json"
+
+
+class BuildProfiler:
+    """
+    Records where a build spends its time, stage by stage.
+
+    For every stage, it records wall time, CPU time and counts (for eg: operations, references resolved).
+    Bytes written are recorded for stages which name their outputs, so that only those paths are walked.
+    Peak traced memory is recorded if trace_memory is enabled, since tracing allocations slows down the build.
+    Rest of it is cheap, and can be left on.
+
+    Stages can be nested. Counts of nested stages are part of their parent.
+
+    Sample Usage:
+        profiler = BuildProfiler(counters={"refs_resolved": (references.stats, references.RESOLVED)})
+        with profiler.stage("transform", outputs=["build/artillery"]):
+            with profiler.stage("ordering"):
+                ...
+            profiler.count("operations", 10)
+        profiler.write_report()
+
+    A disabled profiler records nothing, so code can always be instrumented.
+    """
+
+    VERSION = 1
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False, counters: dict = None):
+        """
+        :param enabled: If False, nothing is recorded
+        :param trace_memory: Record peak memory of stages via tracemalloc
+        :param counters: Map of count name to (Counter, key). Increase in counter value is recorded for every stage
+        """
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.counters = counters or {}
+
+        self.stages = []
+        self._open_stages = []
+
+    def get_counter_values(self) -> dict:
+        return {name: counter[key] for name, (counter, key) in self.counters.items()}
+
+    @staticmethod
+    def get_file_states(outputs: list) -> dict:
+        """
+        Modification time and size of output files
+        :param outputs: Files and folders, relative to project folder
+        """
+
+        project_path = utils.get_project_path()
+        states = {}
+
+        for output in outputs:
+            output_path = os.path.join(project_path, output)
+            if os.path.isfile(output_path):
+                file_paths = [output_path]
+            else:
+                file_paths = []
+                for path, folders, files in os.walk(output_path):
+                    # Installed packages and caches are not part of build output, and are too many to walk
+                    folders[:] = [folder for folder in folders if folder not in {"node_modules", settings.CACHE_FOLDER}]
+                    file_paths.extend(os.path.join(path, file_name) for file_name in files)
+
+            for file_path in file_paths:
+                try:
+                    file_stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue    # Temporary files could be removed while we walk
+                states[file_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        return states
+
+    @staticmethod
+    def get_bytes_written(start_states: dict, end_states: dict) -> int:
+        """
+        Size of files which have been created or modified between two states
+        """
+        return sum(state[1] for path, state in end_states.items() if start_states.get(path) != state)
+
+    def record_peak(self, record: dict):
+        """
+        Fold the peak traced since last reset into record, and reset it, so that nested stages get their own peak
+        """
+        record["peak_traced_memory"] = max(record["peak_traced_memory"], tracemalloc.get_traced_memory()[1])
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    @contextlib.contextmanager
+    def stage(self, name: str, outputs: list = None):
+        """
+        :param name: Name of stage in report
+        :param outputs: Files and folders (relative to project folder) which the stage writes.
+            Bytes written are only recorded if these are given
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        if self.trace_memory and self._open_stages:
+            self.record_peak(self._open_stages[-1])
+
+        record = {
+            "name": name,
+            "wall_time": 0,
+            "cpu_time": 0,
+            "peak_traced_memory": 0 if self.trace_memory else None,
+            "max_rss": None,
+            "counts": Counter(),
+            "stages": []
+        }
+        (self._open_stages[-1]["stages"] if self._open_stages else self.stages).append(record)
+        self._open_stages.append(record)
+
+        start_counters = self.get_counter_values()
+        start_files = self.get_file_states(outputs) if outputs else None
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+
+        try:
+            yield
+        finally:
+            record["wall_time"] = round(time.perf_counter() - start_wall, 6)
+            record["cpu_time"] = round(time.process_time() - start_cpu, 6)
+
+            for counter_name, value in self.get_counter_values().items():
+                record["counts"][counter_name] += value - start_counters[counter_name]
+            if outputs:
+                record["counts"]["bytes_written"] += self.get_bytes_written(start_files, self.get_file_states(outputs))
+
+            if resource:
+                # High-water mark of the process so far. In KB on Linux, and bytes on MacOS
+                record["max_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+            self._open_stages.pop()
+
+            if self.trace_memory:
+                self.record_peak(record)
+                if self._open_stages:
+                    parent = self._open_stages[-1]
+                    parent["peak_traced_memory"] = max(parent["peak_traced_memory"], record["peak_traced_memory"])
+
+            if started_tracing:
+                tracemalloc.stop()
+
+    def count(self, name: str, value: int = 1):
+        """
+        Add to count of all running stages
+        """
+        for record in self._open_stages:
+            record["counts"][name] += value
+
+    def get_report(self) -> dict:
+        return {
+            "version": self.VERSION,
+            "wall_time": round(sum(record["wall_time"] for record in self.stages), 6),
+            "cpu_time": round(sum(record["cpu_time"] for record in self.stages), 6),
+            "stages": self.stages
+        }
+
+    def write_report(self, path: str = None) -> str:
+        """
+        Write the JSON report, by default to OUTPUT folder. Returns the path of report
+        """
+
+        if not self.enabled:
+            return ""
+
+        path = path or os.path.join(utils.get_project_path(), settings.OUTPUT_FOLDER, REPORT_FILE)
+
+        folder = os.path.dirname(path)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        with open(path, "w") as report_stream:
+            json.dump(self.get_report(), report_stream, indent=2)
+
+        return path
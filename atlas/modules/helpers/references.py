@@ -0,0 +1,189 @@
+from collections import Counter, OrderedDict
+
+from atlas.modules import constants, exceptions, utils
+
+
+RESOLVED = "resolved"
+INDEXED = "indexed"
+INDEX_MISSES = "index_misses"
+INDEXES_BUILT = "indexes_built"
+
+# Counts for current process:
+#   RESOLVED - References resolved
+#   INDEXED - Reference targets added to indexes, when they were built
+#   INDEX_MISSES - References which were not in index, and so were resolved by walking the spec
+#   INDEXES_BUILT - Number of specs indexed
+stats = Counter()
+
+# Resolvers are kept for these many latest specs
+MAX_RESOLVERS = 8
+
+_resolvers = OrderedDict()
+
+
+class ReferenceResolver:
+    """
+    Resolves local references ($ref) of a specification in O(1).
+
+    When resolver is created, it indexes target of every $ref present in the spec.
+    Any other reference (for eg: a definition which was added to spec later) is resolved by walking the spec,
+    and then added to index.
+
+    Index holds the targets themselves, so in-place changes to them are visible to resolver.
+    With each target, it holds the objects on the path to it, which are checked (by identity) before target is
+    returned. So if a target (or any object above it) is replaced or removed in spec, the reference is resolved again.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.index = {}
+        self.build_index()
+
+        # Resolved schemas of references. Maintained by SchemaResolver
+        self.schemas = {}
+
+    @staticmethod
+    def get_refs(spec) -> set:
+        """
+        Find all references in spec
+        """
+
+        refs = set()
+        visited = set()
+        stack = [spec]
+
+        while stack:
+            element = stack.pop()
+
+            # Loaded specs could share objects (for eg: YAML aliases), so visit them only once
+            if id(element) in visited:
+                continue
+            visited.add(id(element))
+
+            if isinstance(element, dict):
+                ref = element.get(constants.REF)
+                if isinstance(ref, str):
+                    refs.add(ref)
+                values = element.values()
+            else:
+                values = element
+
+            stack.extend(value for value in values if isinstance(value, (dict, list)))
+
+        return refs
+
+    def walk(self, ref: str) -> tuple:
+        """
+        Walk the spec to target of reference, in the same way as utils.resolve_reference()
+        :return: Target, and the links (container, key, value) walked to reach it
+        """
+
+        target = self.spec
+        links = []
+
+        for ref_element in utils.get_ref_path_array(ref):
+            if isinstance(target, list):
+                if not (ref_element.isdigit() and int(ref_element) < len(target)):
+                    raise exceptions.ImproperSwaggerException(f"Cannot find reference {ref_element} in {target}")
+                key = int(ref_element)
+                value = target[key]
+            else:
+                key = ref_element
+                value = target.get(key)
+
+            if not value:
+                raise exceptions.ImproperSwaggerException(f"Cannot find reference {ref_element} in {value}")
+
+            links.append((target, key, value))
+            target = value
+
+        return target, links
+
+    @staticmethod
+    def is_current(links: list) -> bool:
+        """
+        Whether each link still holds the same object
+        """
+
+        for container, key, value in links:
+            if isinstance(container, list):
+                current = container[key] if key < len(container) else None
+            else:
+                current = container.get(key)
+
+            if current is not value:
+                return False
+
+        return True
+
+    def build_index(self):
+
+        if not isinstance(self.spec, dict):
+            return
+
+        for ref in self.get_refs(self.spec):
+            try:
+                self.index[ref] = self.walk(ref)
+            except exceptions.ImproperSwaggerException:
+                continue    # Invalid references are reported when someone resolves them
+
+        stats[INDEXES_BUILT] += 1
+        stats[INDEXED] += len(self.index)
+
+    def resolve(self, ref: str):
+        """
+        Resolve Reference and return the referred part
+        """
+
+        stats[RESOLVED] += 1
+
+        entry = self.index.get(ref)
+        if entry is not None:
+            if self.is_current(entry[1]):
+                return entry[0]
+
+            # Spec has been changed in-place. Schemas resolved from old target could be in cache too
+            self.schemas.clear()
+
+        stats[INDEX_MISSES] += 1
+
+        self.index[ref] = self.walk(ref)
+        return self.index[ref][0]
+
+
+def get_resolver(spec) -> ReferenceResolver:
+    """
+    Get the resolver for spec. It is built on first use, and then re-used as long as spec is among latest specs
+    """
+
+    key = id(spec)
+    resolver = _resolvers.get(key)
+
+    # Resolver keeps its spec alive, so the ID should not have been re-used. We still check, rather than trust it
+    if resolver is not None and resolver.spec is spec:
+        _resolvers.move_to_end(key)
+        return resolver
+
+    resolver = _resolvers[key] = ReferenceResolver(spec)
+    _resolvers.move_to_end(key)
+
+    if len(_resolvers) > MAX_RESOLVERS:
+        _resolvers.popitem(last=False)
+
+    return resolver
+
+
+def forget(spec):
+    """
+    Drop the resolver of spec, for eg: when spec is replaced by another one, so that it is not kept alive
+    """
+    resolver = _resolvers.get(id(spec))
+    if resolver is not None and resolver.spec is spec:
+        del _resolvers[id(spec)]
+
+
+def resolve(spec, ref: str):
+    """
+    Resolve Reference in spec and return the referred part
+    """
+    return get_resolver(spec).resolve(ref)
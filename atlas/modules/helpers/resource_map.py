@@ -8,9 +8,15 @@ class ResourceMapResolver(mixins.YAMLReadWriteMixin):
     Resolves Resource Map, and returns resolved configs
     """
 
-    def __init__(self):
+    def __init__(self, resource_map=None):
+        """
+        :param resource_map: Contents of Resource Mapping file. Leave Null to read it from file
+        """
         super().__init__()
-        self.resource_map = self.read_file_from_input(settings.MAPPING_FILE) or {}
+        if resource_map is None:
+            resource_map = self.read_file_from_input(settings.MAPPING_FILE) or {}
+
+        self.resource_map = resource_map
         self.resource_config = {}
 
         # One of the major concept in Resource mapping relates to Aliases
@@ -0,0 +1,162 @@
+from collections import Counter
+import hashlib
+from io import open, BytesIO
+import json
+import os
+import pickle
+
+from atlas.modules import utils
+from atlas.conf import settings
+
+
+SPECS_FOLDER = "specs"
+STATS_FILE = "stats.json"
+ENTRY_EXTENSION = ".pickle"
+
+HITS = "hits"
+MISSES = "misses"
+
+# Hit/Miss counts for current process. Persisted counts (across runs) are available via SpecCache.info()
+stats = Counter()
+
+
+class SpecCache:
+    """
+    Content addressed cache for parsed Specification files.
+
+    Parsing large YAML files in pure python is slow, and every ATLAS command re-parses the swagger.
+    Here, we store the parsed spec as pickle in the OUTPUT folder, keyed on the content hash, size and mtime of file.
+    Any change in spec file results in a new key, so stale entries are never read.
+
+    Sample Usage:
+        cache = SpecCache()
+        spec = cache.load(file_path, converter_name, converter_func)
+    """
+
+    # Bump this if the format of the cached entries change
+    VERSION = 1
+
+    # Every change in spec adds a new entry, so we only keep these many latest entries
+    MAX_ENTRIES = 8
+
+    def __init__(self, cache_folder=None):
+        self.path = cache_folder or os.path.join(
+            utils.get_project_path(), settings.OUTPUT_FOLDER, settings.CACHE_FOLDER, SPECS_FOLDER
+        )
+
+    def get_key(self, content: bytes, file_stat, converter: str) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        return f"{digest}-{file_stat.st_size}-{file_stat.st_mtime_ns}-{converter}-v{self.VERSION}"
+
+    def get_entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key + ENTRY_EXTENSION)
+
+    def read_entry(self, key):
+        """
+        Read the cached entry. Returns None if entry does not exist or is corrupt.
+        """
+
+        try:
+            with open(self.get_entry_path(key), "rb") as cache_stream:
+                return pickle.load(cache_stream)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            # Corrupt or incompatible entry. We would over-write it with fresh one
+            return None
+
+    def write_entry(self, key, data):
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        # Write to temp file first and then move it, so that concurrent readers never see partial entry
+        entry_path = self.get_entry_path(key)
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as cache_stream:
+            pickle.dump(data, cache_stream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, entry_path)
+
+    def load(self, file_path: str, converter: str, converter_func):
+        """
+        Load the spec from cache, and if not there, parse it via converter function and save it in cache
+        :param file_path: Absolute path of specification file
+        :param converter: Name of converter (JSON/YAML). It is part of cache key
+        :param converter_func: Function which parses file stream
+        """
+
+        with open(file_path, "rb") as spec_stream:
+            content = spec_stream.read()
+
+        key = self.get_key(content, os.stat(file_path), converter)
+        data = self.read_entry(key)
+
+        if data is not None:
+            self.record(HITS)
+            return data
+
+        self.record(MISSES)
+        data = converter_func(BytesIO(content))
+
+        self.write_entry(key, data)
+        self.prune()
+        return data
+
+    def prune(self):
+        """
+        Remove the oldest entries, so that cache does not grow with every change in spec
+        """
+        entries = sorted(self.get_entries(), key=os.path.getmtime, reverse=True)
+        for entry in entries[self.MAX_ENTRIES:]:
+            os.remove(entry)
+
+    def read_stats(self) -> dict:
+        try:
+            with open(os.path.join(self.path, STATS_FILE)) as stats_stream:
+                return json.load(stats_stream)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def record(self, event: str):
+        """
+        Record the cache Hit/Miss for this process as well as in persisted stats
+        """
+
+        stats[event] += 1
+
+        persisted = self.read_stats()
+        persisted[event] = persisted.get(event, 0) + 1
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        with open(os.path.join(self.path, STATS_FILE), "w") as stats_stream:
+            json.dump(persisted, stats_stream)
+
+    def get_entries(self) -> list:
+        if not os.path.exists(self.path):
+            return []
+        return [
+            os.path.join(self.path, entry) for entry in os.listdir(self.path) if entry.endswith(ENTRY_EXTENSION)
+        ]
+
+    def info(self) -> dict:
+        entries = self.get_entries()
+        persisted = self.read_stats()
+        return {
+            "entries": len(entries),
+            "size": sum(os.path.getsize(entry) for entry in entries),
+            HITS: persisted.get(HITS, 0),
+            MISSES: persisted.get(MISSES, 0)
+        }
+
+    def clear(self):
+        """
+        Remove all cached entries as well as their stats
+        """
+        for entry in self.get_entries():
+            os.remove(entry)
+
+        stats_file = os.path.join(self.path, STATS_FILE)
+        if os.path.exists(stats_file):
+            os.remove(stats_file)
@@ -1,4 +1,5 @@
 from atlas.modules import constants, utils
+from atlas.modules.helpers import references
 from atlas.conf import settings
 
 
@@ -114,7 +115,7 @@ class Swagger:
                     self.validate_parameters(method_config, url)
 
     def resolve_reference(self, reference_name):
-        return utils.resolve_reference(self.specs, reference_name)
+        return references.resolve(self.specs, reference_name)
 
 
 class Operation:
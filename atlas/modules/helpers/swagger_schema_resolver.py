@@ -1,4 +1,19 @@
+from collections import Counter, namedtuple
+
 from atlas.modules import constants, utils
+from atlas.modules.helpers import references
+
+
+HITS = "hits"
+MISSES = "misses"
+
+# Hit/Miss counts of resolved schema cache for current process
+stats = Counter()
+
+# Resolved schema of a reference, along with what it depends upon:
+#   touched - All references which were checked against visited references, while resolving the schema
+#   visited - References among touched, which were already visited, and so were not expanded
+CachedSchema = namedtuple('CachedSchema', ['schema', 'touched', 'visited'])
 
 
 class SchemaResolver:
@@ -17,6 +32,9 @@ class SchemaResolver:
         # Maintain a list of resolved refs, to avoid cycles
         self.visited_ref = set()
 
+        # References checked against visited refs, while resolving current reference. See resolve_reference
+        self.touched_ref = set()
+
         # If you want to use the property, call resolve_with_read_only_fields as your entry function instead of resolve
         # By default, when resolving schema, we ignore read-only fields, and they are not returned in resolved schema
         self.include_read_only = False
@@ -62,13 +80,53 @@ class SchemaResolver:
         if additional_properties:
             ref = additional_properties.get(constants.REF)
             data_body[constants.ADDITIONAL_PROPERTIES] = (
-                self.resolve(utils.resolve_reference(self.spec, ref))
-                if ref else self.resolve_element_config(additional_properties)
+                self.resolve_reference(ref) if ref else self.resolve_element_config(additional_properties)
             )
             data_body[constants.MIN_PROPERTIES] = config.get(constants.MIN_PROPERTIES, 0)
 
         return data_body
 
+    def resolve_reference(self, ref: str, is_field=False):
+        """
+        Resolve the schema which reference points to.
+
+        Schemas are cached and shared by all resolvers of the spec, so they are returned as immutable objects.
+        Resolved schema of a reference depends upon:
+            - Whether read-only fields are included, and whether it is being resolved as field
+            - Which of the references it encounters are already visited, since those are not expanded (to break cycles)
+        So cached schema is only re-used if the references which were visited when it was cached
+            are the only ones visited now (among the references it encounters).
+        """
+
+        config = references.resolve(self.spec, ref)
+
+        # Top level schema also gets its type, so we do not cache it
+        if self.is_top_level:
+            return self.resolve(config, is_field)
+
+        cache = references.get_resolver(self.spec).schemas
+        key = (ref, self.include_read_only, is_field)
+
+        for cached in cache.get(key, []):
+            if self.visited_ref & cached.touched == cached.visited:
+                stats[HITS] += 1
+                self.touched_ref.update(cached.touched)
+                return cached.schema
+
+        stats[MISSES] += 1
+
+        # Track references touched by this reference separately, and then add them to references touched by parent
+        parent_touched_ref, self.touched_ref = self.touched_ref, set()
+
+        try:
+            schema = utils.freeze(self.resolve(config, is_field))
+            touched = self.touched_ref
+        finally:
+            self.touched_ref = parent_touched_ref.union(self.touched_ref)
+
+        cache.setdefault(key, []).append(CachedSchema(schema, touched, self.visited_ref & touched))
+        return schema
+
     def top_level_changes(self, config, data_body):
         if self.is_top_level:
             data_body[constants.TYPE] = config.get(constants.TYPE, constants.OBJECT)
@@ -129,19 +187,25 @@ class SchemaResolver:
             if ref and not isinstance(ref, str):
                 continue
 
+            if ref:
+                self.touched_ref.add(ref)
+
             if ref and ref not in self.visited_ref:
                 self.visited_ref.add(ref)
-                ref_config = self.resolve(
-                    utils.resolve_reference(self.spec, ref)
-                )
+                ref_config = self.resolve_reference(ref)
                 if item_name == constants.REF:
-                    data_body = ref_config  # This is top-level reference, so replace complete body
+                    # This is top-level reference, so replace complete body
+                    # Resolved schema is immutable, and body could be updated later, so we take its copy
+                    data_body = dict(ref_config)
                 else:
                     # This is field-level reference
                     data_body[item_name] = {constants.TYPE: constants.OBJECT, constants.PROPERTIES: ref_config}
                 self.visited_ref.remove(ref)
                 continue  # We generated the data already, move on to next once
 
+            if item_name == constants.REF:
+                continue    # Top-level reference which is already being resolved. Skip it to break the cycle
+
             # Do not generate data for Read-only fields unless explicitly over-written
             read_only = item_config.get(constants.READ_ONLY, False)
             if read_only and not self.include_read_only:
@@ -1,9 +1,7 @@
 from io import open
 import os
 
-import yaml
-
-from atlas.modules import utils
+from atlas.modules import utils, yaml_io
 from atlas.conf import settings
 
 
@@ -41,7 +39,7 @@ class YAMLReadWriteMixin:
 
         try:
             with open(_file) as file_stream:
-                ret_stream = yaml.safe_load(file_stream)
+                ret_stream = yaml_io.load(file_stream)
         except FileNotFoundError:
             ret_stream = default_value
 
@@ -89,7 +87,7 @@ class YAMLReadWriteMixin:
         if write_data or force_write:
             write_mode = "a" if append_mode else "w"
             with open(_file, write_mode) as file_stream:
-                yaml.dump(write_data, file_stream, default_flow_style=False)
+                yaml_io.dump(write_data, file_stream)
 
     def write_file_to_input(self, *args, **kwargs):
         """
@@ -1,4 +1,5 @@
 from atlas.modules.commands.base import BaseCommand
+from atlas.modules.helpers import pipeline
 from atlas.modules.resource_creator.creators import AutoGenerator
 
 
@@ -7,6 +8,11 @@ class Generate(BaseCommand):
     help = "Auto generate resources from Swagger file and update Res Mapping and Swagger File"
 
     def handle(self, **options):
-        gen = AutoGenerator()
+        context = options.get("context") or pipeline.PipelineContext()
+
+        gen = AutoGenerator(specs=context.input_specs, resource_mapping=context.resource_map)
         gen.parse()
         gen.update()
+
+        context.specs = gen.specs
+        context.resource_map = gen.get_resource_mapping()
@@ -8,7 +8,7 @@ from atlas.modules import (
     utils
 )
 from atlas.modules.resource_data_generator import constants as resource_constants
-from atlas.modules.helpers import resource_map
+from atlas.modules.helpers import references, resource_map
 
 
 class AutoGenerator(mixins.YAMLReadWriteMixin):
@@ -17,14 +17,19 @@ class AutoGenerator(mixins.YAMLReadWriteMixin):
     Auto update Swagger definition and Resource Mapping file
     """
 
-    def __init__(self, swagger_file=None):
+    def __init__(self, swagger_file=None, specs=None, resource_mapping=None):
+        """
+        :param swagger_file: Swagger File Name
+        :param specs: Swagger loaded from INPUT folder. Leave Null to read it from swagger file
+        :param resource_mapping: Contents of Resource Mapping file. Leave Null to read it from file
+        """
         super().__init__()
 
         self.swagger_file = swagger_file or settings.SWAGGER_FILE
-        self.specs = self.read_file_from_input(self.swagger_file, {})
+        self.specs = self.read_file_from_input(self.swagger_file, {}) if specs is None else specs
         self.spec_definitions = self.format_references(self.specs.get(swagger_constants.DEFINITIONS, {}).keys())
 
-        self.resource_map_resolver = resource_map.ResourceMapResolver()
+        self.resource_map_resolver = resource_map.ResourceMapResolver(resource_mapping)
         self.resource_map_resolver.resolve_resources()
 
         self.resource_keys = self.format_references(self.resource_map_resolver.resource_map.keys())
@@ -108,7 +113,7 @@ class AutoGenerator(mixins.YAMLReadWriteMixin):
 
             ref = param.get(swagger_constants.REF)
             if ref:
-                param = utils.resolve_reference(self.specs, ref)
+                param = references.resolve(self.specs, ref)
 
             param_type = param.get(swagger_constants.IN_)
             _name = param.get(swagger_constants.PARAMETER_NAME)
@@ -165,7 +170,7 @@ class AutoGenerator(mixins.YAMLReadWriteMixin):
             print(f"\nWARNING: Only string references supported. Found: {ref}\n")
             return
 
-        ref_config = utils.resolve_reference(self.specs, ref)
+        ref_config = references.resolve(self.specs, ref)
         ref_name = ref.split("/")[-1]
         self.parse_reference(ref_name, ref_config)
 
@@ -236,15 +241,19 @@ class AutoGenerator(mixins.YAMLReadWriteMixin):
         for ref_name, ref_config in self.specs.get(swagger_constants.DEFINITIONS, {}).items():
             self.parse_reference(ref_name, ref_config)
 
+    def get_resource_mapping(self) -> dict:
+        """
+        Resource Mapping with dummy definitions for new resources
+        """
+        auto_resource = {
+            resource: {resource_constants.DUMMY_DEF: "# Add your definition here"} for resource in self.new_resources
+        }
+        return {**self.resource_map_resolver.resource_map, **auto_resource}
+
     def update(self):
 
         # Update Specs File
         self.write_file_to_output(self.swagger_file, self.specs, append_mode=False)
 
         # Update Resource Mapping File
-        auto_resource = {
-            resource: {resource_constants.DUMMY_DEF: "# Add your definition here"} for resource in self.new_resources
-        }
-        self.write_file_to_input(
-            settings.MAPPING_FILE, {**self.resource_map_resolver.resource_map, **auto_resource}, append_mode=False
-        )
+        self.write_file_to_input(settings.MAPPING_FILE, self.get_resource_mapping(), append_mode=False)
@@ -1,10 +1,56 @@
-from atlas.modules.commands.base import BaseCommand
+from atlas.modules.commands.base import BaseCommand, CommandError
+from atlas.modules.commands.utils import add_bool_arg
+from atlas.modules.helpers import pipeline
+from atlas.modules.resource_data_generator import generators, result_cache
 from atlas.modules.resource_data_generator.generators import ProfileResourceDataGenerator
 
 
 class Generate(BaseCommand):
     help = "Fetch Data as per Resource map, and create a cache of resources"
 
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+
+        parser.add_argument(
+            "--jobs", type=int, default=None,
+            help="Number of threads which fetch resources concurrently. Defaults to FETCH_DATA_JOBS setting"
+        )
+        add_bool_arg(
+            parser, "full_refresh",
+            help="Fetch pools of resources with watermark in full, instead of only their rows since last fetch"
+        )
+        add_bool_arg(
+            parser, "refresh",
+            help="Run all resource queries against database, instead of serving their results from cache"
+        )
+
     def handle(self, **options):
-        res_map = ProfileResourceDataGenerator()
+        jobs = options.get("jobs")
+        if jobs is not None and jobs < 1:
+            raise CommandError("Number of jobs should be at least 1")
+
+        context = options.get("context") or pipeline.PipelineContext()
+
+        res_map = ProfileResourceDataGenerator(
+            resource_map=context.resource_map, profile_configs=context.profiles, jobs=jobs,
+            full_refresh=options.get("full_refresh", False), refresh=options.get("refresh", False)
+        )
+        requested = generators.stats[generators.REQUESTED]
+        reused = generators.stats[generators.REUSED]
+        cache_hits = result_cache.stats[result_cache.HITS]
+        cache_misses = result_cache.stats[result_cache.MISSES]
+
         res_map.parse()
+
+        context.set_profile_resources(res_map.profile_resources)
+
+        requested = generators.stats[generators.REQUESTED] - requested
+        reused = generators.stats[generators.REUSED] - reused
+        output = f"Resource queries and scripts: {requested} requested, {requested - reused} run\n"
+
+        cache_hits = result_cache.stats[result_cache.HITS] - cache_hits
+        cache_misses = result_cache.stats[result_cache.MISSES] - cache_misses
+        if cache_hits or cache_misses:
+            output += f"Resource query cache: {cache_hits} served from cache, {cache_misses} from database\n"
+
+        return output
@@ -18,8 +18,26 @@ FILTERS = "filters"
 
 DEFAULT_COLUMN = "id"
 
+# Sampling of rows
+SAMPLE_SIZE = "sample_size"
+STRATEGY = "strategy"
+ORDER_BY = "order_by"
+
+FIRST = "first"             # First rows, in whatever order database returns them
+RANDOM = "random"           # Random rows, ordered randomly by database
+RECENT = "recent"           # Rows with largest values of order_by (column by default)
+RESERVOIR = "reservoir"     # Random rows, sampled by ATLAS while all rows are streamed from server-side cursor
+STRATEGIES = {FIRST, RANDOM, RECENT, RESERVOIR}
+
+# Monotonic column (eg: id, updated_at), by which pool of resource is refreshed incrementally
+WATERMARK = "watermark"
+
+# Seconds for which results of query are served from cache
+CACHE_TTL = "cache_ttl"
+
 DUMMY_DEF = "dummy"
 
+# Default sample size
 LIMIT = 50
 
 # Internal Constants
@@ -1,29 +1,129 @@
+from collections import Counter
 import logging
+import math
+import random
+import threading
+import uuid
+
+from peewee import MySQLDatabase, PostgresqlDatabase
 
 from atlas.conf import settings
 from atlas.modules.resource_data_generator.database import constants, utils
 
+try:
+    from pymysql.cursors import SSCursor
+except ImportError:     # MySQL driver is not installed
+    SSCursor = None
+
 logger = logging.getLogger(__name__)
 
+QUERIES = "queries"
+
+# Number of SQL queries executed by current process
+stats = Counter()
+
+
+def get_random_function() -> str:
+    """
+    SQL Function which orders rows randomly in configured database
+    """
+    return constants.RANDOM_FUNCTION.get(settings.DATABASE[constants.ENGINE], constants.DEFAULT_RANDOM_FUNCTION)
+
 
 class Client:
     """
     A common DB client for all supported databases (Postgres/MySql/SQLite)
+
+    Connections come from a pool, which is created when the first query is executed.
+    Client could be shared by threads. Each thread gets its own connection from pool, and returns it via close()
     """
 
     def __init__(self):
-        self.db = self.connect_to_db()
-        if self.db:
-            self.db.connect(reuse_if_open=True)
+        self._db = None
+        self.lock = threading.Lock()
 
     def __del__(self):
-        if self.db:
-            self.db.close()
+        self.close_all()
+
+    @property
+    def db(self):
+        if self._db is None:
+            with self.lock:
+                if self._db is None:
+                    self._db = self.connect_to_db()
+        return self._db
+
+    def close(self):
+        """
+        Return the connection of current thread to pool
+        """
+        if self._db and not self._db.is_closed():
+            self._db.close()
+
+    def close_all(self):
+        """
+        Close all the connections of pool, including those in use
+        """
+        if self._db:
+            self._db.close_all()
 
     @staticmethod
     def connect_to_db():
-        engine = constants.DATABASE_MAP.get(settings.DATABASE[constants.ENGINE])
-        return engine["engine"](settings.DATABASE[constants.NAME], **engine["args"]) if engine else None
+        database = settings.DATABASE
+        engine = constants.DATABASE_MAP.get(database[constants.ENGINE])
+
+        if not engine:
+            return None
+
+        return engine["engine"](
+            database[constants.NAME],
+            max_connections=database.get(constants.MAX_CONNECTIONS, constants.DEFAULT_MAX_CONNECTIONS),
+            stale_timeout=database.get(constants.STALE_TIMEOUT, constants.DEFAULT_STALE_TIMEOUT),
+            **{arg: database[arg] for arg in engine["args"]},
+            **engine["options"]
+        )
+
+    def get_server_side_cursor(self):
+        """
+        Cursor which keeps the result on server, and sends rows as they are fetched
+        SQLite steps through result as rows are fetched anyway, so its normal cursor is used
+        """
+
+        connection = self.db.connection()
+
+        if isinstance(self.db, PostgresqlDatabase):
+            # Named cursors are server-side cursors in psycopg2
+            return connection.cursor(name=f"atlas_{uuid.uuid4().hex}")
+
+        if isinstance(self.db, MySQLDatabase) and SSCursor:
+            return connection.cursor(SSCursor)
+
+        return connection.cursor()
+
+    def iter_rows(self, sql, batch_size=constants.FETCH_BATCH_SIZE):
+        """
+        Rows of SQL Query in batches, via server-side cursor, so that large results are never loaded at once
+        :param sql: SQL Query
+        :param batch_size: Number of rows fetched from server at once
+        :return: Iterator of lists of rows
+        """
+
+        logger.debug("Streaming Query %s", sql)
+        with self.lock:
+            stats[QUERIES] += 1
+        self.db.connect(reuse_if_open=True)
+
+        # Server-side cursors of Postgres only live within a transaction
+        with self.db.atomic():
+            cursor = self.get_server_side_cursor()
+            try:
+                cursor.execute(sql)
+                rows = cursor.fetchmany(batch_size)
+                while rows:
+                    yield rows
+                    rows = cursor.fetchmany(batch_size)
+            finally:
+                cursor.close()
 
     def execute_sql(self, sql):
         """
@@ -32,6 +132,9 @@ class Client:
         :return: Result Cursor
         """
         logger.debug("Executing Query %s", sql)
+        with self.lock:
+            stats[QUERIES] += 1
+        self.db.connect(reuse_if_open=True)
         return self.db.execute_sql(sql)
 
     def fetch_rows(self, sql, mapper=None, include_headers=False):
@@ -58,7 +161,66 @@ class Client:
         """
 
         if not mapper:
-            # Flatten the list of tuples to single list
-            mapper = utils.flatten_list_of_tuples
+            # Flatten the rows as they are streamed, so that all rows are never held at once
+            ids = []
+            for rows in self.iter_rows(sql):
+                ids.extend(utils.flatten_list_of_tuples(rows))
+            return tuple(ids)
 
         return self.fetch_rows(sql, mapper, include_headers)
+
+    def fetch_sample(self, sql, sample_size, mapper=None):
+        """
+        Uniform random sample of rows of SQL Query, via reservoir sampling over streamed rows.
+        Only sample_size rows (and a batch) are held in memory, however large the result is.
+
+        Rows are sampled by Algorithm L, which works out how many rows to skip before next row enters the sample,
+        instead of drawing a random number for every row
+        :param sql: SQL Query
+        :param sample_size: Number of rows in sample
+        :param mapper: Function to map sampled rows in specific way.
+        :return: Iterable containing sample
+        """
+
+        sample = []
+        generator = random.Random()
+
+        def get_weight():
+            # 1 - random() is never 0, so its log is defined
+            return math.exp(math.log(1 - generator.random()) / sample_size)
+
+        def get_skip():
+            return math.floor(math.log(1 - generator.random()) / math.log(1 - weight))
+
+        weight = 0
+        next_index = 0      # Index of next row (in all rows) which would replace a row in sample
+        seen = 0
+
+        for rows in self.iter_rows(sql):
+            batch_start = seen
+            seen += len(rows)
+
+            if len(sample) < sample_size:
+                sample.extend(rows[:sample_size - len(sample)])
+                if len(sample) < sample_size:
+                    continue
+                weight = get_weight()
+                next_index = sample_size + get_skip()
+
+            while next_index < seen:
+                sample[generator.randrange(sample_size)] = rows[next_index - batch_start]
+                weight *= get_weight()
+                next_index += get_skip() + 1
+
+        if mapper and callable(mapper):
+            return mapper(sample)
+        return sample
+
+    def fetch_sample_ids(self, sql, sample_size, mapper=None):
+        """
+        :param sql: SQL Query
+        :param sample_size: Number of rows in sample
+        :param mapper: Function to map sampled rows in specific way.
+        :return: Tuple containing sampled values
+        """
+        return self.fetch_sample(sql, sample_size, mapper or utils.flatten_list_of_tuples)
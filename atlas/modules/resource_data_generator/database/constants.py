@@ -1,6 +1,4 @@
-from peewee import MySQLDatabase, PostgresqlDatabase, SqliteDatabase
-
-from atlas.conf import settings
+from playhouse.pool import PooledMySQLDatabase, PooledPostgresqlDatabase, PooledSqliteDatabase
 
 
 # Settings constants
@@ -10,6 +8,8 @@ HOST = "host"
 PASSWORD = "password"
 PORT = "port"
 USER = "user"
+MAX_CONNECTIONS = "max_connections"
+STALE_TIMEOUT = "stale_timeout"
 
 
 # Engine Constants
@@ -18,28 +18,36 @@ SQLITE = "sqlite"
 MYSQL = "mysql"
 
 
-# Engine mappings
+# Pool defaults, if they are not in DATABASE settings
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_STALE_TIMEOUT = 300
+
+
+# Number of rows which are fetched at once from server-side cursors
+FETCH_BATCH_SIZE = 10000
+
+# SQL Function for random order in each engine. Postgres and SQLite use random()
+RANDOM_FUNCTION = {MYSQL: "rand()"}
+DEFAULT_RANDOM_FUNCTION = "random()"
+
+
+# Engine mappings, with DATABASE settings which are passed to engine apart from name, and fixed options
+# Settings are read when client connects, so that user settings are respected
 DATABASE_MAP = {
     POSTGRES: {
-        "engine": PostgresqlDatabase,
-        "args": {
-            "user": settings.DATABASE[USER],
-            "password": settings.DATABASE[PASSWORD],
-            "host": settings.DATABASE[HOST],
-            "port": settings.DATABASE[PORT]
-        }
+        "engine": PooledPostgresqlDatabase,
+        "args": (USER, PASSWORD, HOST, PORT),
+        "options": {}
     },
     SQLITE: {
-        "engine": SqliteDatabase,
-        "args": {}
+        "engine": PooledSqliteDatabase,
+        "args": (),
+        # Pooled connections are handed over from one thread to another
+        "options": {"check_same_thread": False}
     },
-    MySQLDatabase: {
-        "engine": MySQLDatabase,
-        "args": {
-            "user": settings.DATABASE[USER],
-            "password": settings.DATABASE[PASSWORD],
-            "host": settings.DATABASE[HOST],
-            "port": settings.DATABASE[PORT]
-        }
+    MYSQL: {
+        "engine": PooledMySQLDatabase,
+        "args": (USER, PASSWORD, HOST, PORT),
+        "options": {}
     }
 }
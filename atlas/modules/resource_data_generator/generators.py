@@ -1,13 +1,25 @@
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
 import importlib
 import os
+import queue
+import threading
 
-from atlas.modules import exceptions, mixins
+from atlas.modules import exceptions, mixins, resource_pool
 from atlas.modules.helpers.resource_map import ResourceMapResolver
-from atlas.modules.resource_data_generator import constants as resource_constants
+from atlas.modules.resource_data_generator import constants as resource_constants, result_cache, watermarks
 from atlas.modules.resource_data_generator.database import client as db_client
 from atlas.conf import settings
 
 
+REQUESTED = "requested"
+REUSED = "reused"
+
+# Number of SQL queries and scripts requested for resources, and number of them which re-used an earlier result
+stats = Counter()
+
+
 class ProfileResourceDataGenerator(mixins.ProfileMixin):
     """
     1. Reads Resource Mapping file
@@ -15,15 +27,46 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
     3. Create a separate output file for each Profile, and save data for all resources there
     """
 
-    def __init__(self, profiles=None):
+    def __init__(
+            self, profiles=None, resource_map=None, profile_configs=None, jobs=None, full_refresh=False, refresh=False
+    ):
+        """
+        :param profiles: Names of profiles for which data should be fetched. Leave Null to fetch for all profiles
+        :param resource_map: Contents of Resource Mapping file. Leave Null to read it from file
+        :param profile_configs: Contents of Profiles file. Leave Null to read it from file
+        :param jobs: Number of threads which fetch resources concurrently. Defaults to FETCH_DATA_JOBS
+        :param full_refresh: Fetch pools of resources with watermark in full, instead of only their new rows
+        :param refresh: Run all queries against database, instead of serving their results from cache
+        """
 
         super().__init__()
-        self.resource_map_resolver = ResourceMapResolver()
+        self.resource_map_resolver = ResourceMapResolver(resource_map)
+
+        # Client connects on first query, so that no connection is made if no resource needs database
         self.client = db_client.Client()
 
+        self.jobs = jobs or settings.FETCH_DATA_JOBS
+
+        # Results of SQL queries and scripts, keyed on what they run, so that they are run once for all profiles
+        self.deduplicate = settings.FETCH_DATA_DEDUPLICATE
+        self.fetched = {}
+        self.lock = threading.Lock()
+
+        # Last watermarks of resources which are refreshed incrementally
+        self.watermarks = watermarks.WatermarkStore()
+        self.full_refresh = full_refresh
+
+        # Results of queries of earlier runs, which are served till their TTL
+        self.result_cache = result_cache.ResultCache(refresh=refresh)
+
         self.profiles = profiles or []
+        self.profile_configs = profile_configs
+        self.active_profile = None
         self.active_profile_config = None
 
+        # Resources written for each profile, keyed on profile name
+        self.profile_resources = {}
+
     def read_for_profile(self, resources):
         """
         Get all resource data for specific Profile
@@ -34,7 +77,19 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
                 For all resources which could not be updated at run time, add them in settings
         """
 
+        items = self.get_resources_to_fetch(resources)
+
+        for (resource, _), result in zip(items, self.fetch_resources(items)):
+            resources[resource] = set(result)
+
+    def get_resources_to_fetch(self, resources) -> list:
+        """
+        Resources (and their configuration) whose data needs to be fetched, in the order of Resource Mapping.
+        Resources which could not be updated at run time are added in settings
+        """
+
         not_run_time_update_resources = set()
+        items = []
 
         for resource, config in self.resource_map_resolver.resource_map.items():
             # We have already constructed this resource, so ignore this and move
@@ -54,9 +109,80 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
             if not update_at_run_time:
                 not_run_time_update_resources.add(resource)
 
-            resources[resource] = set(self.parse_for_resource(resource, config))
+            items.append((resource, config))
 
         setattr(settings, "NOT_UPDATE_RUN_TIME_RESOURCES", not_run_time_update_resources)
+        return items
+
+    def fetch_resources(self, items: list) -> list:
+        """
+        Data of each (resource, config) item, in the same order as items, so that output does not depend on scheduling.
+
+        With more than one job, items are fetched by a bounded pool of threads.
+        Threads share the DB client. Each of them gets its own connection from DB pool, and returns it once there is no
+        work left, so that threads for next profile could re-use it
+        """
+
+        if self.jobs <= 1 or len(items) <= 1:
+            return [self.parse_for_resource(resource, config) for resource, config in items]
+
+        results = [None] * len(items)
+        pending = queue.SimpleQueue()
+        for item in enumerate(items):
+            pending.put(item)
+
+        def work():
+            try:
+                while True:
+                    try:
+                        idx, (resource, config) = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    results[idx] = self.parse_for_resource(resource, config)
+            finally:
+                self.client.close()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            workers = [executor.submit(work) for _ in range(min(self.jobs, len(items)))]
+
+        for worker in workers:
+            worker.result()     # Raise error, if any worker failed
+
+        return results
+
+    def fetch_once(self, key: tuple, fetch):
+        """
+        Result of fetch(), which is run once for each key across all profiles.
+        If the key is being fetched by another thread, wait for its result instead of running it again
+        """
+
+        with self.lock:
+            stats[REQUESTED] += 1
+
+            if not self.deduplicate:
+                future = None
+                owner = True
+            else:
+                future = self.fetched.get(key)
+                owner = future is None
+                if owner:
+                    future = self.fetched[key] = Future()
+                else:
+                    stats[REUSED] += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as exc:
+            if future:
+                future.set_exception(exc)
+            raise
+
+        if future:
+            future.set_result(result)
+        return result
 
     def parse_for_resource(self, resource: str, config: dict):
         """
@@ -73,7 +199,9 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
         else:
             source = config.get(resource_constants.SOURCE, resource_constants.DB_TABLE)
 
-            if source == resource_constants.DB_TABLE:
+            if source == resource_constants.DB_TABLE and config.get(resource_constants.WATERMARK):
+                result = self.parse_incremental_source(resource, config, self.resource_map_resolver.globals)
+            elif source == resource_constants.DB_TABLE:
                 result = self.parse_db_source(config, self.resource_map_resolver.globals)
             elif source == resource_constants.SCRIPT:
                 result = self.parse_python_source(config)
@@ -95,35 +223,203 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
         self.resource_map_resolver.resolve_resources()
         resource_sub_folder = os.path.join(settings.OUTPUT_FOLDER, settings.RESOURCES_FOLDER)
 
-        for name, config in self.get_profiles().items():
-            resources = {}
-            self.active_profile_config = config
-            self.read_for_profile(resources)
-            resource_file_name = self.get_profile_resource_name(name, config)
+        try:
+            for name, config in self.get_profiles().items():
+                resources = {}
+                self.active_profile = name
+                self.active_profile_config = config
+                self.read_for_profile(resources)
+                resource_file_name = self.get_profile_resource_name(name, config)
+
+                existing_resources = self.read_resources(resource_file_name, resource_sub_folder)
+                # We want to over-write existing resource with resources
+                resources = {**existing_resources, **resources}
+
+                self.write_resources(resource_file_name, resources, resource_sub_folder)
+                self.profile_resources[name] = resources
+
+                # Watermarks are saved only once resources are, so that they never get ahead of resource file
+                self.watermarks.save()
+        finally:
+            self.client.close_all()
+            self.result_cache.close()
+
+    def read_resources(self, file_name, project_sub_folder) -> dict:
+        """
+        Resources written for Profile by earlier fetch. Empty, if there are none
+        """
+
+        try:
+            return resource_pool.read_profile_resources(self.get_project_folder(project_sub_folder), file_name)
+        except FileNotFoundError:
+            return {}
+
+    def write_resources(self, file_name, resources, project_sub_folder):
+        """
+        Write resources in pool file, and also in YAML file if it is enabled
+        """
 
-            existing_resources = self.read_file(resource_file_name, {}, resource_sub_folder)
-            resources = {**existing_resources, **resources}     # We want to over-write existing resource with resources
+        folder = self.get_project_folder(project_sub_folder)
+        resource_pool.dump(resources, os.path.join(folder, resource_pool.get_pool_file_name(file_name)))
 
-            self.write_file(resource_file_name, resources, resource_sub_folder, False, force_write=True)
+        if settings.RESOURCES_YAML_EXPORT:
+            self.write_file(file_name, resources, project_sub_folder, False, force_write=True)
 
     @staticmethod
-    def construct_fetch_query(table, column, filters):
+    def get_sample_statement(strategy, sample_size, order_by) -> str:
+        """
+        Statement which samples rows of a query as per strategy.
+        Reservoir sampling is done by ATLAS over all the rows, so it needs none
+        """
+
+        if strategy == resource_constants.RESERVOIR:
+            return ""
+
+        order_statement = ""
+        if strategy == resource_constants.RANDOM:
+            order_statement = f"order by {db_client.get_random_function()} "
+        elif strategy == resource_constants.RECENT:
+            order_statement = f"order by {order_by} desc "
+
+        return f"{order_statement}limit {sample_size}"
+
+    def construct_fetch_query(
+            self, table, column, filters, strategy=resource_constants.FIRST, sample_size=resource_constants.LIMIT,
+            order_by=None
+    ):
         """
         Construct a simple SQL Fetch Query
         """
         select_statement = f"select {column} from {table}"
         filter_statement = f"where {filters}" if filters else ""
-        limit_statement = f"limit {resource_constants.LIMIT}"
+        sample_statement = self.get_sample_statement(strategy, sample_size, order_by or column)
+
+        return " ".join(
+            statement for statement in [select_statement, filter_statement, sample_statement] if statement
+        ) + ";"
+
+    def construct_sample_query(self, sql, strategy, sample_size, order_by):
+        """
+        Sample the rows of raw SQL, by wrapping it as sub-query
+        """
+
+        if strategy == resource_constants.RECENT and not order_by:
+            raise exceptions.ResourcesException(f"{resource_constants.ORDER_BY} must be defined to sample {sql}")
+
+        sql = sql.strip().rstrip(";")
+        return f"select * from ({sql}) as sample {self.get_sample_statement(strategy, sample_size, order_by)};"
+
+    def construct_watermark_query(self, table, column, watermark, filters, pool_size, last_watermark=None):
+        """
+        Query for newest rows by watermark, with their watermarks.
+        If last watermark is given, only rows newer than it are fetched
+        """
+
+        conditions = [filters] if filters else []
+        if last_watermark is not None:
+            # Query is formatted with Profile later, so braces in watermark value are escaped
+            literal = watermarks.to_sql_literal(last_watermark).replace("{", "{{").replace("}", "}}")
+            conditions.append(f"{watermark} > {literal}")
+
+        if len(conditions) > 1:
+            conditions = [f"({condition})" for condition in conditions]
+
+        filter_statement = " and ".join(conditions)
+        return self.construct_fetch_query(
+            table, f"{column}, {watermark}", filter_statement, resource_constants.RECENT, pool_size, watermark
+        )
+
+    def parse_incremental_source(self, resource, config, global_settings):
+        """
+        Pool of resource, refreshed incrementally via its watermark column.
+
+        First fetch gets the newest rows of pool. Subsequent fetches only get the rows newer than last watermark,
+        which are added to front of pool. Once pool is full, oldest IDs are dropped.
+        Pool is fetched in full again if its query changes, or for full refresh
+        """
+
+        for option in [resource_constants.SQL, resource_constants.MAPPER, resource_constants.STRATEGY]:
+            if config.get(option):
+                raise exceptions.ResourcesException(
+                    f"{option} can not be defined with {resource_constants.WATERMARK} for {resource}"
+                )
+
+        table = config.get(resource_constants.TABLE, global_settings.get(resource_constants.TABLE))
+        if not table:
+            raise exceptions.ResourcesException(f"Table not defined for {config}")
+
+        watermark = config[resource_constants.WATERMARK]
+        column = config.get(resource_constants.COLUMN, resource_constants.DEFAULT_COLUMN)
+        filters = config.get(resource_constants.FILTERS, global_settings.get(resource_constants.FILTERS))
+        pool_size = self.get_sampling(config, global_settings)[1] or resource_constants.LIMIT
 
-        return f"{select_statement} {filter_statement} {limit_statement};"
+        query = self.construct_watermark_query(table, column, watermark, filters, pool_size)
+        query = query.format(**self.active_profile_config)
+        state = None if self.full_refresh else self.watermarks.get(self.active_profile, resource, query)
+
+        if state and state.get("watermark") is not None:
+            last_watermark, pool = state["watermark"], state.get("pool") or []
+            sql = self.construct_watermark_query(table, column, watermark, filters, pool_size, last_watermark)
+            sql = sql.format(**self.active_profile_config)
+        else:
+            last_watermark, pool, sql = None, [], query
+
+        key = (resource_constants.DB_TABLE, "watermark_rows", sql, None)
+        rows = self.fetch_once(key, functools.partial(self.client.fetch_rows, sql=sql, mapper=None))
+
+        # Rows are newest first. IDs which were updated since last fetch move to front of pool
+        pool = list(dict.fromkeys([row[0] for row in rows] + pool))[:pool_size]
+        last_watermark = rows[0][1] if rows else last_watermark
+
+        with self.lock:
+            self.watermarks.set(self.active_profile, resource, query, last_watermark, pool)
+
+        return pool
+
+    @staticmethod
+    def get_sampling(config, global_settings) -> tuple:
+        """
+        Sampling Strategy and Sample size of resource. None, if they are not configured
+        """
+
+        strategy = config.get(resource_constants.STRATEGY, global_settings.get(resource_constants.STRATEGY))
+        sample_size = config.get(resource_constants.SAMPLE_SIZE, global_settings.get(resource_constants.SAMPLE_SIZE))
+
+        if strategy is not None and strategy not in resource_constants.STRATEGIES:
+            valid_strategies = ", ".join(sorted(resource_constants.STRATEGIES))
+            raise exceptions.ResourcesException(
+                f"Invalid sampling strategy {strategy} for {config}. Valid strategies are: {valid_strategies}"
+            )
+
+        if sample_size is not None and (type(sample_size) is not int or sample_size < 1):
+            raise exceptions.ResourcesException(f"Sample size must be positive integer for {config}")
+
+        return strategy, sample_size
+
+    @staticmethod
+    def get_cache_ttl(config, global_settings):
+        """
+        Seconds for which results of resource are served from cache. 0, if they are not cached
+        """
+
+        ttl = config.get(
+            resource_constants.CACHE_TTL,
+            global_settings.get(resource_constants.CACHE_TTL, settings.FETCH_DATA_CACHE_TTL)
+        )
+
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+            raise exceptions.ResourcesException(f"Cache TTL must be non-negative number of seconds for {config}")
+
+        return ttl
 
     def parse_db_source(self, config, global_settings):
 
         # First check if raw SQL is provided
         sql = config.get(resource_constants.SQL)
         mapper = config.get(resource_constants.MAPPER, global_settings.get(resource_constants.MAPPER))
+        strategy, sample_size = self.get_sampling(config, global_settings)
 
-        client_func = self.client.fetch_rows
+        fetch_type, client_func = "rows", self.client.fetch_rows
 
         func = None
         if mapper:
@@ -132,10 +428,30 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
         if not sql:
             # If Raw SQL is not provided, then we need to construct query
             sql = self.construct_query(config, global_settings)
-            client_func = self.client.fetch_ids
+            fetch_type, client_func = "ids", self.client.fetch_ids
+        elif (strategy or sample_size) and strategy != resource_constants.RESERVOIR:
+            # Raw SQL is used as it is, unless sampling is configured. Reservoir samples the rows of raw SQL itself
+            sql = self.construct_sample_query(
+                sql, strategy or resource_constants.FIRST, sample_size or resource_constants.LIMIT,
+                config.get(resource_constants.ORDER_BY, global_settings.get(resource_constants.ORDER_BY))
+            )
+
+        if strategy == resource_constants.RESERVOIR:
+            sample_func = self.client.fetch_sample_ids if fetch_type == "ids" else self.client.fetch_sample
+            fetch_type = f"{fetch_type}_sample_{sample_size or resource_constants.LIMIT}"
+            client_func = functools.partial(sample_func, sample_size=sample_size or resource_constants.LIMIT)
 
         # Query should be formatted according to Profile configuration
-        return client_func(sql=sql.format(**self.active_profile_config), mapper=func)
+        # Most queries do not refer to Profile configuration, and are same for all profiles, so they are run once
+        sql = sql.format(**self.active_profile_config)
+        key = (resource_constants.DB_TABLE, fetch_type, sql, mapper)
+        fetch = functools.partial(client_func, sql=sql, mapper=func)
+
+        ttl = self.get_cache_ttl(config, global_settings)
+        if ttl:
+            fetch = functools.partial(self.result_cache.fetch, [fetch_type, sql, mapper], ttl, fetch)
+
+        return self.fetch_once(key, fetch)
 
     def construct_query(self, config, global_settings):
         table = config.get(resource_constants.TABLE, global_settings.get(resource_constants.TABLE))
@@ -145,8 +461,12 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
 
         column = config.get(resource_constants.COLUMN, resource_constants.DEFAULT_COLUMN)
         filters = config.get(resource_constants.FILTERS, global_settings.get(resource_constants.FILTERS))
+        strategy, sample_size = self.get_sampling(config, global_settings)
 
-        return self.construct_fetch_query(table, column, filters)
+        return self.construct_fetch_query(
+            table, column, filters, strategy or resource_constants.FIRST, sample_size or resource_constants.LIMIT,
+            config.get(resource_constants.ORDER_BY, global_settings.get(resource_constants.ORDER_BY))
+        )
 
     @staticmethod
     def get_function_from_mapping_file(func_name):
@@ -178,10 +498,15 @@ class ProfileResourceDataGenerator(mixins.ProfileMixin):
         if not isinstance(kwargs, dict):
             raise exceptions.ResourcesException(f"Function {func_name} Keyword Args should be dict")
 
-        return func(*args, **kwargs)
+        # Scripts with same arguments are run once for all profiles
+        key = (resource_constants.SCRIPT, func_name, repr(args), repr(sorted(kwargs.items())))
+
+        return self.fetch_once(key, functools.partial(func, *args, **kwargs))
 
     def get_profiles(self):
-        profiles = self.read_file_from_input(settings.PROFILES_FILE, {})
+        profiles = self.profile_configs
+        if profiles is None:
+            profiles = self.read_file_from_input(settings.PROFILES_FILE, {})
 
         if self.profiles:
             profile_to_read = set(self.profiles)
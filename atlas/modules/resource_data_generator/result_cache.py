@@ -0,0 +1,135 @@
+from collections import Counter
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from atlas.conf import settings
+from atlas.modules import utils
+from atlas.modules.resource_data_generator.database import constants as db_constants
+
+
+RESULTS_FOLDER = "resources"
+RESULTS_FILE = "results.sqlite"
+
+# Parts of DATABASE settings, which identify the database whose results are cached
+DATABASE_IDENTITY = (db_constants.ENGINE, db_constants.HOST, db_constants.PORT, db_constants.NAME, db_constants.USER)
+
+HITS = "hits"
+MISSES = "misses"
+
+# Hit/Miss counts for current process
+stats = Counter()
+
+
+def get_database_identity() -> list:
+    return [settings.DATABASE.get(name) for name in DATABASE_IDENTITY]
+
+
+class ResultCache:
+    """
+    On-disk cache of results of resource queries, in a SQLite file in OUTPUT folder.
+
+    Results are keyed on database identity (engine, host, port, name and user), the query (after it is formatted with
+    Profile), the type of fetch and the name of mapper. Each result is served till its TTL, which is given when it is
+    read, so that change in TTL of resource applies to results already in cache.
+
+    Cache could be shared by threads. Connection is opened on first use, so that no file is created if no resource
+    is cached.
+
+    Sample Usage:
+        cache = ResultCache()
+        result = cache.fetch(key_parts, ttl, fetch)
+        cache.close()
+    """
+
+    # Bump this if the format of cached results change
+    VERSION = 1
+
+    def __init__(self, path=None, refresh=False):
+        """
+        :param path: Path of SQLite file. Defaults to file in OUTPUT folder
+        :param refresh: Do not serve results from cache. Fresh results are still saved in it
+        """
+
+        self.path = path or os.path.join(
+            utils.get_project_path(), settings.OUTPUT_FOLDER, settings.CACHE_FOLDER, RESULTS_FOLDER, RESULTS_FILE
+        )
+        self.refresh = refresh
+
+        self._connection = None
+        self.lock = threading.Lock()
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            folder = os.path.dirname(self.path)
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+
+            # Connection is only used under lock, so threads can share it
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "create table if not exists results (key text primary key, fetched_at real, result blob)"
+            )
+        return self._connection
+
+    def get_key(self, key_parts) -> str:
+        content = json.dumps([self.VERSION, get_database_identity(), key_parts], default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, ttl: float):
+        """
+        Cached result, if it was fetched within TTL seconds. Else None
+        """
+
+        with self.lock:
+            row = self.connection.execute("select fetched_at, result from results where key = ?", (key, )).fetchone()
+
+        if not row or row[0] + ttl < time.time():
+            return None
+
+        try:
+            return pickle.loads(row[1])
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            # Corrupt or incompatible entry. We would over-write it with fresh one
+            return None
+
+    def set(self, key: str, result):
+        content = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self.lock:
+            with self.connection:
+                self.connection.execute(
+                    "insert or replace into results (key, fetched_at, result) values (?, ?, ?)",
+                    (key, time.time(), content)
+                )
+
+    def fetch(self, key_parts, ttl: float, fetch):
+        """
+        Result of fetch(), served from cache if it was fetched within TTL seconds
+        :param key_parts: JSON serializable parts of key, which identify the result in database
+        :param ttl: Seconds for which result is served from cache
+        :param fetch: Function which fetches the result
+        """
+
+        key = self.get_key(key_parts)
+        result = None if self.refresh else self.get(key, ttl)
+
+        with self.lock:
+            stats[MISSES if result is None else HITS] += 1
+
+        if result is not None:
+            return result
+
+        result = fetch()
+        self.set(key, result)
+        return result
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,102 @@
+from io import open
+import json
+import os
+
+from atlas.conf import settings
+from atlas.modules import utils
+
+
+WATERMARKS_FOLDER = "resources"
+WATERMARKS_FILE = "watermarks.json"
+
+
+def to_sql_literal(value) -> str:
+    """
+    Watermark as SQL literal. Numbers are used as they are, everything else (eg: timestamps) is quoted
+    """
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+
+    value = str(value).replace("'", "''")
+    return f"'{value}'"
+
+
+class WatermarkStore:
+    """
+    Stores the state of incrementally refreshed resources for each profile:
+        - query: Query of resource without its watermark condition. If it changes, pool is fetched again in full
+        - watermark: Largest value of watermark column in pool
+        - pool: IDs in pool, with the newest first, so that oldest are dropped first when pool is full
+
+    Sample Usage:
+        store = WatermarkStore()
+        state = store.get(profile, resource, query)
+        ...
+        store.set(profile, resource, query, watermark, pool)
+        store.save()
+    """
+
+    # Bump this if the format of store changes
+    VERSION = 1
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(
+            utils.get_project_path(), settings.OUTPUT_FOLDER, settings.CACHE_FOLDER, WATERMARKS_FOLDER,
+            WATERMARKS_FILE
+        )
+
+        self._profiles = None
+        self.changed = False
+
+    @property
+    def profiles(self) -> dict:
+        if self._profiles is None:
+            self._profiles = self.read()
+        return self._profiles
+
+    def read(self) -> dict:
+        try:
+            with open(self.path) as watermark_stream:
+                data = json.load(watermark_stream)
+        except (FileNotFoundError, ValueError):
+            # Missing or corrupt store. All incremental resources would be fetched in full
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+
+        return data.get("profiles") or {}
+
+    def get(self, profile: str, resource: str, query: str):
+        """
+        State of resource for profile, if it was last fetched with same query. Else None
+        """
+
+        state = self.profiles.get(profile, {}).get(resource)
+        if not state or state.get("query") != query:
+            return None
+        return state
+
+    def set(self, profile: str, resource: str, query: str, watermark, pool: list):
+        # JSON can not store values like timestamps, which are compared as strings in SQL anyway
+        if not isinstance(watermark, (int, float, str, type(None))):
+            watermark = str(watermark)
+
+        self.profiles.setdefault(profile, {})[resource] = {"query": query, "watermark": watermark, "pool": pool}
+        self.changed = True
+
+    def save(self):
+        if not self.changed:
+            return
+
+        folder = os.path.dirname(self.path)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        # Write to temp file first and then move it, so that an interrupted write never corrupts the store
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as watermark_stream:
+            json.dump({"version": self.VERSION, "profiles": self.profiles}, watermark_stream, default=str)
+        os.replace(temp_path, self.path)
+        self.changed = False
@@ -0,0 +1,205 @@
+"""
+Compact binary format for pools of resources, which is much quicker to read and write than YAML.
+
+Each pool is stored as a typed column. All numbers are little-endian:
+    Header: b"ATRP", version (uint32), number of pools (uint32)
+    Each pool: key length (uint32), key (UTF-8), type (uint8), number of values (uint32), values
+        INT32/INT64/FLOAT64: Values in the type
+        STRING: Byte length of each value (uint32), followed by all values (UTF-8)
+        JSON: Byte length (uint32), followed by values as JSON array (UTF-8). This is for pools of mixed values.
+            Values must be strings, numbers, booleans or None, so that they are read back as they were written
+
+Artillery runtime reads the same format (see data_provider/artillery/resourcePool.js)
+"""
+
+from array import array
+from io import open
+import json
+import os
+import struct
+import sys
+
+from atlas.modules import yaml_io
+
+
+MAGIC = b"ATRP"
+VERSION = 1
+EXTENSION = ".pool"
+
+INT32 = 1
+INT64 = 2
+FLOAT64 = 3
+STRING = 4
+JSON = 5
+
+# Array type codes of numeric types. "i" and "q" are 4 and 8 bytes on all platforms which ATLAS supports
+ARRAY_TYPES = {INT32: "i", INT64: "q", FLOAT64: "d"}
+
+UINT32 = struct.Struct("<I")
+POOL_HEADER = struct.Struct("<BI")
+
+# Types of values which could be stored in pools
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+INT32_RANGE = (-2 ** 31, 2 ** 31 - 1)
+INT64_RANGE = (-2 ** 63, 2 ** 63 - 1)
+
+
+def get_pool_file_name(resource_file_name: str) -> str:
+    return os.path.splitext(resource_file_name)[0] + EXTENSION
+
+
+def get_type(values: list) -> int:
+    """
+    Narrowest type which could store all the values
+    """
+
+    value_types = {type(value) for value in values}
+
+    if not value_types or value_types == {int}:
+        low, high = (min(values), max(values)) if values else (0, 0)
+        if INT32_RANGE[0] <= low and high <= INT32_RANGE[1]:
+            return INT32
+        if INT64_RANGE[0] <= low and high <= INT64_RANGE[1]:
+            return INT64
+    elif value_types == {float}:
+        return FLOAT64
+    elif value_types == {str}:
+        return STRING
+
+    return JSON
+
+
+def to_little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def dumps(pools: dict) -> bytes:
+    """
+    :param pools: Values of each pool (as iterable), keyed on name of pool
+    """
+
+    parts = [MAGIC, UINT32.pack(VERSION), UINT32.pack(len(pools))]
+
+    for key, values in pools.items():
+        values = list(values or [])
+        value_type = get_type(values)
+        key = key.encode("utf-8")
+
+        parts.extend([UINT32.pack(len(key)), key, POOL_HEADER.pack(value_type, len(values))])
+
+        if value_type in ARRAY_TYPES:
+            parts.append(to_little_endian(array(ARRAY_TYPES[value_type], values)))
+        elif value_type == STRING:
+            encoded = [value.encode("utf-8") for value in values]
+            parts.append(to_little_endian(array("I", [len(value) for value in encoded])))
+            parts.extend(encoded)
+        else:
+            for value in values:
+                if not isinstance(value, SCALAR_TYPES):
+                    raise ValueError(
+                        f"Resource pool {key.decode('utf-8')} has {value!r} of type {type(value).__name__}. "
+                        f"Pools could only have strings, numbers, booleans and None"
+                    )
+            content = json.dumps(values).encode("utf-8")
+            parts.extend([UINT32.pack(len(content)), content])
+
+    return b"".join(parts)
+
+
+def read_array(content: bytes, offset: int, type_code: str, count: int) -> tuple:
+    values = array(type_code)
+    end = offset + values.itemsize * count
+    if end > len(content):
+        raise ValueError("Truncated resource pool file")
+
+    values.frombytes(content[offset:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, end
+
+
+def loads(content: bytes) -> dict:
+    """
+    Pools keyed on their name, with values of each pool as set
+    """
+
+    if len(content) < len(MAGIC) + 2 * UINT32.size or content[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a resource pool file")
+
+    version, count = struct.unpack_from("<II", content, len(MAGIC))
+    if version != VERSION:
+        raise ValueError(f"Unsupported resource pool version {version}")
+
+    offset = len(MAGIC) + 2 * UINT32.size
+    pools = {}
+
+    try:
+        for _ in range(count):
+            (key_length, ) = UINT32.unpack_from(content, offset)
+            offset += UINT32.size
+            key = content[offset:offset + key_length].decode("utf-8")
+            offset += key_length
+
+            value_type, value_count = POOL_HEADER.unpack_from(content, offset)
+            offset += POOL_HEADER.size
+
+            if value_type in ARRAY_TYPES:
+                values, offset = read_array(content, offset, ARRAY_TYPES[value_type], value_count)
+            elif value_type == STRING:
+                lengths, offset = read_array(content, offset, "I", value_count)
+                values = []
+                for length in lengths:
+                    values.append(content[offset:offset + length].decode("utf-8"))
+                    offset += length
+            elif value_type == JSON:
+                (length, ) = UINT32.unpack_from(content, offset)
+                offset += UINT32.size
+                values = json.loads(content[offset:offset + length].decode("utf-8"))
+                offset += length
+            else:
+                raise ValueError(f"Unknown type {value_type} of resource pool {key}")
+
+            pools[key] = set(values)
+    except struct.error:
+        raise ValueError("Truncated resource pool file")
+
+    if offset != len(content):
+        raise ValueError("Corrupt resource pool file")
+
+    return pools
+
+
+def dump(pools: dict, path: str):
+
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+
+    # Write to temp file first and then move it, so that readers never see partial pools
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as pool_stream:
+        pool_stream.write(dumps(pools))
+    os.replace(temp_path, path)
+
+
+def load(path: str) -> dict:
+    with open(path, "rb") as pool_stream:
+        return loads(pool_stream.read())
+
+
+def read_profile_resources(folder: str, resource_file_name: str) -> dict:
+    """
+    Resources of Profile from its pool file, or from its YAML resource file, for builds before pool files
+    :raises FileNotFoundError: If neither of them exists
+    """
+
+    try:
+        return load(os.path.join(folder, get_pool_file_name(resource_file_name)))
+    except FileNotFoundError:
+        pass
+
+    with open(os.path.join(folder, resource_file_name)) as yaml_stream:
+        return yaml_io.load(yaml_stream) or {}
@@ -1,5 +1,4 @@
 from collections import defaultdict
-from copy import deepcopy
 import json
 import re
 
@@ -42,6 +41,10 @@ class Task(models.Task):
 
         self.yaml_task = {}
 
+        # Processor functions from last conversion, and the width they were converted with
+        self.statements = []
+        self.width = None
+
     @property
     def tag_check(self) -> bool:
         """
@@ -139,16 +142,23 @@ class Task(models.Task):
             body: Body consists of list of JS statements for BEFORE_REQUEST statement
         """
 
-        body = ["const provider = context.vars['provider'];"]
+        # Requests of an Artillery "parallel" step share context, so each request gets its own provider and state
+        # State is kept against requestParams, which is the same object in BEFORE_REQUEST and AFTER_RESPONSE
+        body = [
+            "const provider = new Provider(context.vars['provider'].profile);",
+            "const requestState = {provider: provider};",
+            "requestStates.set(requestParams, requestState);",
+        ]
 
         if self.data_body:
             body.append(f"const bodyConfig = {json.dumps(self.data_body)};")
 
         body.append(f"let url = '{self.open_api_op.url}';")
-        body.append(f"context.vars._rawURL = url;")
+        body.append("requestState.rawURL = url;")
 
         if self.open_api_op.dependent_resources:
-            body.append(f"provider.getRelatedResources({list(self.open_api_op.dependent_resources)});")
+            # Sorted, since order of set differs across processes
+            body.append(f"provider.getRelatedResources({sorted(self.open_api_op.dependent_resources)});")
 
         body = self.add_url_config_to_body(body)
 
@@ -187,15 +197,15 @@ class Task(models.Task):
         body.append("requestParams.url = reqArgs[0];")
         body.append(f"requestParams.headers = reqArgs[{len(param_array) - 1}].headers;")
 
-        # We need to store the resource we deleted in Context
+        # We need to store the resource we deleted in request state
         # This is needed if DELETE API fails, we need to restore the value to resource in our Shadow/Cache DB
         if self.delete_url_resource:
             _resource = getattr(self.delete_url_resource, constants.RESOURCE)
             _field = self.delete_url_resource.field
-            body.append(f"context.vars._delete_resource = {{ resource: '{_resource}', value: urlConfig[1].{_field} }};")
+            body.append(f"requestState.deleteResource = {{ resource: '{_resource}', value: urlConfig[1].{_field} }};")
 
         # Start the clock for Influx DB timing operations
-        body.append(f"context.vars._startTime = Date.now();")
+        body.append("requestState.startTime = Date.now();")
 
         return self.cache_operation_tasks(body)
 
@@ -308,9 +318,59 @@ class Task(models.Task):
         if self.tag_check:
             statements.append(self.if_true_function())
 
+        self.statements = statements
+        self.width = width
         return statements
 
 
+class TaskFragment:
+    """
+    Converted output of a Task, as recorded in Build Manifest.
+
+    It stands in for the Task in TaskSet, so that a Task whose inputs have not changed since last build
+    is not generated again.
+    """
+
+    __slots__ = (
+        "open_api_op", "before_func_name", "after_func_name", "if_true_func_name", "tag_check", "yaml_task",
+        "statements", "width"
+    )
+
+    def __init__(self, open_api_op, state: dict):
+        """
+        :param open_api_op: OpenAPI interface for this task
+        :param state: State as returned by get_state()
+        """
+        self.open_api_op = open_api_op
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    @classmethod
+    def from_task(cls, task: Task):
+        """
+        Record the fragment of a converted Task
+        """
+        return cls(task.open_api_op, {
+            "before_func_name": task.before_func_name,
+            "after_func_name": task.after_func_name,
+            "if_true_func_name": task.if_true_func_name,
+            "tag_check": bool(task.tag_check),
+            "yaml_task": task.yaml_task,
+            "statements": task.statements,
+            "width": task.width
+        })
+
+    def get_state(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__ if key != "open_api_op"}
+
+    def convert(self, width: int) -> list:
+        if width != self.width:
+            raise exceptions.ImproperInterfaceException(
+                f"Fragment for {self.open_api_op.op_id} was converted with width {self.width}, not {width}"
+            )
+        return self.statements
+
+
 class TaskSet(models.TaskSet):
     """
     Responsible for collating all Tasks (as defined by Task Model) and scenarios
@@ -328,13 +388,20 @@ class TaskSet(models.TaskSet):
             Add export statements for requisite functions
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, levels: list = None, **kwargs):
+        """
+        :param levels: Levels of OP IDs, which do not depend upon each other (See OperationGraph.topological_levels()).
+            If present, consecutive tasks of a level in a scenario are run as a single Artillery "parallel" step
+        """
         super().__init__(*args, **kwargs)
         self.yaml_flow = []
 
         # Map of Task OP ID to its YAML configuration
         self.task_map = {}
 
+        # Map of Task OP ID to its level
+        self.task_levels = {op_id: index for index, level in enumerate(levels or []) for op_id in level}
+
         self.scenario_profile_map = defaultdict(list)
 
     def construct_profile_scenario_map(self) -> None:
@@ -378,24 +445,59 @@ class TaskSet(models.TaskSet):
         flow_definition = [{"function": f"{name}SetProfiles"}, {"function": "setUp"}]
 
         try:
-            # Nested Shallow copy leads to explicit referencing in YAML which is not clear
-            flow_definition.extend([deepcopy(self.task_map[task_key.strip()]) for task_key in flow_tasks])
+            # Task configuration is shared by all scenarios, instead of copied. So it must be written without aliases
+            steps = [(task_key.strip(), self.task_map[task_key.strip()]) for task_key in flow_tasks]
         except KeyError as exc:
             raise exceptions.InvalidSettingsException(f"Invalid Key in Scenario {name}: {exc}")
+
+        flow_definition.extend(self.get_parallel_steps(steps) if self.task_levels else [step for _, step in steps])
         flow_definition.append({"function": "endResponse"})
         return {
             "flow": flow_definition,
             "name": name
         }
 
+    def get_parallel_steps(self, steps: list) -> list:
+        """
+        Group consecutive steps of same level in Artillery "parallel" steps.
+        Scenario order is kept as it is, so steps are only grouped if they are next to each other in scenario.
+
+        :param steps: List of (OP ID, YAML configuration) of tasks
+        :return: List of Artillery steps
+        """
+
+        groups = []
+        group_ops = set()
+        group_level = None
+
+        for op_id, step in steps:
+            level = self.task_levels.get(op_id)
+
+            # Same operation is repeated in scenario, or it is not in any level. It must wait for the previous group
+            if level is None or level != group_level or op_id in group_ops:
+                groups.append([])
+                group_ops = set()
+                group_level = level
+
+            groups[-1].append(step)
+            group_ops.add(op_id)
+
+        return [group[0] if len(group) == 1 else {"parallel": group} for group in groups]
+
+    def iter_yaml_flow(self):
+        """
+        Generate Artillery YAML of scenarios, one at a time. Tasks must have been converted before this
+        """
+        for name, scenario in self.scenarios.items():
+            yield self.make_yaml_scenario(name, scenario)
+
     def set_yaml_flow(self) -> None:
         """
         Define Artillery YAML for all scenarios
         """
 
         self.construct_task_map()
-        for name, scenario in self.scenarios.items():
-            self.yaml_flow.append(self.make_yaml_scenario(name, scenario))
+        self.yaml_flow.extend(self.iter_yaml_flow())
 
     def scenario_profile_setup(self, name: str) -> str:
         """
@@ -406,16 +508,26 @@ class TaskSet(models.TaskSet):
             profiles=", ".join([f"'{profile}'" for profile in self.scenario_profile_map.get(name, [])])
         )
 
-    def task_definitions(self, width: int) -> str:
+    def iter_task_definitions(self, width: int):
         """
-        Construct JS Program Snippet containing all processor functions as defined by task
+        Generate JS Program Snippets of all processor functions as defined by task, separated by blank lines
         """
 
-        join_string = "\n\n".format(w=' ' * width * 4)
-        tasks = [self.scenario_profile_setup(scenario) for scenario in self.scenarios]
+        separator = ""
+        for scenario in self.scenarios:
+            yield separator + self.scenario_profile_setup(scenario)
+            separator = "\n\n"
+
         for _task in self.tasks:
-            tasks.extend(_task.convert(width))
-        return join_string.join(tasks)
+            for statement in _task.convert(width):
+                yield separator + statement
+                separator = "\n\n"
+
+    def task_definitions(self, width: int) -> str:
+        """
+        Construct JS Program Snippet containing all processor functions as defined by task
+        """
+        return "".join(self.iter_task_definitions(width))
 
     @staticmethod
     def task_func_declarations(task: Task, width: int) -> str:
@@ -449,13 +561,10 @@ class TaskSet(models.TaskSet):
             "};"
         ])
 
-    def convert(self, width: int) -> str:
+    def iter_convert(self, width: int):
         """
-        Entry point for this method.
-
-        It is responsible for constructing both YAML and JS Snippets for Artillery
-
-        YAML construction is saved in self.yaml_task, and JS Code snippet is returned from this function
+        Generate JS Snippets for Artillery, one task at a time, so that they could be streamed to file.
+        Once generated, scenarios can be generated by iter_yaml_flow()
         """
 
         self.construct_profile_scenario_map()
@@ -471,10 +580,24 @@ class TaskSet(models.TaskSet):
             templates.STATS_WRITER,
             templates.FINAL_FLOW_FUNCTION,
             "\n",
-            self.task_definitions(width)
         ]
+        yield "\n".join(statements) + "\n"
+        yield from self.iter_task_definitions(width)
+
+        self.construct_task_map()
+
+    def convert(self, width: int) -> str:
+        """
+        Entry point for this method.
+
+        It is responsible for constructing both YAML and JS Snippets for Artillery
+
+        YAML construction is saved in self.yaml_task, and JS Code snippet is returned from this function
+        """
+
+        statements = "".join(self.iter_convert(width))
 
         # Make sure that YAML is constructed after all task definitions have been constructed
         self.set_yaml_flow()
 
-        return "\n".join(statements)
+        return statements
@@ -78,15 +78,18 @@ function extractBody(response, requestParams, context) {
 GLOBAL_STATEMENTS = """
 const Provider = utils.Provider, ResponseDataParser = utils.ResponseDataParser;
 let respDataParser, defaultHeaders;
+
+// State of each request (its provider, URL, start time and deleted resource), from before request to after response
+const requestStates = new WeakMap();
 """
 
 
 STATS_WRITER = """
-function statsWrite(response, context, ee) {
-    let stats = {url: context.vars._rawURL, method: response.request.method};
-    if (context.vars._startTime) {
-        let responseTime = Date.now() - context.vars._startTime;
-        stats.startTime = context.vars._startTime;
+function statsWrite(response, requestState, context) {
+    let stats = {url: requestState.rawURL, method: response.request.method};
+    if (requestState.startTime) {
+        let responseTime = Date.now() - requestState.startTime;
+        stats.startTime = requestState.startTime;
         stats.responseTime = responseTime;
     }
     stats.isSuccess = (response.statusCode >= 200 && response.statusCode < 300) ? 1: 0;
@@ -127,17 +130,18 @@ function statsEndResponse(context, event, done) {
 
 # Function would be formatted, so use double braces
 API_AFTER_RESPONSE_FUNCTION = """function {after_func_name}(requestParams, response, context, ee, next) {{
-    statsWrite(response, context, ee);
-    const provider = context.vars['provider'];
+    const requestState = requestStates.get(requestParams) || {{provider: context.vars['provider']}};
+    requestStates.delete(requestParams);
+    statsWrite(response, requestState, context);
+    const provider = requestState.provider;
     const status = response.statusCode;
     if (!status || status < 200 || status > 300) {{
-        if (context.vars._delete_resource) {{
-            const rollback = context.vars._delete_resource;
+        if (requestState.deleteResource) {{
+            const rollback = requestState.deleteResource;
             provider.rollBackDelete(rollback.resource, rollback.value);
         }}
         ee.emit('error', 'Non 2xx Response');{else_body}
     }}
-    provider.reset();
     return next();
 }}"""
 
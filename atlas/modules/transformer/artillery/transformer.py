@@ -1,4 +1,7 @@
-from atlas.modules import mixins
+from io import open
+import os
+
+from atlas.modules import mixins, yaml_io
 from atlas.modules.transformer.base import transformer
 from atlas.conf import settings
 from atlas.modules.transformer.artillery import templates
@@ -21,10 +24,6 @@ class ArtilleryFileConfig(mixins.YAMLReadWriteMixin, transformer.FileConfig):
 
     OUT_FILE = settings.ARTILLERY_FILE
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.yaml_config = {}
-
     def get_imports(self) -> str:
         """
         Processor File Import statements
@@ -49,13 +48,13 @@ class ArtilleryFileConfig(mixins.YAMLReadWriteMixin, transformer.FileConfig):
         """
         return templates.GLOBAL_STATEMENTS
 
-    def set_yaml_config(self) -> None:
+    def get_yaml_config(self) -> dict:
         """
-        Construct Artillery YAML configuration
+        Construct Artillery YAML configuration, except for scenarios
         """
 
         # LT-248: We can pick Artillery Phase configuration from conf file
-        self.yaml_config = {
+        return {
             "config": {
                 "target": self.get_swagger_url(),
                 "processor": f"./{self.OUT_FILE}",
@@ -65,17 +64,35 @@ class ArtilleryFileConfig(mixins.YAMLReadWriteMixin, transformer.FileConfig):
                         "arrivalRate": settings.SPAWN_RATE or 1
                     }
                 ]
-            },
-            "scenarios": self.task_set.yaml_flow
+            }
         }
 
+    def write_yaml(self, yaml_stream) -> None:
+        """
+        Write Artillery YAML to stream.
+        Scenarios are generated and written one at a time, so that memory does not grow with number of scenarios.
+        Output is same as writing the complete configuration at once
+        """
+
+        yaml_io.dump(self.get_yaml_config(), yaml_stream, aliases=False)
+
+        has_scenarios = False
+        for scenario in self.task_set.iter_yaml_flow():
+            if not has_scenarios:
+                yaml_stream.write("scenarios:\n")
+                has_scenarios = True
+            # Block sequences are not indented under their key, so each scenario is written as it would be there
+            yaml_io.dump([scenario], yaml_stream, aliases=False)
+
+        if not has_scenarios:
+            yaml_stream.write("scenarios: []\n")
+
     def write_to_file(self, file_name=None, sub_path=None) -> None:
         """
         Write to YAML and JS files the final constructed configurations
         """
         super().write_to_file(file_name, settings.ARTILLERY_FOLDER)
 
-        self.set_yaml_config()
-        self.write_file_to_output(
-            settings.ARTILLERY_YAML, self.yaml_config, append_mode=False, project_sub_folder=settings.ARTILLERY_FOLDER
-        )
+        _path = self.get_project_folder(os.path.join(settings.OUTPUT_FOLDER, settings.ARTILLERY_FOLDER))
+        with open(os.path.join(_path, settings.ARTILLERY_YAML), "w") as yaml_stream:
+            self.write_yaml(yaml_stream)
@@ -2,10 +2,9 @@ from io import open
 import json
 import os
 import re
-import yaml
 
 from atlas.conf import settings
-from atlas.modules import utils
+from atlas.modules import mixins, resource_pool, utils, yaml_io
 
 
 BOOL_MAP = {
@@ -22,11 +21,18 @@ class Converter:
 
     Files Converted:
         profiles.yaml ->  profiles.js
-        Resource Files generated by Data Generator are initialized in resources.js
+        Resource Files generated by Data Generator -> resources.pool, which is loaded by resources.js
     """
 
-    def __init__(self):
+    def __init__(self, profile_configs=None, profile_resources=None):
+        """
+        :param profile_configs: Contents of Profiles file. Leave Null to read it from file
+        :param profile_resources: Resources already fetched in this build, keyed on profile name.
+            Resources for other profiles are read from Resource Files
+        """
         self.profiles = []
+        self.profile_configs = profile_configs
+        self.profile_resources = profile_resources or {}
         self.path = utils.get_project_path()
 
     def convert_profiles(self):
@@ -34,21 +40,24 @@ class Converter:
         Convert Profiles YAML to profiles.js
         """
 
-        _file = os.path.join(self.path, settings.INPUT_FOLDER, settings.PROFILES_FILE)
-        with open(_file) as yaml_file:
-            data = yaml.safe_load(yaml_file)
+        data = self.profile_configs
+        if data is None:
+            _file = os.path.join(self.path, settings.INPUT_FOLDER, settings.PROFILES_FILE)
+            with open(_file) as yaml_file:
+                data = yaml_io.load(yaml_file)
 
         _credential_file = os.path.join(self.path, settings.INPUT_FOLDER, settings.CREDENTIALS_FILE)
         try:
             with open(_credential_file) as yaml_file:
-                cred_data = yaml.safe_load(yaml_file) or {}
+                cred_data = yaml_io.load(yaml_file) or {}
         except FileNotFoundError:
             cred_data = {}
 
         self.profiles = data.keys()
+        self.profile_configs = data
 
-        for key, value in data.items():
-            value.update(cred_data.get(key, {}))
+        # Profiles could be shared with other build stages, so we do not update them in-place
+        data = {key: {**value, **cred_data.get(key, {})} for key, value in data.items()}
 
         out_data = "exports.profiles = {};\n".format(json.dumps(data, indent=4))
 
@@ -60,31 +69,36 @@ class Converter:
         with open(out_file, 'w') as js_file:
             js_file.write(out_data)
 
-    def get_resources(self):
+    def get_resources(self) -> dict:
         """
-        Generate JS Code Snippet for resources
+        Resources of all profiles, keyed as in Artillery runtime (profile:resource)
         """
 
         _dir = os.path.join(self.path, settings.OUTPUT_FOLDER, settings.RESOURCES_FOLDER)
 
-        profile_data = []
-
-        indent_width = 2
-        indent = ' ' * 4 * indent_width
+        pools = {}
 
         for profile in self.profiles:
-            _file = os.path.join(_dir, profile + ".yaml")
-            with open(_file) as yaml_file:
-                data = yaml.safe_load(yaml_file)
-            profile_data.append(self.update_statements(profile, data, indent))
+            data = self.profile_resources.get(profile)
+            if data is None:
+                resource_file_name = mixins.ProfileMixin.get_profile_resource_name(
+                    profile, (self.profile_configs or {}).get(profile, {})
+                )
+                data = resource_pool.read_profile_resources(_dir, resource_file_name)
+            pools.update({f"{profile}:{key}": value for key, value in data.items() if value})
 
-        return f"\n{indent}".join(profile_data)
+        return pools
 
     def convert_resources(self):
         """
-        Write the code for resources.js and initialize the build-time resources
+        Write the resource pool, and the code for resources.js which loads it
         """
 
+        lib_dir = os.path.join(
+            self.path, settings.OUTPUT_FOLDER, settings.ARTILLERY_FOLDER, settings.ARTILLERY_LIB_FOLDER
+        )
+        resource_pool.dump(self.get_resources(), os.path.join(lib_dir, settings.ARTILLERY_RESOURCE_POOL))
+
         in_file = os.path.join(
             settings.BASE_DIR, "atlas", "modules", "data_provider", "artillery", settings.ARTILLERY_RESOURCES
         )
@@ -92,28 +106,12 @@ class Converter:
         with open(in_file) as in_data:
             contents = in_data.read()
 
-        out_data = re.sub("let dynamicResources;", self.get_resources(), contents)
+        load_statement = f"this.loadPool(path.join(__dirname, '{settings.ARTILLERY_RESOURCE_POOL}'));"
+        out_data = re.sub("let dynamicResources;", load_statement, contents)
 
-        out_file = os.path.join(
-            self.path, settings.OUTPUT_FOLDER, settings.ARTILLERY_FOLDER, settings.ARTILLERY_LIB_FOLDER,
-            settings.ARTILLERY_RESOURCES
-        )
-
-        with open(out_file, 'w') as js_file:
+        with open(os.path.join(lib_dir, settings.ARTILLERY_RESOURCES), 'w') as js_file:
             js_file.write(out_data)
 
-    @staticmethod
-    def update_statements(profile, data, indent):
-        """
-        Convert the resources into Update Statements
-        Assumption being that Resources are a single level dict, with each value being set
-        """
-        out_data = [
-            f"this.updateResource('{profile}', '{key}', new Set({list(value)}));" for key, value in data.items()
-            if value
-        ]
-        return f"\n{indent}".join(out_data)
-
     def convert(self):
         self.convert_profiles()
         self.convert_resources()
@@ -1,8 +1,8 @@
 from collections import namedtuple
 
-from atlas.modules import constants, exceptions, utils
+from atlas.modules import constants, exceptions
 from atlas.modules.transformer import interface, profile_constants
-from atlas.modules.helpers import swagger_schema_resolver
+from atlas.modules.helpers import references, swagger_schema_resolver
 from atlas.conf import settings
 
 
@@ -60,7 +60,7 @@ class Task:
 
             ref = config.get(constants.REF)
             if ref:
-                config = utils.resolve_reference(self.schema_resolver.spec, ref)
+                config = references.resolve(self.schema_resolver.spec, ref)
 
             in_ = config.get(constants.IN_)
 
@@ -256,3 +256,9 @@ class TaskSet:
 
     def convert(self, width):
         raise NotImplementedError
+
+    def iter_convert(self, width):
+        """
+        Generate the converted output in fragments. Sub-classes can over-ride it to stream their output
+        """
+        yield self.convert(width)
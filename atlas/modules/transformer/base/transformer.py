@@ -29,6 +29,9 @@ class FileConfig:
     # Required. Tells where to write the configuration for load test
     OUT_FILE = None
 
+    # Indentation width with which tasks are converted
+    WIDTH = 1
+
     def __init__(self, task_set, specs=None):
         self.task_set = task_set
         self.specs = specs or {}
@@ -42,13 +45,27 @@ class FileConfig:
     def get_global_vars(self):
         return ""
 
+    def iter_convert(self):
+        """
+        Generate the configuration in fragments, so that it could be streamed to file instead of held in memory
+        Non-empty components are separated by blank line
+        """
+
+        separator = ""
+        for component in [self.get_imports(), self.get_global_vars()]:
+            if component:
+                yield separator
+                yield component
+                separator = "\n\n"
+
+        for fragment in self.task_set.iter_convert(width=self.WIDTH):
+            if fragment:
+                yield separator
+                yield fragment
+                separator = ""
+
     def convert(self):
-        file_components = [
-            self.get_imports(),
-            self.get_global_vars(),
-            self.task_set.convert(width=1)
-        ]
-        return "\n\n".join([component for component in file_components if component])
+        return "".join(self.iter_convert())
 
     def write_to_file(self, file_name=None, sub_path=None):
         """
@@ -64,7 +81,9 @@ class FileConfig:
         _file = os.path.join(_path, file_name)
 
         with open(_file, 'w') as write_file:
-            write_file.write(self.convert() + "\n")  # Append EOF New line
+            for fragment in self.iter_convert():
+                write_file.write(fragment)
+            write_file.write("\n")  # Append EOF New line
 
     def get_swagger_url(self):
         """
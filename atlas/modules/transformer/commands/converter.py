@@ -1,28 +1,62 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 from atlas.conf import settings
+from atlas.modules import constants
 from atlas.modules.commands.base import CommandError
-from atlas.modules.helpers import open_api_reader
+from atlas.modules.commands.utils import add_bool_arg
+from atlas.modules.helpers import pipeline
 from atlas.modules.transformer.commands.base import TransformerBaseCommand
 from atlas.modules.transformer.artillery import (
     models as artillery_models,
     transformer as artillery_transformer,
     yaml_to_js
 )
-from atlas.modules.transformer import open_api_models
+from atlas.modules.transformer import manifest as build_manifest, open_api_models
 from atlas.modules.transformer.ordering import ordering
 
 
 TASK = "task"
 TASK_SET = "task_set"
 FILE_CONFIG = "file_config"
+FRAGMENT = "fragment"
 
 CONVERTER_MAP = {
     "artillery": {
         TASK: artillery_models.Task,
         TASK_SET: artillery_models.TaskSet,
-        FILE_CONFIG: artillery_transformer.ArtilleryFileConfig
+        FILE_CONFIG: artillery_transformer.ArtilleryFileConfig,
+        FRAGMENT: artillery_models.TaskFragment
     }
 }
 
+# State of processes which generate tasks in parallel. It is set once per process, so spec is not sent with every task
+_worker = {}
+
+
+def _init_worker(load_conf, spec, width):
+    _worker.update(load_conf=load_conf, spec=spec, width=width)
+
+
+def _generate_fragment(interface) -> dict:
+    load_conf = _worker["load_conf"]
+    task = load_conf[TASK](interface, _worker["spec"])
+    task.convert(_worker["width"])
+    return load_conf[FRAGMENT].from_task(task).get_state()
+
+
+def generate_fragments(load_conf, interfaces, spec, jobs) -> list:
+    """
+    Generate and convert Tasks in a pool of processes.
+    State of their fragments is returned in the same order as interfaces, so output does not depend upon scheduling
+    """
+
+    chunk_size = max(1, len(interfaces) // (jobs * 4))
+    initargs = (load_conf, spec, load_conf[FILE_CONFIG].WIDTH)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=initargs) as executor:
+        return list(executor.map(_generate_fragment, interfaces, chunksize=chunk_size))
+
 
 class Converter(TransformerBaseCommand):
     """
@@ -33,6 +67,57 @@ class Converter(TransformerBaseCommand):
 
     help = "Converts Swagger file to configuration file which could be fed into Load Tester"
 
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+
+        # --no-incremental ignores the Build Manifest, and generates all tasks afresh
+        add_bool_arg(parser, "incremental", default=True)
+
+        parser.add_argument(
+            "--jobs", type=int, default=1, help="Number of processes which generate tasks in parallel"
+        )
+
+    @staticmethod
+    def get_tasks(load_conf, interfaces, spec, manifest=None, jobs=1) -> list:
+        """
+        Construct Task for each interface, in the same order as interfaces.
+        If manifest is provided, Tasks which have not changed since last build are replaced by their recorded fragments
+        With more than one job, rest of the Tasks are generated in parallel processes, and returned as fragments
+        """
+
+        tasks = [None] * len(interfaces)
+        pending = []
+
+        for idx, interface in enumerate(interfaces):
+            # Fingerprint is taken before Task is constructed, since Task could update its interface
+            state = manifest.get(interface.op_id, manifest.fingerprint(interface)) if manifest else None
+            if state:
+                tasks[idx] = load_conf[FRAGMENT](interface, state)
+            else:
+                pending.append(idx)
+
+        if jobs > 1 and len(pending) > 1:
+            states = generate_fragments(load_conf, [interfaces[idx] for idx in pending], spec, jobs)
+            for idx, state in zip(pending, states):
+                tasks[idx] = load_conf[FRAGMENT](interfaces[idx], state)
+        else:
+            for idx in pending:
+                tasks[idx] = load_conf[TASK](interfaces[idx], spec)
+
+        return tasks
+
+    @staticmethod
+    def record_tasks(load_conf, tasks, manifest):
+        """
+        Record the fragments of converted tasks in manifest, and save it
+        """
+
+        for task in tasks:
+            fragment = task if isinstance(task, load_conf[FRAGMENT]) else load_conf[FRAGMENT].from_task(task)
+            manifest.record(task.open_api_op.op_id, fragment.get_state())
+
+        manifest.save()
+
     def handle(self, **options):
         """
         Operation Order is:
@@ -51,22 +136,55 @@ class Converter(TransformerBaseCommand):
         if not load_conf:
             raise CommandError(f"Invalid Load Testing Type. Valid types are: {self.VALID_CONVERTERS}")
 
-        spec = open_api_reader.SpecsFile().file_load()
-        open_api = open_api_models.OpenAPISpec(spec)
-        open_api.get_interfaces()
+        jobs = options.get("jobs")
+        if jobs is None:
+            jobs = 1
+        elif jobs < 1:
+            raise CommandError("Number of jobs should be at least 1")
+
+        context = options.get("context") or pipeline.PipelineContext()
+        profiler = context.profiler
+
+        with profiler.stage("interfaces"):
+            spec = context.specs
+            open_api = open_api_models.OpenAPISpec(spec)
+            open_api.get_interfaces()
+
+            profiler.count("operations", len(open_api.interfaces))
+            profiler.count("definitions", len(spec.get(constants.DEFINITIONS) or {}))
 
-        order = ordering.Ordering(spec, open_api.interfaces)
-        sorted_interfaces = order.order()
+        with profiler.stage("ordering"):
+            order = ordering.Ordering(spec, open_api.interfaces)
+            task_set_options = {}
+
+            if settings.LOAD_TEST_PARALLEL_STEPS:
+                levels = order.order(levels=True)
+                sorted_interfaces = [interface for level in levels for interface in level]
+                task_set_options["levels"] = [[interface.op_id for interface in level] for level in levels]
+            else:
+                sorted_interfaces = order.order()
 
         scenarios = settings.LOAD_TEST_SCENARIOS
 
-        tasks = [load_conf[TASK](interface, spec) for interface in sorted_interfaces]
+        with profiler.stage("tasks"):
+            manifest = None
+            if options.get("incremental", True) and settings.INCREMENTAL_BUILD:
+                manifest = build_manifest.BuildManifest(spec)
+
+            tasks = self.get_tasks(load_conf, sorted_interfaces, spec, manifest, jobs)
+
+        # Tasks are converted while they are written
+        with profiler.stage("write", outputs=[os.path.join(settings.OUTPUT_FOLDER, settings.ARTILLERY_FOLDER)]):
+            _task_set = load_conf[TASK_SET](tasks=tasks, scenarios=scenarios, **task_set_options)
 
-        _task_set = load_conf[TASK_SET](tasks=tasks, scenarios=scenarios)
+            config = load_conf[FILE_CONFIG](_task_set, spec)
+            config.write_to_file()
 
-        config = load_conf[FILE_CONFIG](_task_set, spec)
-        config.write_to_file()
+            if manifest:
+                self.record_tasks(load_conf, tasks, manifest)
 
-        if load_conf_type == "artillery":
-            js_converter = yaml_to_js.Converter()
-            js_converter.convert()
+            if load_conf_type == "artillery":
+                js_converter = yaml_to_js.Converter(
+                    profile_configs=context.profiles, profile_resources=context.profile_resources
+                )
+                js_converter.convert()
@@ -1,7 +1,12 @@
+import os
+
 from atlas.modules.commands.base import CommandError
 from atlas.modules.commands.utils import add_bool_arg
+from atlas.modules.helpers import pipeline, profiler as build_profiler, references
 from atlas.modules.helpers.commands import validate
+from atlas.modules.resource_data_generator import generators as data_generators, result_cache
 from atlas.modules.resource_data_generator.commands import generate as fetch_data
+from atlas.modules.resource_data_generator.database import client as db_client
 from atlas.modules.resource_creator.commands import generate as create_resource
 from atlas.modules.transformer.commands.base import TransformerBaseCommand
 from atlas.modules.transformer.artillery.dist import ArtilleryDist
@@ -23,6 +28,13 @@ class Dist(TransformerBaseCommand):
         add_bool_arg(parser, "setup", default=True)
         add_bool_arg(parser, "detect_resources", default=True)
         add_bool_arg(parser, "fetch_data", default=True)
+        # Run resource queries against database, instead of serving their results from cache
+        add_bool_arg(parser, "refresh_data", default=False)
+
+        # Write time, CPU and counts of each stage to a JSON report in OUTPUT folder
+        add_bool_arg(parser, "profile", default=False)
+        # Also record peak memory of stages. This slows down the build
+        add_bool_arg(parser, "profile_memory", default=False)
 
     def handle(self, **options):
         load_conf_type = options.pop("type")
@@ -37,36 +49,71 @@ class Dist(TransformerBaseCommand):
         dist = ArtilleryDist()
         dist.start()
 
+    @staticmethod
+    def get_profiler(**options) -> build_profiler.BuildProfiler:
+        return build_profiler.BuildProfiler(
+            enabled=bool(options.get("profile") or options.get("profile_memory")),
+            trace_memory=bool(options.get("profile_memory")),
+            counters={
+                "refs_resolved": (references.stats, references.RESOLVED),
+                "sql_queries": (db_client.stats, db_client.QUERIES),
+                "resource_fetches": (data_generators.stats, data_generators.REQUESTED),
+                "resource_fetches_reused": (data_generators.stats, data_generators.REUSED),
+                "resource_cache_hits": (result_cache.stats, result_cache.HITS),
+            }
+        )
+
     def artillery_pipeline(self, **options):
 
+        profiler = self.get_profiler(**options)
+
+        # All stages share Specs, Resource Map and Profiles, so that each of them is read from disk at most once
+        context = pipeline.PipelineContext(profiler=profiler)
+
+        # Stages name their outputs, so that profiler only walks those to find bytes written
+        mapping_file = os.path.join(settings.INPUT_FOLDER, settings.MAPPING_FILE)
+        resources_folder = os.path.join(settings.OUTPUT_FOLDER, settings.RESOURCES_FOLDER)
+        artillery_folder = os.path.join(settings.OUTPUT_FOLDER, settings.ARTILLERY_FOLDER)
+
         # Validates the Swagger file
         if options.get("validate"):
             print("\nSwagger Validation Started...")
-            validate.Validate().handle()
+            with profiler.stage("validate"):
+                validate.Validate().handle(context=context)
 
         # Create Data Types and then fetch it
         if options.get("detect_resources"):
             print("\nResource Detection Started...")
-            create_resource.Generate().handle()
+            with profiler.stage("detect_resources", outputs=[mapping_file]):
+                create_resource.Generate().handle(context=context)
 
         if options.get("fetch_data"):
             print("Fetching Data from database and updating caches...")
-            fetch_data.Generate().handle()
+            with profiler.stage("fetch_data", outputs=[resources_folder]):
+                output = fetch_data.Generate().handle(context=context, refresh=options.get("refresh_data", False))
+                print(output, end="")
 
         # Setup the Artillery Files
         if options.get("setup"):
             print("Converting Settings/Constants to JS Libraries")
-            setup.Setup().handle(type="artillery")
+            with profiler.stage("setup", outputs=[artillery_folder]):
+                setup.Setup().handle(type="artillery")
 
         # Build the Swagger to Artillery Files
         print("Converting your Swagger file to Artillery Load Test...")
-        converter.Converter().handle(type="artillery")
+        with profiler.stage("transform", outputs=[artillery_folder]):
+            converter.Converter().handle(type="artillery", context=context)
 
         artillery_dist_file = f"{settings.DIST_FOLDER}/{settings.ARTILLERY_FOLDER}/{settings.ARTILLERY_YAML}"
 
         # Now package it for distribution
         print("Preparing your distribution package")
-        self.artillery_dist()
+        with profiler.stage("dist", outputs=[settings.DIST_FOLDER]):
+            self.artillery_dist()
+
+        report = profiler.write_report()
+        if report:
+            print(f"Build profile written to {report}")
 
         print("Successfully finished. \n\n"
               f"You can start the test on local by running `atlas run`\n"
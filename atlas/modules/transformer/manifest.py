@@ -0,0 +1,209 @@
+from collections import Counter
+import glob
+import hashlib
+from io import open
+import json
+import os
+import pickle
+
+from atlas.conf import settings
+from atlas.modules import exceptions, utils
+from atlas.modules.helpers import references
+
+
+MANIFEST_FOLDER = "transform"
+MANIFEST_FILE = "manifest.pickle"
+
+# Settings which change the output of Tasks
+TASK_SETTINGS = ("HIT_ALL_QUERY_PARAMS", "POSITIVE_INTEGER_PARAMS", "ONLY_TAG_API")
+
+REUSED = "reused"
+GENERATED = "generated"
+
+# Tasks reused from manifest and generated afresh, for current process
+stats = Counter()
+
+
+def _json_default(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def get_digest(*data) -> str:
+    """
+    Content hash of JSON serializable data. Order of keys is part of hash, since it changes the generated output
+    """
+    content = json.dumps(data, default=_json_default, separators=(",", ":"))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def get_source_digest() -> str:
+    """
+    Digest of ATLAS source code. Output of build could change with any change in it
+    """
+
+    source = hashlib.sha256()
+    modules_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for file_path in sorted(glob.glob(os.path.join(modules_folder, "**", "*.py"), recursive=True)):
+        with open(file_path, "rb") as source_file:
+            source.update(source_file.read())
+
+    return source.hexdigest()
+
+
+class BuildManifest:
+    """
+    Records the output (fragments) of every Task of a build, along with fingerprint of inputs of that Task:
+        - Configuration of its Operation
+        - Configuration of all references which Operation touches, directly or transitively
+        - Settings (and ATLAS code) which change the output of Tasks
+
+    In next build, Task whose fingerprint has not changed re-uses its recorded fragment, instead of being generated.
+    So, editing a single endpoint of a large swagger only generates that endpoint (and its dependents) again.
+
+    Sample Usage:
+        manifest = BuildManifest(spec)
+        fingerprint = manifest.fingerprint(interface)
+        fragment = manifest.get(interface.op_id, fingerprint)
+        ...
+        manifest.record(interface.op_id, fragment)
+        manifest.save()
+    """
+
+    # Bump this if the format of manifest changes
+    VERSION = 1
+
+    def __init__(self, spec, path=None):
+        self.spec = spec
+        self.path = path or os.path.join(
+            utils.get_project_path(), settings.OUTPUT_FOLDER, settings.CACHE_FOLDER, MANIFEST_FOLDER, MANIFEST_FILE
+        )
+
+        self.environment = self.get_environment_digest()
+
+        # Entries of previous build, and of current build. Both are keyed on OP ID, with value (fingerprint, fragment)
+        self.entries = {}
+        self.new_entries = {}
+
+        # Fingerprints of current build, keyed on OP ID
+        self.fingerprints = {}
+
+        self.ref_digests = {}
+        self.ref_connections = {}
+
+        self.load()
+
+    @staticmethod
+    def get_environment_digest() -> str:
+        """
+        Digest of settings and source code which generate the Tasks. Any change in them invalidates whole manifest
+        """
+
+        return get_digest(get_source_digest(), {name: getattr(settings, name, None) for name in TASK_SETTINGS})
+
+    def load(self):
+
+        try:
+            with open(self.path, "rb") as manifest_stream:
+                manifest = pickle.load(manifest_stream)
+        except FileNotFoundError:
+            return
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, TypeError):
+            # Corrupt or incompatible manifest. This build would re-generate all tasks, and over-write it
+            return
+
+        if not isinstance(manifest, dict):
+            return
+
+        if manifest.get("version") == self.VERSION and manifest.get("environment") == self.environment:
+            self.entries = manifest.get("entries", {})
+
+    def save(self):
+        """
+        Save the entries of current build. Entries of operations which are no longer in spec are dropped
+        """
+
+        folder = os.path.dirname(self.path)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        # Write to temp file first and then move it, so that concurrent readers never see partial manifest
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as manifest_stream:
+            pickle.dump(
+                {"version": self.VERSION, "environment": self.environment, "entries": self.new_entries},
+                manifest_stream, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(temp_path, self.path)
+
+    def get_ref_digest(self, ref: str) -> str:
+
+        if ref not in self.ref_digests:
+            try:
+                target = references.resolve(self.spec, ref)
+            except exceptions.ImproperSwaggerException:
+                # Task would report the invalid reference, if it ever resolves it
+                target = None
+            self.ref_digests[ref] = get_digest(target)
+            self.ref_connections[ref] = references.ReferenceResolver.get_refs(target) if target else set()
+
+        return self.ref_digests[ref]
+
+    def get_touched_refs(self, *configs) -> set:
+        """
+        All references which are reachable from configs
+        """
+
+        touched = set()
+        stack = []
+        for config in configs:
+            if config:
+                stack.extend(references.ReferenceResolver.get_refs(config))
+
+        while stack:
+            ref = stack.pop()
+            if ref in touched:
+                continue
+            touched.add(ref)
+            self.get_ref_digest(ref)
+            stack.extend(self.ref_connections[ref] - touched)
+
+        return touched
+
+    def fingerprint(self, interface) -> str:
+        """
+        Fingerprint of all inputs of Task for the interface.
+        It must be taken before Task is constructed, since Tasks could update the parameter configuration in-place
+        """
+
+        op_config = [
+            interface.method, interface.url, interface.func_name, interface.tags, interface.consumes,
+            interface.parameters, interface.responses, interface.dependent_resources
+        ]
+        touched_refs = sorted(self.get_touched_refs(interface.parameters, interface.responses))
+
+        fingerprint = self.fingerprints[interface.op_id] = get_digest(
+            self.environment, op_config, [(ref, self.ref_digests[ref]) for ref in touched_refs]
+        )
+        return fingerprint
+
+    def get(self, op_id: str, fingerprint: str):
+        """
+        Recorded fragment for the operation, if it was recorded with same fingerprint. Else None
+        """
+
+        recorded_fingerprint, fragment = self.entries.get(op_id, (None, None))
+
+        if recorded_fingerprint == fingerprint:
+            stats[REUSED] += 1
+            return fragment
+
+        stats[GENERATED] += 1
+        return None
+
+    def record(self, op_id: str, fragment):
+        """
+        Record fragment for the operation, against the fingerprint taken in this build
+        """
+        self.new_entries[op_id] = (self.fingerprints[op_id], fragment)
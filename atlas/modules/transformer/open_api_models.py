@@ -6,7 +6,7 @@ from atlas.modules import (
     exceptions,
     utils
 )
-from atlas.modules.helpers import open_api
+from atlas.modules.helpers import open_api, references
 from atlas.modules.transformer import interface
 from atlas.conf import settings
 
@@ -48,11 +48,86 @@ class Response:
         return ref
 
     def resolve_definitions(self):
+        """
+        Resources of a definition are its own resources, and resources of all the definitions it refers to.
+        References of a definition are itself, and the definitions it directly refers to.
+
+        Definitions which refer to each other (directly or via others) form a component, and share their resources.
+        Components come after all the components they refer to, so each definition is resolved exactly once.
+        """
+
         definitions = self.specs.get(swagger_constants.DEFINITIONS, {})
         self.parse_definitions(definitions)
 
-        for name in definitions.keys():
-            self.definitions[name.lower()][RESOURCES] = self.resolve_nested_definition(name.lower())
+        for component in self.get_components():
+            members = set(component)
+            resources = set()
+
+            for name in component:
+                config = self.definitions[name]
+                config[REFERENCES].update(config[DEF])
+                resources.update(config[RESOURCES])
+
+                # Definitions outside component are already resolved
+                for ref in config[DEF] - members:
+                    resources.update(self.definitions.get(ref, {}).get(RESOURCES, set()))
+
+            for name in component:
+                self.definitions[name][RESOURCES].update(resources)
+
+    def get_components(self):
+        """
+        Strongly connected components of definitions w.r.t their refs, via iterative Tarjan's algorithm.
+        Components are yielded in reverse topological order, ie a component is yielded after those it refers to.
+        Refs to unknown definitions are ignored.
+        """
+
+        index = {}
+        low_link = {}
+        stack = []
+        on_stack = set()
+
+        for root in self.definitions:
+            if root in index:
+                continue
+
+            index[root] = low_link[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.definitions[root][DEF]))]
+
+            while work:
+                name, refs = work[-1]
+
+                for ref in refs:
+                    if ref not in self.definitions:
+                        continue
+
+                    if ref not in index:
+                        index[ref] = low_link[ref] = len(index)
+                        stack.append(ref)
+                        on_stack.add(ref)
+                        work.append((ref, iter(self.definitions[ref][DEF])))
+                        break
+
+                    if ref in on_stack:
+                        low_link[name] = min(low_link[name], index[ref])
+
+                else:
+                    # All refs of name are visited
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low_link[parent] = min(low_link[parent], low_link[name])
+
+                    if low_link[name] == index[name]:
+                        component = []
+                        member = None
+                        while member != name:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                        yield component
 
     def parse_definitions(self, definitions):
 
@@ -79,19 +154,6 @@ class Response:
         if ref:
             self.definitions[name][DEF].add(ref)
 
-    def resolve_nested_definition(self, definition):
-
-        # Can speed this up by marking elements which are already processed
-        # Note: Any such optimization should be reflected in calling/parent functions also
-        config = self.definitions.get(definition)
-
-        while config.get(DEF):
-            new_definition = config[DEF].pop()
-            self.definitions[definition][REFERENCES].add(new_definition)
-            config[RESOURCES].update(self.resolve_nested_definition(new_definition))
-
-        return config[RESOURCES]
-
 
 class Operation:
     """
@@ -110,7 +172,7 @@ class Operation:
 
             ref = parameter.get(swagger_constants.REF)
             if ref:
-                parameter = utils.resolve_reference(self.specs, ref)
+                parameter = references.resolve(self.specs, ref)
 
             name = parameter.get(swagger_constants.PARAMETER_NAME, None)
 
@@ -1,12 +1,20 @@
-from collections import deque
+from array import array
+import heapq
 
 from atlas.modules import exceptions
 
 
 class Node:
 
+    # Graphs for large Swagger have a node for every operation, so keep them small
+    __slots__ = ("key", "index", "connected_to")
+
     def __init__(self, key):
         self.key = key
+
+        # Position of node in its graph. See DirectedGraph.get_adjacency()
+        self.index = None
+
         self.connected_to = {}
 
     def add_neighbour(self, nbr, weight=0):
@@ -36,9 +44,10 @@ class DirectedGraph:
     def add_node(self, key):
         node = self.nodes.get(key)
 
-        if not node:
-            self.node_count = self.node_count + 1
+        if node is None:
             node = self.node_class(key)
+            node.index = self.node_count
+            self.node_count = self.node_count + 1
             self.nodes[key] = node
 
         return node
@@ -47,9 +56,7 @@ class DirectedGraph:
         return self.nodes.get(node_key)
 
     def add_edge(self, node_1_key, node_2_key, weight=0):
-        node_1 = self.nodes.get(node_1_key, self.add_node(node_1_key))
-        node_2 = self.nodes.get(node_2_key, self.add_node(node_2_key))
-        self.add_edge_by_node(node_1, node_2, weight)
+        self.add_edge_by_node(self.add_node(node_1_key), self.add_node(node_2_key), weight)
 
     def add_edge_by_node(self, node_1, node_2, weight=0):
         node_1.add_neighbour(node_2, weight)
@@ -57,8 +64,34 @@ class DirectedGraph:
     def get_vertices(self):
         return self.nodes.keys()
 
+    def get_adjacency(self):
+        """
+        Compact (CSR) copy of graph, where nodes are represented by their position in graph:
+            - keys: Key of node at each position
+            - offsets: Neighbours of node at position i are targets[offsets[i]:offsets[i + 1]]
+            - targets: Positions of neighbours of all nodes, one after another
+        Graph itself is stored in neighbours of its nodes (connected_to). Copy is built from them on every call,
+        and is not updated with graph, so take it after graph is constructed
+        """
+
+        nodes = list(self)
+        for index, node in enumerate(nodes):
+            node.index = index
+
+        keys = [node.key for node in nodes]
+        offsets = array("l", [0])
+        targets = array("l")
+
+        for node in nodes:
+            targets.extend([neighbour.index for neighbour in node.connected_to])
+            offsets.append(len(targets))
+
+        return keys, offsets, targets
+
     def dfs(self, node: Node, visited=None, order=None):
-        # Depth first search
+        """
+        Depth first search from node. Returns the nodes in the order they were visited
+        """
 
         if visited is None:
             visited = set()
@@ -67,8 +100,18 @@ class DirectedGraph:
         visited.add(node)
         order.append(node)
 
-        for neighbour in set(node.get_connections()) - visited:
-            self.dfs(neighbour, visited, order)
+        # Iterative, so that deep graphs do not run into recursion limit
+        stack = [iter(node.get_connections())]
+
+        while stack:
+            for neighbour in stack[-1]:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    order.append(neighbour)
+                    stack.append(iter(neighbour.get_connections()))
+                    break
+            else:
+                stack.pop()
 
         return order
 
@@ -93,34 +136,132 @@ class DAG(DirectedGraph):
         if node_1 != node_2:
             super().add_edge_by_node(node_1, node_2, weight)
 
-    def sort_helper(self, node_key, visited, order):
+    def get_priority(self, node_key, index):
+        """
+        When several nodes could be next in topological order, one with lowest priority is picked.
+        By default, it is the order in which nodes were added to graph
+        :param node_key: Key of node
+        :param index: Position of node in graph
+        """
+        return index
 
-        if visited[node_key] == self.BLACK:
-            return
+    def find_cycle(self, node_keys: list) -> list:
+        """
+        Find a cycle among nodes which could not be sorted.
+        Every such node has a predecessor among them, so walking back from any of them must run into a cycle
+        :param node_keys: Keys of nodes which could not be sorted, in order of graph
+        :return: Keys of nodes in cycle, in order of edges, with first node repeated at end
+        """
 
-        if visited[node_key] == self.GREY:
-            raise exceptions.OrderingException("Cycle detected in the graph. Please report it to Project Maintainer")
+        remaining = set(node_keys)
+        predecessors = {}
 
-        visited[node_key] = self.GREY
+        for node_key in node_keys:
+            for neighbour in self.get_node(node_key).get_connections():
+                neighbour_key = neighbour.get_id()
+                if neighbour_key in remaining:
+                    predecessors.setdefault(neighbour_key, node_key)
 
-        for neighbour in self.get_node(node_key).get_connections():
-            self.sort_helper(neighbour.get_id(), visited, order)
+        path = []
+        position = {}
+        node_key = node_keys[0]
 
-        visited[node_key] = self.BLACK
-        order.appendleft(node_key)
+        while node_key not in position:
+            position[node_key] = len(path)
+            path.append(node_key)
+            node_key = predecessors[node_key]
 
-    def topological_sort(self):
+        cycle = path[position[node_key]:]
+        cycle.reverse()
+
+        # Start the cycle from its first node in graph, so that same cycle is always reported same way
+        order = {key: index for index, key in enumerate(node_keys)}
+        start = min(range(len(cycle)), key=lambda index: order[cycle[index]])
+        cycle = cycle[start:] + cycle[:start]
+        return cycle + [cycle[0]]
+
+    def sort_indices(self):
         """
         Topologically sort the graph
         https://en.wikipedia.org/wiki/Topological_sorting
-        We are using DFS method
+        We are using Kahn's algorithm, which is iterative.
+        Among the nodes which are ready, node with lowest priority is picked, so order does not depend upon
+        the order in which edges were added. With the heap, it is O(V log V + E)
+
+        :return: Adjacency of graph (see get_adjacency()), and positions of nodes in sorted order
         """
 
-        visited = {_node.get_id(): self.WHITE for _node in self}
-        order = deque()
+        keys, offsets, targets = self.get_adjacency()
+        node_count = len(keys)
 
-        for node in self.get_vertices():
-            if visited[node] == self.WHITE:
-                self.sort_helper(node, visited, order)
+        in_degree = [0] * node_count
+        for neighbour in targets:
+            in_degree[neighbour] += 1
 
-        return order
+        # Index breaks ties between equal priorities, so keys are never compared
+        priorities = [self.get_priority(key, index) for index, key in enumerate(keys)]
+        ready = [(priorities[index], index) for index in range(node_count) if not in_degree[index]]
+        heapq.heapify(ready)
+        order = []
+
+        while ready:
+            _, index = heapq.heappop(ready)
+            order.append(index)
+
+            for neighbour in targets[offsets[index]:offsets[index + 1]]:
+                in_degree[neighbour] -= 1
+                if not in_degree[neighbour]:
+                    heapq.heappush(ready, (priorities[neighbour], neighbour))
+
+        if len(order) < node_count:
+            cycle = self.find_cycle([keys[index] for index in range(node_count) if in_degree[index]])
+            raise exceptions.OrderingException(
+                f"Cycle detected in the graph: {' -> '.join(str(key) for key in cycle)}. "
+                f"Please report it to Project Maintainer"
+            )
+
+        return keys, offsets, targets, order
+
+    def topological_sort(self):
+        keys, _, _, order = self.sort_indices()
+        return [keys[index] for index in order]
+
+    def is_virtual(self, node_key) -> bool:
+        """
+        Virtual nodes only connect other nodes. They are not part of any level. See topological_levels()
+        """
+        return False
+
+    def topological_levels(self) -> list:
+        """
+        Group the nodes in levels, such that nodes of a level only depend upon nodes of previous levels.
+        So, nodes of a level do not depend upon each other. Level of a node is the length of longest path to it.
+        Within a level, nodes are in order of their priority.
+
+        Edges through virtual nodes count as edges between their neighbours,
+        so virtual nodes do not push their dependents to later levels.
+
+        :return: List of levels, each of them a list of node keys
+        """
+
+        keys, offsets, targets, order = self.sort_indices()
+        node_levels = [0] * len(keys)
+        levels = []
+
+        for index in order:
+            node_level = node_levels[index]
+
+            if not self.is_virtual(keys[index]):
+                while len(levels) <= node_level:
+                    levels.append([])
+                levels[node_level].append(index)
+                node_level += 1
+
+            for neighbour in targets[offsets[index]:offsets[index + 1]]:
+                if node_levels[neighbour] < node_level:
+                    node_levels[neighbour] = node_level
+
+        return [
+            [keys[index] for index in sorted(level, key=lambda index: self.get_priority(keys[index], index))]
+            for level in levels
+        ]
@@ -0,0 +1,214 @@
+from collections import Counter
+import hashlib
+from io import open
+import json
+import marshal
+import os
+
+from atlas.conf import settings
+from atlas.modules import constants, utils
+from atlas.modules.transformer import manifest
+
+
+ORDERING_FOLDER = "ordering"
+ORDERING_FILE = "order.json"
+
+# Settings which change the order of operations
+ORDERING_SETTINGS = (
+    "SWAGGER_OPERATION_DEPENDENCIES", "SWAGGER_REFERENCE_FIELD_RESOURCE_IDENTIFIERS",
+    "SWAGGER_PATH_PARAM_RESOURCE_IDENTIFIERS"
+)
+
+# Top level Swagger keys, which are read while ordering
+ORDERING_KEYS = (constants.DEFINITIONS, constants.PARAMETERS, constants.RESPONSES, constants.PATHS)
+
+# Keys which only document the API, and have no role in ordering
+DOCUMENTATION_KEYS = {constants.DESCRIPTION, constants.TITLE, "summary", "example", "examples", "externalDocs"}
+
+# Keys whose values are maps of names (of fields, definitions, etc). Names are never documentation keys
+NAMED_KEYS = {constants.PROPERTIES, constants.DEFINITIONS, constants.PARAMETERS, constants.RESPONSES, constants.PATHS}
+
+HITS = "hits"
+MISSES = "misses"
+
+# Hit/Miss counts for current process
+stats = Counter()
+
+
+def get_ordering_subset(config, named=False):
+    """
+    Configuration without its documentation keys, so that editing descriptions or examples does not change ordering
+    :param config: Swagger configuration
+    :param named: Keys of config are names, rather than Swagger keywords
+    """
+
+    if isinstance(config, dict):
+        if named:
+            return {key: get_ordering_subset(value) for key, value in config.items()}
+        return {
+            key: get_ordering_subset(value, key in NAMED_KEYS)
+            for key, value in config.items() if key not in DOCUMENTATION_KEYS
+        }
+
+    if isinstance(config, (list, tuple)):
+        return [get_ordering_subset(value) for value in config]
+
+    return config
+
+
+class OrderingCache:
+    """
+    Stores the order of operations against a fingerprint of everything that the order depends upon:
+        - Definitions, which make the resource graph
+        - Paths, with parameters and responses of their operations, and the operations in order
+        - Ordering settings, including SWAGGER_OPERATION_DEPENDENCIES, and ATLAS code
+    Documentation keys (descriptions, examples etc) are not part of fingerprint.
+
+    If fingerprint has not changed since last order, resource and operation graphs need not be constructed at all.
+
+    Fingerprint walks the whole Swagger, which is slow for large Swagger.
+    So order is also stored against a quick digest of the exact Swagger, which is checked first.
+    Fingerprint is only taken when Swagger has changed since the cached order, or when order is saved.
+    It is always saved, so that documentation change right after a cold build does not construct the graphs again.
+
+    Sample Usage:
+        cache = OrderingCache(spec, interfaces)
+        order = cache.get()
+        if order is None:
+            ...
+            cache.save(order, no_producer_resources)
+    """
+
+    # Bump this if the format of cache changes
+    VERSION = 1
+
+    def __init__(self, spec: dict, interfaces: list, path=None):
+        self.spec = spec
+        self.interfaces = interfaces
+        self.path = path or os.path.join(
+            utils.get_project_path(), settings.OUTPUT_FOLDER, settings.CACHE_FOLDER, ORDERING_FOLDER, ORDERING_FILE
+        )
+
+        self._spec_digest = None
+        self._fingerprint = None
+
+        # Resources with no producers, as reported in the order which was read from cache
+        self.no_producer_resources = []
+
+    def get_environment(self) -> list:
+        return [
+            manifest.get_source_digest(),
+            {name: getattr(settings, name, None) for name in ORDERING_SETTINGS},
+            [interface.op_id for interface in self.interfaces]
+        ]
+
+    def get_digest(self, data) -> str:
+        """
+        Digest of environment and Swagger data. Marshal is far quicker than JSON, so it is preferred
+        """
+
+        try:
+            # Version 2 does not share objects, so output does not depend upon reference counts
+            content = marshal.dumps(data, 2)
+        except ValueError:
+            # Swagger has values which marshal does not support (eg: dates)
+            content = json.dumps(data, default=str).encode("utf-8")
+
+        return manifest.get_digest(self.get_environment(), hashlib.sha256(content).hexdigest())
+
+    @property
+    def spec_digest(self) -> str:
+        """
+        Digest of exact Swagger. It is quick, but changes with every change in Swagger
+        """
+
+        if self._spec_digest is None:
+            self._spec_digest = self.get_digest(self.spec)
+        return self._spec_digest
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Digest of Swagger without its documentation. Interfaces are constructed from paths, so paths stand for them
+        """
+
+        if self._fingerprint is None:
+            self._fingerprint = self.get_digest([
+                get_ordering_subset(self.spec.get(key) or {}, named=True) for key in ORDERING_KEYS
+            ])
+        return self._fingerprint
+
+    def read(self) -> dict:
+        try:
+            with open(self.path) as order_stream:
+                data = json.load(order_stream)
+        except (FileNotFoundError, ValueError):
+            # Missing or corrupt cache. This order would over-write it
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+
+        return data
+
+    def get(self, levels: bool = False):
+        """
+        Interfaces in cached order, if order was saved for same Swagger (or same fingerprint). Else None
+        :param levels: Return the levels of interfaces (see OperationGraph.topological_levels()) instead of order
+        """
+
+        data = self.read()
+        changed = bool(data) and data.get("spec_digest") != self.spec_digest
+
+        if not data or (changed and data.get("fingerprint") != self.fingerprint):
+            stats[MISSES] += 1
+            return None
+
+        cached = data.get("levels" if levels else "order")
+        op_ids = [op_id for level in cached for op_id in level] if (levels and cached) else cached or []
+        interface_map = {interface.op_id: interface for interface in self.interfaces}
+
+        if len(op_ids) != len(interface_map) or any(op_id not in interface_map for op_id in op_ids):
+            stats[MISSES] += 1
+            return None
+
+        if changed:
+            # Only documentation has changed. Save the new Swagger digest, so that next time it is quick
+            self.save(data.get("order"), data.get("no_producer_resources"), data.get("levels"))
+
+        stats[HITS] += 1
+        self.no_producer_resources = data.get("no_producer_resources", [])
+
+        if levels:
+            return [[interface_map[op_id] for op_id in level] for level in cached]
+        return [interface_map[op_id] for op_id in cached]
+
+    @staticmethod
+    def get_op_ids(interfaces: list) -> list:
+        return [op if isinstance(op, str) else op.op_id for op in interfaces]
+
+    def save(self, order: list, no_producer_resources=None, levels: list = None):
+        """
+        :param order: Interfaces (or their OP IDs) in order
+        :param no_producer_resources: Resources which have no producers
+        :param levels: Levels of Interfaces (or their OP IDs), if they were worked out
+        """
+
+        folder = os.path.dirname(self.path)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        data = {
+            "version": self.VERSION,
+            "spec_digest": self.spec_digest,
+            "fingerprint": self.fingerprint,
+            "order": self.get_op_ids(order),
+            "levels": [self.get_op_ids(level) for level in levels] if levels is not None else None,
+            "no_producer_resources": sorted(no_producer_resources or [])
+        }
+
+        # Write to temp file first and then move it, so that concurrent readers never see partial order
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as order_stream:
+            json.dump(data, order_stream)
+        os.replace(temp_path, self.path)
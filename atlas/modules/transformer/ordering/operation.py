@@ -6,27 +6,34 @@ from atlas.conf import settings
 class Operation(Node):
     """
     Representation for Operation Class
+    Graph has a single node for each key, so nodes compare (and hash) by identity, which is much faster than by key
     """
 
-    def __eq__(self, other):
-        return self.key == other.key
-
-    def __hash__(self):
-        return hash(self.key)
+    __slots__ = ()
 
 
 class OperationGraph(DAG):
 
     node_class = Operation
 
-    def __init__(self):
+    def __init__(self, compress: bool = None):
+        """
+        :param compress: Connect sets of operations via virtual barrier nodes. Defaults to COMPRESS_OPERATION_GRAPH
+        """
         super().__init__()
         self.operations = {}
 
+        self.compress = settings.COMPRESS_OPERATION_GRAPH if compress is None else compress
+
+        # Barrier node keys, keyed on set of parent keys which they follow
+        self.barriers = {}
+        self.barrier_keys = set()
+
     def new_graph(self, interfaces):
         for op_interface in interfaces:
-            self.add_node(op_interface.op_id)
-            self.operations[op_interface.op_id] = op_interface
+            op_id = op_interface.op_id
+            self.add_node(op_id)
+            self.operations[op_id] = op_interface
 
     def add_cartesian_edges(self, parent_keys: set, child_keys: set):
         """
@@ -51,14 +58,48 @@ class OperationGraph(DAG):
             we are looking at correct sorting
 
         Discarding 3 from parent, would make this example same as Example 1
+
+        ---- Compression ----
+        For P parents and C children, this adds P x C edges. With popular resources, it makes the graph quadratic.
+        If compression is enabled, a virtual barrier node is added instead, with P + C edges:
+            (1, 2) -> $BARRIER-0 -> (3, 4)
+        Barrier is shared by all children of same set of parents, so later children only need one edge each.
+        Every child still follows every parent, so ordering is unchanged. See get_priority()
         """
 
         parent_keys = parent_keys - child_keys
 
+        if not (parent_keys and child_keys):
+            return
+
+        barrier_key = self.get_barrier(parent_keys, len(child_keys))
+
+        if barrier_key is not None:
+            for child in child_keys:
+                self.add_edge(barrier_key, child)
+            return
+
         for parent in parent_keys:
             for child in child_keys:
                 self.add_edge(parent, child)
 
+    def get_barrier(self, parent_keys: set, child_count: int):
+        """
+        Barrier node for set of parents, if there is one, or if it reduces the edges for child_count children.
+        Returns None, if parents should be connected directly to children
+        """
+
+        parents = frozenset(parent_keys)
+        barrier_key = self.barriers.get(parents)
+
+        if barrier_key is None and self.compress and len(parents) * child_count > len(parents) + child_count:
+            barrier_key = self.barriers[parents] = f"$BARRIER-{len(self.barriers)}"
+            self.barrier_keys.add(barrier_key)
+            for parent in parents:
+                self.add_edge(parent, barrier_key)
+
+        return barrier_key
+
     def transform_operation(self, resource, parent_consumers, parent_producers):
         """
         Read Resource of Resource graph, and add edges in Operation Graph
@@ -94,28 +135,42 @@ class OperationGraph(DAG):
 
     def transform_dfs(self, resource, parent_consumers, parent_producers, visited):
         """
-        Recursive function to help perform DFS on resource graph
+        Perform DFS on resource graph, from resource
         transform_operation examines each node of Resource Graph,
             and add connections between edges of operation graph by checking the Operation relations for each resource
+
+        Iterative, so that deep resource graphs do not run into recursion limit.
+        Resources are transformed in the same order as they would be with recursion
         """
 
-        resource_key = resource.get_id()
+        # Each entry is a resource being visited, with its consumers, producers and remaining connections
+        stack = []
 
-        if visited[resource_key] == self.BLACK:
-            return
+        def enter(node, consumers, producers):
+            node_key = node.get_id()
+
+            if visited[node_key] == self.BLACK:
+                return
 
-        # Cycle Detected
-        if visited[resource_key] == self.GREY:
-            raise exceptions.OrderingException("Cycle Detected! Please report this to Project Maintainer")
+            # Cycle Detected
+            if visited[node_key] == self.GREY:
+                raise exceptions.OrderingException("Cycle Detected! Please report this to Project Maintainer")
 
-        visited[resource_key] = self.GREY
+            visited[node_key] = self.GREY
+            consumers, producers = self.transform_operation(node, consumers, producers)
+            stack.append((node_key, consumers, producers, iter(node.get_connections())))
 
-        consumers, producers = self.transform_operation(resource, parent_consumers, parent_producers)
+        enter(resource, parent_consumers, parent_producers)
 
-        for adj_resource in resource.get_connections():
-            self.transform_dfs(adj_resource, consumers, producers, visited)
+        while stack:
+            resource_key, consumers, producers, connections = stack[-1]
 
-        visited[resource_key] = self.BLACK
+            for adj_resource in connections:
+                enter(adj_resource, consumers, producers)
+                break
+            else:
+                visited[resource_key] = self.BLACK
+                stack.pop()
 
     def add_custom_ordering_dependencies(self):
         """
@@ -144,10 +199,53 @@ class OperationGraph(DAG):
                 self.transform_dfs(resource_graph.get_node(node_key), set(), set(), visited)
         self.add_custom_ordering_dependencies()
 
+    def get_priority(self, node_key, index):
+        """
+        Operations are sorted in order of their interfaces, ahead of dummy operations.
+        Dummy operations are added in order of resources' edges, which depends on set ordering, so they use their key
+
+        Barriers are picked as soon as they are ready, ahead of everything else.
+        So a child is ready at the same time as it would be with direct edges from parents, and order is unchanged
+        """
+        if node_key in self.operations:
+            return 0, index
+        if node_key in self.barrier_keys:
+            return -1, index
+        return 1, node_key
+
+    def is_virtual(self, node_key) -> bool:
+        """
+        Dummy operations and barriers are virtual
+        """
+        return node_key not in self.operations
+
+    def topological_levels(self) -> list:
+        """
+        Over-ride to:
+            1. Make sure that delete operations are in levels at end, as in topological_sort()
+            2. Return levels of interfaces rather than Operation Names
+        """
+
+        interface_levels = []
+        delete_levels = []
+
+        for level in super().topological_levels():
+            interfaces = [self.operations[op_name] for op_name in level]
+
+            interface_level = [interface for interface in interfaces if interface.method != constants.DELETE]
+            delete_level = [interface for interface in interfaces if interface.method == constants.DELETE]
+
+            if interface_level:
+                interface_levels.append(interface_level)
+            if delete_level:
+                delete_levels.append(delete_level)
+
+        return interface_levels + delete_levels
+
     def topological_sort(self):
         """
         Over-ride to do:
-            1. Remove any dummy operations
+            1. Remove any dummy operations and barriers
             2. Make sure that delete operations are ordered at end
             3. We are returning the list of interfaces rather than Operation Names
         """
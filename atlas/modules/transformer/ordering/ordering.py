@@ -1,7 +1,8 @@
+from atlas.conf import settings
 from atlas.modules import constants
 from atlas.modules.helpers.open_api_reader import SpecsFile
 from atlas.modules.transformer import open_api_models
-from atlas.modules.transformer.ordering import resource, operation
+from atlas.modules.transformer.ordering import cache as ordering_cache, resource, operation
 
 
 class Ordering:
@@ -12,8 +13,12 @@ class Ordering:
     See references/ordering.md for detailed concept on same
     """
 
-    def __init__(self, specs=None, interfaces=None):
+    def __init__(self, specs=None, interfaces=None, use_cache=None):
+        """
+        :param use_cache: Re-use the order of last run, if nothing it depends upon has changed. Defaults to ORDER_CACHE
+        """
         self.specs = specs or SpecsFile().file_load()
+        self.use_cache = settings.ORDER_CACHE if use_cache is None else use_cache
 
         if not interfaces:
             open_api = open_api_models.OpenAPISpec(self.specs)
@@ -35,7 +40,7 @@ class Ordering:
         op_graph.transform(res_graph)
         return op_graph
 
-    def order(self):
+    def order(self, levels: bool = False):
         """
         Please see references/ordering.md for details about data structures and general concepts
 
@@ -44,9 +49,29 @@ class Ordering:
             - Validating resource graph
             - Using resource graph to construct Operation Graph
             - Topologically sorting operation graph to get the required order
+
+        Order is cached (see ordering.cache), and all of these steps are skipped if cached order is still valid
+
+        :param levels: Return levels of operations, which do not depend upon each other, instead of a single order.
+            See OperationGraph.topological_levels()
         """
+
+        cache = None
+        if self.use_cache:
+            cache = ordering_cache.OrderingCache(self.specs, self.interfaces)
+            cached_order = cache.get(levels)
+            if cached_order is not None:
+                resource.SwaggerResourceValidator.report(cache.no_producer_resources)
+                return cached_order
+
         res_graph = self.get_resource_graph()
         validator = resource.SwaggerResourceValidator(res_graph, self.interfaces)
-        validator.validate()
+        no_producer_resources = validator.validate()
         op_graph = self.construct_order_graph(res_graph)
-        return op_graph.topological_sort()
+        order = op_graph.topological_sort()
+        op_levels = op_graph.topological_levels() if levels else None
+
+        if cache:
+            cache.save(order, no_producer_resources, op_levels)
+
+        return op_levels if levels else order
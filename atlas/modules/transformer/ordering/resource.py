@@ -1,5 +1,5 @@
 from atlas.modules import constants, exceptions, utils
-from atlas.modules.helpers import open_api
+from atlas.modules.helpers import open_api, references
 from atlas.modules.transformer.ordering.base import Node, DAG
 
 
@@ -70,6 +70,8 @@ class Resource(Node):
     Representation for Resource Class
     """
 
+    __slots__ = ("producers", "consumers", "destructors")
+
     def __init__(self, key):
         super(Resource, self).__init__(key)
 
@@ -174,7 +176,7 @@ class ResourceGraph(DAG):
 
             parameter_ref = parameter.get(constants.REF)
             if parameter_ref:
-                parameter = utils.resolve_reference(self.specs, parameter_ref)
+                parameter = references.resolve(self.specs, parameter_ref)
 
             resource = parameter.get(constants.RESOURCE)
             if resource:
@@ -213,27 +215,62 @@ class ResourceGraph(DAG):
 
         In this case, any consumer of A should NOT count as producer of B.
         This function finds such connections, and remove these attributes
+
+        Edges go from B to A. So, producers of a resource lose all consumers of resources reachable from it.
+
+        Consumers reachable from each resource are worked out once, children before parents (reverse topological order).
+        Operations are numbered, and sets of consumers are bit masks (python int), so union of two sets is a single OR.
+        Mask of a resource is dropped once all its parents have used it.
         """
 
-        visited = {_node: self.WHITE for _node in self}
+        keys, offsets, targets, order = self.sort_indices()
+        nodes = list(self)
+
+        # Bit of each consumer operation
+        bits = {}
+        for node in nodes:
+            for op_id in node.consumers:
+                bits.setdefault(op_id, len(bits))
+
+        parent_count = [0] * len(nodes)
+        for target in targets:
+            parent_count[target] += 1
 
-        for node in visited.keys():
-            if visited[node] == self.WHITE:
-                self.remove_dependent_producers_helper(node, visited)
+        # Consumers of resource and all resources reachable from it
+        reachable_consumers = {}
 
-    def remove_dependent_producers_helper(self, resource, visited):
+        for index in reversed(order):
+            node = nodes[index]
+            child_consumers = 0
 
-        child_consumers = set()
+            for child in targets[offsets[index]:offsets[index + 1]]:
+                child_consumers |= reachable_consumers[child]
+                parent_count[child] -= 1
+                if not parent_count[child]:
+                    del reachable_consumers[child]
 
-        for adj_resource in resource.get_connections():
-            child_consumers.update(self.remove_dependent_producers_helper(adj_resource, visited))
+            if child_consumers:
+                node.producers.difference_update([
+                    op_id for op_id in node.producers if op_id in bits and child_consumers >> bits[op_id] & 1
+                ])
 
-        # Remove all producers which consume Children
-        resource.producers -= child_consumers
+            if parent_count[index]:
+                reachable_consumers[index] = child_consumers | self.get_mask(node.consumers, bits)
 
-        visited[resource] = self.BLACK
+    @staticmethod
+    def get_mask(op_ids: set, bits: dict) -> int:
+        """
+        Bit mask of operations
+        """
 
-        return child_consumers | resource.consumers
+        if not op_ids:
+            return 0
+
+        positions = [bits[op_id] for op_id in op_ids]
+        mask = bytearray(max(positions) // 8 + 1)
+        for position in positions:
+            mask[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(mask, "little")
 
 
 class SwaggerResourceValidator:
@@ -261,12 +298,20 @@ class SwaggerResourceValidator:
 
         return no_producer_resources
 
-    def validate(self):
-
-        no_producer_resources = self.get_resources_with_no_producers()
+    @staticmethod
+    def report(no_producer_resources):
 
         if no_producer_resources:
             print(
                 f"\nHINT: ATLAS cannot find API which produces the resources: '{', '.join(no_producer_resources)}'. "
                 f"You may need to add their DB mapping in conf/resource_mapping.yaml\n"
             )
+
+    def validate(self):
+        """
+        Report the resources which have no producers, and return them
+        """
+
+        no_producer_resources = self.get_resources_with_no_producers()
+        self.report(no_producer_resources)
+        return no_producer_resources
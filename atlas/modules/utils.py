@@ -21,7 +21,8 @@ def get_ref_path_array(ref_definition: str) -> list:
     else:
         raise exceptions.ImproperSwaggerException("We only support Local references")
 
-    return ref
+    # Reference is a JSON Pointer, where "~1" stands for "/" and "~0" for "~" (in this order)
+    return [element.replace("~1", "/").replace("~0", "~") for element in ref]
 
 
 def get_ref_name(ref_definition: str):
@@ -40,7 +41,12 @@ def resolve_reference(spec, ref_definition):
     """
 
     for ref_element in get_ref_path_array(ref_definition):
-        spec = spec.get(ref_element)
+        if isinstance(spec, list):
+            if not (ref_element.isdigit() and int(ref_element) < len(spec)):
+                raise exceptions.ImproperSwaggerException(f"Cannot find reference {ref_element} in {spec}")
+            spec = spec[int(ref_element)]
+        else:
+            spec = spec.get(ref_element)
 
         if not spec:
             raise exceptions.ImproperSwaggerException(f"Cannot find reference {ref_element} in {spec}")
@@ -127,3 +133,52 @@ def operation_id_name(url, method) -> str:
         op_name_array.append(_name)
 
     return "_".join(op_name_array)
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} can not be modified")
+
+
+class FrozenDict(dict):
+    """
+    Dict which can not be modified once created.
+    Useful when same object is shared by different consumers, each of whom could otherwise modify it for others.
+    """
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class FrozenList(list):
+    """
+    List which can not be modified once created. See FrozenDict
+    """
+
+    __setitem__ = __delitem__ = append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __iadd__ = __imul__ = _immutable
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+def freeze(data, _memo=None):
+    """
+    Return immutable copy of data, where all dicts and lists (at any depth) are frozen.
+    Objects shared in data remain shared in copy.
+    """
+
+    _memo = {} if _memo is None else _memo
+
+    if isinstance(data, (FrozenDict, FrozenList)) or not isinstance(data, (dict, list)):
+        return data
+
+    if id(data) not in _memo:
+        if isinstance(data, dict):
+            _memo[id(data)] = FrozenDict((key, freeze(value, _memo)) for key, value in data.items())
+        else:
+            _memo[id(data)] = FrozenList(freeze(element, _memo) for element in data)
+
+    return _memo[id(data)]
@@ -0,0 +1,91 @@
+"""
+Single place for YAML reads and writes in ATLAS.
+
+libyaml based Loader/Dumper are an order of magnitude faster than pure python ones.
+We use them whenever PyYAML is built with libyaml, and fall back to pure python implementation otherwise.
+"""
+
+import yaml
+
+
+HAS_LIBYAML = getattr(yaml, "__with_libyaml__", False)
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader) if HAS_LIBYAML else yaml.SafeLoader
+BaseDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper) if HAS_LIBYAML else yaml.SafeDumper
+
+
+class Dumper(BaseDumper):
+    """
+    Safe Dumper, which also writes tuples as YAML lists.
+    Default Dumper writes them as python specific tags, which can not be read back by safe loaders.
+    """
+
+
+Dumper.add_representer(tuple, Dumper.represent_list)
+
+
+class NoAliasDumper(Dumper):
+    """
+    Dumper which writes shared objects in full wherever they appear, instead of as YAML anchors and aliases
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def load(stream):
+    """
+    Safely load YAML from string or stream
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data, stream=None, aliases=True, **kwargs):
+    """
+    Dump data as YAML to stream. If stream is None, return the YAML string
+    :param aliases: If False, shared objects are written in full wherever they appear
+    """
+    kwargs.setdefault("default_flow_style", False)
+    return yaml.dump(data, stream, Dumper=Dumper if aliases else NoAliasDumper, **kwargs)
+
+
+def _sorted_items(items: list) -> list:
+    # Same as Representer, which sorts the keys, unless they are not comparable
+    try:
+        return sorted(items)
+    except TypeError:
+        return items
+
+
+def normalize(data, _memo=None):
+    """
+    Return data as it would be read back by `load` after being written by `dump`.
+    Mappings and sets get sorted keys, and tuples become lists. Containers shared in data remain shared.
+
+    This lets build stages hand over data in-memory instead of via files, with no change in their output.
+    """
+
+    _memo = {} if _memo is None else _memo
+
+    if not isinstance(data, (dict, list, tuple, set)):
+        return data
+
+    # Empty tuples are never aliased by Dumper
+    if isinstance(data, tuple) and not data:
+        return []
+
+    if id(data) in _memo:
+        return _memo[id(data)]
+
+    if isinstance(data, dict):
+        ret = _memo[id(data)] = {}
+        for key, value in _sorted_items(list(data.items())):
+            ret[key] = normalize(value, _memo)
+    elif isinstance(data, set):
+        ret = _memo[id(data)] = set()
+        ret.update(key for key, _ in _sorted_items([(key, None) for key in data]))
+    else:
+        ret = _memo[id(data)] = []
+        ret.extend(normalize(element, _memo) for element in data)
+
+    return ret
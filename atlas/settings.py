@@ -20,6 +20,7 @@ class Settings:
     PROFILES_FILE = "profiles.yaml"
     RESOURCES_FOLDER = "resources"
     DIST_FOLDER = "dist"
+    CACHE_FOLDER = ".cache"     # Created inside OUTPUT_FOLDER
     DUMMY_FILES_FOLDER = "sample-files"
     CREDENTIALS_FILE = "credentials.yaml"
 
@@ -29,6 +30,7 @@ class Settings:
     ARTILLERY_FOLDER = "artillery"
     ARTILLERY_PROFILES = "profiles.js"
     ARTILLERY_RESOURCES = "resources.js"
+    ARTILLERY_RESOURCE_POOL = "resources.pool"
     ARTILLERY_FILE = "processor.js"
     ARTILLERY_YAML = "artillery.yaml"
     ARTILLERY_HOOK_FILE = "hooks.js"
@@ -63,6 +65,9 @@ class Settings:
 
     LOAD_TEST_SCENARIOS = {}
 
+    # Run the operations which do not depend upon each other as Artillery "parallel" steps, instead of one by one
+    LOAD_TEST_PARALLEL_STEPS = False
+
     # ###### User defined settings
 
     DATABASE = {
@@ -71,7 +76,10 @@ class Settings:
         "user": "",
         "password": "",
         "host": "",
-        "port": ""
+        "port": "",
+        # Connections are pooled. Pool should have at least as many connections as FETCH_DATA_JOBS
+        "max_connections": 20,
+        "stale_timeout": 300    # Seconds after which idle connection is not re-used
     }
 
     # Page Query Parameters
@@ -98,3 +106,33 @@ class Settings:
 
     SPAWN_RATE = 1  # Rate at which VUs will spawn
     DURATION = 1  # Duration for which VUs will spawn and run
+
+    # ### Build Performance settings
+    # Cache the parsed Swagger in OUTPUT_FOLDER, so that unchanged Swagger is not parsed again in subsequent commands
+    SPEC_CACHE = True
+
+    # Re-use the generated output of operations which have not changed since last transform (via Build Manifest)
+    INCREMENTAL_BUILD = True
+
+    # Cache the order of operations in OUTPUT_FOLDER, so that it is not worked out again for unrelated Swagger changes
+    ORDER_CACHE = True
+
+    # Order operations via virtual barrier nodes between sets of producers and consumers of a resource.
+    # Number of edges in Operation graph grows linearly instead of quadratically, while the order remains the same
+    COMPRESS_OPERATION_GRAPH = True
+
+    # Number of threads which fetch resources (fetch_data) concurrently, each with its own connection from DB pool.
+    # With more than 1, mappers and scripts in Resource Mapping hooks must be thread-safe
+    FETCH_DATA_JOBS = 1
+
+    # Run SQL queries (after formatting with Profile) and scripts (with their arguments) once for all profiles of
+    # fetch_data, and re-use their results, instead of running them again for every profile
+    FETCH_DATA_DEDUPLICATE = True
+
+    # Seconds for which results of resource queries are served from a cache in OUTPUT_FOLDER, instead of the database.
+    # 0 disables the cache. Resources (or $globals) could override it with "cache_ttl"
+    FETCH_DATA_CACHE_TTL = 0
+
+    # fetch_data writes resources of each profile in compact binary pool file, which transform reads.
+    # Also write them as YAML file, which is slower and larger, but easier to read while debugging
+    RESOURCES_YAML_EXPORT = False
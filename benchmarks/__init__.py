@@ -0,0 +1,8 @@
+"""
+Benchmarks for ATLAS build pipeline.
+
+These are not part of test suite. Run them from project root, eg:
+    python -m benchmarks.bench_yaml_io
+
+bench_pipeline compares its results with JSON baselines in benchmarks/baselines, to detect regressions between releases
+"""
@@ -0,0 +1,71 @@
+"""
+Benchmark ResourceGraph.remove_dependent_producers on definitions which share nested definitions heavily.
+Each definition refers to 3 previous definitions, without limit on nesting depth.
+Compares with previous recursive implementation, which visits shared definitions again for every path to them.
+
+Run: python -m benchmarks.bench_dependent_producers
+"""
+
+from unittest import mock
+
+from atlas.modules.transformer import open_api_models
+from atlas.modules.transformer.ordering.ordering import Ordering
+from atlas.modules.transformer.ordering.resource import ResourceGraph
+from benchmarks import synthetic
+from benchmarks.utils import measure, print_table
+
+
+def recursive_remove(graph):
+
+    def helper(resource):
+        child_consumers = set()
+        for adj_resource in resource.get_connections():
+            child_consumers.update(helper(adj_resource))
+        resource.producers -= child_consumers
+        return child_consumers | resource.consumers
+
+    for node in graph:
+        helper(node)
+
+
+def get_resource_graph(definitions: int) -> ResourceGraph:
+    spec = synthetic.generate_spec(definitions, paths=definitions * 5, ref_fan_out=3)
+    open_api = open_api_models.OpenAPISpec(spec)
+    open_api.get_interfaces()
+
+    with mock.patch.object(ResourceGraph, "remove_dependent_producers"):
+        return Ordering(spec, open_api.interfaces, use_cache=False).get_resource_graph()
+
+
+def main():
+    rows = []
+
+    for definitions in [15, 20, 25, 1000, 10000]:
+        graph = get_resource_graph(definitions)
+        producers = {node.key: set(node.producers) for node in graph}
+
+        def remove(func):
+            for node in graph:
+                node.producers = set(producers[node.key])
+            func()
+            return {node.key: node.producers for node in graph}
+
+        result = remove(graph.remove_dependent_producers)
+        recursive = "-"
+        if definitions <= 25:
+            assert remove(lambda: recursive_remove(graph)) == result
+            recursive = f"{measure(remove, lambda: recursive_remove(graph), repeat=1):.3f}"
+
+        rows.append([
+            definitions, graph.node_count, sum(len(node.connected_to) for node in graph), recursive,
+            f"{measure(remove, graph.remove_dependent_producers):.3f}"
+        ])
+
+    print_table(
+        "ResourceGraph.remove_dependent_producers (seconds)",
+        ["definitions", "resources", "edges", "recursive", "memoized"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark fetch_data with 200 table resources and 2 profiles, against SQLite with simulated network round-trip.
+Compares serial fetch with fetch by pools of threads, with and without de-duplication of queries across profiles.
+Queries do not refer to profile configuration, so they are same for both profiles.
+Also compares fetch with results served from on-disk cache (cache_ttl), on first and later runs.
+
+Run: python -m benchmarks.bench_fetch_data
+"""
+
+import os
+import sqlite3
+import time
+from unittest import mock
+
+from atlas.conf import settings
+from atlas.modules.resource_data_generator.database import client as db_client
+from atlas.modules.resource_data_generator import generators
+from benchmarks.utils import print_table, project
+
+# Round-trip latency of each query, in seconds
+LATENCY = 0.01
+
+RESOURCES = 200
+
+
+execute_sql = db_client.Client.execute_sql
+iter_rows = db_client.Client.iter_rows
+
+
+def execute_with_latency(self, sql):
+    time.sleep(LATENCY)
+    return execute_sql(self, sql)
+
+
+def iter_rows_with_latency(self, sql, *args, **kwargs):
+    time.sleep(LATENCY)
+    return iter_rows(self, sql, *args, **kwargs)
+
+
+def create_database(path: str):
+    connection = sqlite3.connect(path)
+    connection.execute("create table items (id integer primary key, kind integer)")
+    connection.execute("create index items_kind on items (kind)")
+    connection.executemany("insert into items values (?, ?)", [(idx, idx % RESOURCES) for idx in range(20000)])
+    connection.commit()
+    connection.close()
+
+
+def fetch(jobs: int, deduplicate: bool, profiles: dict, resource_map: dict, name: str = "") -> list:
+    db_client.stats.clear()
+    generators.stats.clear()
+
+    start = time.perf_counter()
+    with mock.patch.object(settings, "FETCH_DATA_DEDUPLICATE", deduplicate):
+        generator = generators.ProfileResourceDataGenerator(
+            resource_map=resource_map, profile_configs=profiles, jobs=jobs
+        )
+    generator.parse()
+    elapsed = time.perf_counter() - start
+
+    return [
+        name, jobs, "yes" if deduplicate else "no", f"{elapsed:.3f}", generators.stats[generators.REQUESTED],
+        db_client.stats[db_client.QUERIES]
+    ]
+
+
+def main():
+    profiles = {"profile_1": {}, "profile_2": {}}
+    resource_map = {f"resource_{idx}": {"table": "items", "filters": f"kind = {idx}"} for idx in range(RESOURCES)}
+    rows = []
+
+    with project({}, profiles=profiles) as path:
+        database = os.path.join(path, "bench.sqlite")
+        create_database(database)
+
+        with mock.patch.dict(settings.DATABASE, engine="sqlite", name=database):
+            with mock.patch.object(db_client.Client, "execute_sql", execute_with_latency):
+                with mock.patch.object(db_client.Client, "iter_rows", iter_rows_with_latency):
+                    for deduplicate in [False, True]:
+                        for jobs in [1, 4, 16]:
+                            rows.append(fetch(jobs, deduplicate, profiles, resource_map))
+
+                    cached_map = {**resource_map, "$globals": {"cache_ttl": 3600}}
+                    rows.append(fetch(4, True, profiles, cached_map, "cache, first run"))
+                    rows.append(fetch(4, True, profiles, cached_map, "cache, next run"))
+
+    print_table(
+        f"fetch_data of {RESOURCES} resources x {len(profiles)} profiles, {LATENCY * 1000:.0f}ms per query",
+        ["cache", "jobs", "deduplicate", "seconds", "requested", "queries"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
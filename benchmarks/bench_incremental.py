@@ -0,0 +1,73 @@
+"""
+Benchmark refresh of a resource pool of 100k IDs, from a table of 1M rows in SQLite, after 1000 rows are added.
+Compares full fetch of pool with incremental fetch of rows newer than last watermark.
+
+Run: python -m benchmarks.bench_incremental
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from unittest import mock
+
+from atlas.conf import settings
+from atlas.modules.resource_data_generator import generators, watermarks
+from benchmarks.utils import print_table
+
+ROWS = 1000000
+NEW_ROWS = 1000
+POOL_SIZE = 100000
+
+
+def create_database(path: str):
+    connection = sqlite3.connect(path)
+    connection.execute("create table events (id integer primary key, kind integer, created real)")
+    connection.execute("create index events_created on events (created)")
+    connection.executemany("insert into events values (?, ?, ?)", ((idx, idx % 7, idx) for idx in range(ROWS)))
+    connection.commit()
+    connection.close()
+
+
+def add_rows(path: str):
+    connection = sqlite3.connect(path)
+    connection.executemany(
+        "insert into events values (?, ?, ?)", ((idx, idx % 7, idx) for idx in range(ROWS, ROWS + NEW_ROWS))
+    )
+    connection.commit()
+    connection.close()
+
+
+def refresh(name: str, store_path: str, full_refresh: bool) -> list:
+    config = {"table": "events", "watermark": "created", "filters": "kind != 3", "sample_size": POOL_SIZE}
+
+    generator = generators.ProfileResourceDataGenerator(resource_map={}, profile_configs={}, full_refresh=full_refresh)
+    generator.watermarks = watermarks.WatermarkStore(store_path)
+    generator.active_profile, generator.active_profile_config = "profile", {}
+
+    start = time.perf_counter()
+    pool = generator.parse_for_resource("event", config)
+    generator.watermarks.save()
+    elapsed = time.perf_counter() - start
+
+    generator.client.close_all()
+    return [name, len(pool), f"{elapsed:.3f}"]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as path:
+        database = os.path.join(path, "bench.sqlite")
+        store_path = os.path.join(path, "watermarks.json")
+        create_database(database)
+
+        with mock.patch.dict(settings.DATABASE, engine="sqlite", name=database):
+            rows = [refresh("first fetch", store_path, False)]
+            add_rows(database)
+            rows.append(refresh(f"incremental, {NEW_ROWS} new rows", store_path, False))
+            rows.append(refresh("full refresh", store_path, True))
+
+    print_table(f"Pool of {POOL_SIZE} IDs from {ROWS} rows", ["fetch", "ids", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
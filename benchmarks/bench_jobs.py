@@ -0,0 +1,40 @@
+"""
+Benchmark parallel task generation (`atlas transform --jobs N`) on a spec with 3000 operations.
+Swagger is parsed before timing starts. Build Manifest is not used, so that every task is generated.
+
+Run: python -m benchmarks.bench_jobs
+"""
+
+import os
+import time
+
+from atlas.modules.helpers import pipeline
+from atlas.modules.transformer.commands.converter import Converter
+from benchmarks import synthetic
+from benchmarks.utils import print_table, project
+
+
+def transform(jobs: int) -> float:
+    context = pipeline.PipelineContext()
+    context.specs    # Parse the swagger upfront
+
+    start = time.perf_counter()
+    Converter().handle(type="artillery", incremental=False, jobs=jobs, context=context)
+    return time.perf_counter() - start
+
+
+def main():
+    spec = synthetic.generate_spec(definitions=600, nesting_depth=5, extra_properties=10)
+    rows = []
+
+    with project(spec):
+        serial = transform(jobs=1)
+        for jobs in sorted({1, 2, 4, os.cpu_count() or 1}):
+            elapsed = serial if jobs == 1 else transform(jobs)
+            rows.append([jobs, f"{elapsed:.3f}", f"{serial / elapsed:.1f}x"])
+
+    print_table("Transform of 3000 operations (seconds)", ["jobs", "transform", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
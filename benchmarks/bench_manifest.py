@@ -0,0 +1,58 @@
+"""
+Benchmark incremental transform via Build Manifest, on a spec with 3000 operations.
+Compares full transform, re-transform of unchanged spec, and re-transform after a single endpoint is edited.
+Swagger is parsed before timing starts, since parsing the edited swagger does not depend upon the manifest.
+
+Run: python -m benchmarks.bench_manifest
+"""
+
+import os
+import time
+
+from atlas.conf import settings
+from atlas.modules import yaml_io
+from atlas.modules.helpers import pipeline
+from atlas.modules.transformer import manifest
+from atlas.modules.transformer.commands.converter import Converter
+from benchmarks import synthetic
+from benchmarks.utils import print_table, project
+
+
+def transform(incremental=True) -> list:
+    manifest.stats.clear()
+
+    context = pipeline.PipelineContext()
+    context.specs    # Parse the swagger upfront
+
+    start = time.perf_counter()
+    Converter().handle(type="artillery", incremental=incremental, context=context)
+    elapsed = time.perf_counter() - start
+
+    return [f"{elapsed:.3f}", manifest.stats[manifest.REUSED], manifest.stats[manifest.GENERATED]]
+
+
+def edit_endpoint(spec: dict):
+    operation = spec["paths"]["/resource7s/"]["get"]
+    operation["parameters"].append({"in": "query", "name": "search", "type": "string"})
+
+    with open(os.path.join(settings.OUTPUT_FOLDER, settings.SWAGGER_FILE), "w") as spec_file:
+        yaml_io.dump(spec, spec_file)
+
+
+def main():
+    spec = synthetic.generate_spec(definitions=600, nesting_depth=5, extra_properties=10)
+    rows = []
+
+    with project(spec):
+        rows.append(["full"] + transform(incremental=False))
+        rows.append(["first incremental"] + transform())
+        rows.append(["unchanged"] + transform())
+
+        edit_endpoint(spec)
+        rows.append(["one endpoint edited"] + transform())
+
+    print_table("Transform of 3000 operations (seconds)", ["build", "transform", "reused", "generated"], rows)
+
+
+if __name__ == "__main__":
+    main()
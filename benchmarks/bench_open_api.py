@@ -0,0 +1,54 @@
+"""
+Benchmark Ordering.get_resource_graph, where every property of every definition is viewed via open_api.ElementConfig.
+Compares zero-copy views with previous implementation, which deep-copied every property configuration.
+
+Run: python -m benchmarks.bench_open_api
+"""
+
+from copy import deepcopy
+from unittest import mock
+
+from atlas.modules import constants
+from atlas.modules.helpers import open_api
+from atlas.modules.transformer.ordering.ordering import Ordering
+from benchmarks import synthetic
+from benchmarks.utils import measure, print_table
+
+
+def resolve_config_with_copy(self):
+    config = deepcopy(self.config)
+    _type = config.get(constants.TYPE)
+    if _type == constants.ARRAY:
+        config = config.get(constants.ITEMS, {})
+    return config
+
+
+def bench(name, spec, repeat=3):
+    order = Ordering(spec)
+
+    with mock.patch.object(open_api.ElementConfig, "resolve_config", resolve_config_with_copy):
+        with_copy = measure(order.get_resource_graph, repeat=repeat)
+
+    view = measure(order.get_resource_graph, repeat=repeat)
+
+    properties = sum(
+        len(config.get(constants.PROPERTIES, {})) for config in spec[constants.DEFINITIONS].values()
+    )
+
+    return [name, properties, f"{with_copy:.3f}", f"{view:.3f}", f"{with_copy / view:.1f}x"]
+
+
+def main():
+    rows = [
+        bench("200 defs", synthetic.generate_spec(definitions=200, nesting_depth=5, extra_properties=20)),
+        bench("1000 defs", synthetic.generate_spec(definitions=1000, nesting_depth=5, extra_properties=20)),
+        bench("1000 defs, wide", synthetic.generate_spec(definitions=1000, nesting_depth=5, extra_properties=100)),
+    ]
+
+    print_table(
+        "Ordering.get_resource_graph (seconds)", ["spec", "properties", "deepcopy", "view", "speedup"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
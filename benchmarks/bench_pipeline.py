@@ -0,0 +1,140 @@
+"""
+Benchmark how stages of transform scale with API size, on synthetic specs:
+    - OpenAPISpec.get_interfaces
+    - Ordering.get_resource_graph, Ordering.construct_order_graph and OperationGraph.topological_sort
+    - Task construction for all operations
+    - ArtilleryFileConfig.convert
+
+Results could be saved as JSON baseline, and later runs compared with it to detect regressions between releases.
+Baselines are only comparable on the same machine, so the environment is stored along with them, and regressions
+do not fail the run if the environment differs. Single runs are too noisy to compare, so baseline is only saved
+or compared with at least MIN_REPEAT runs of each benchmark (best of them is taken).
+
+Run: python -m benchmarks.bench_pipeline [--cases small medium] [--save] [--baseline PATH] [--tolerance 0.25]
+"""
+
+import argparse
+from copy import deepcopy
+import os
+import sys
+
+from atlas.modules.transformer import open_api_models
+from atlas.modules.transformer.artillery import models, transformer
+from atlas.modules.transformer.ordering.ordering import Ordering
+from benchmarks import synthetic
+from benchmarks.utils import (
+    compare_results, get_environment, measure, measure_with_setup, print_table, project, read_environment,
+    read_results, write_results
+)
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "pipeline.json")
+
+# Parameters of synthetic spec for each case
+CASES = {
+    "small": {"definitions": 100, "ref_fan_out": 2, "nesting_depth": 5, "extra_properties": 10, "resource_fields": 3},
+    "medium": {"definitions": 500, "ref_fan_out": 2, "nesting_depth": 5, "extra_properties": 10, "resource_fields": 3},
+    "large": {"definitions": 2000, "ref_fan_out": 2, "nesting_depth": 5, "extra_properties": 10, "resource_fields": 3},
+    "deep": {"definitions": 500, "ref_fan_out": 3, "nesting_depth": 8, "extra_properties": 5, "resource_fields": 3},
+    # Each resource refers to previous one, so resource graph is a chain, deeper than the recursion limit
+    "chain": {"definitions": 1500, "ref_fan_out": 0, "extra_properties": 5, "resource_fields": 2},
+}
+
+MIN_REPEAT = 3
+
+
+def get_interfaces(spec: dict) -> list:
+    open_api = open_api_models.OpenAPISpec(spec)
+    open_api.get_interfaces()
+    return open_api.interfaces
+
+
+def get_tasks(interfaces: list, spec: dict) -> list:
+    return [models.Task(interface, spec) for interface in interfaces]
+
+
+def convert(tasks: list, spec: dict) -> str:
+    return transformer.ArtilleryFileConfig(models.TaskSet(tasks), spec).convert()
+
+
+def bench(spec: dict, repeat: int) -> dict:
+    """
+    Time each stage. Stages which modify their input are given a fresh copy on every run
+    """
+
+    # Getting interfaces modifies spec, so rest of the stages work on modified spec, as they do in transform
+    timings = {"get_interfaces": measure_with_setup(get_interfaces, lambda: (deepcopy(spec),), repeat=repeat)}
+    interfaces = get_interfaces(spec)
+
+    order = Ordering(spec, interfaces, use_cache=False)
+    timings["get_resource_graph"] = measure(order.get_resource_graph, repeat=repeat)
+    timings["construct_order_graph"] = measure_with_setup(
+        order.construct_order_graph, lambda: (order.get_resource_graph(), ), repeat=repeat
+    )
+
+    op_graph = order.construct_order_graph(order.get_resource_graph())
+    timings["topological_sort"] = measure(op_graph.topological_sort, repeat=repeat)
+    sorted_interfaces = op_graph.topological_sort()
+
+    # References are resolved once per spec, and then shared. So each run gets a spec whose references are unresolved
+    timings["tasks"] = measure_with_setup(get_tasks, lambda: (sorted_interfaces, deepcopy(spec)), repeat=repeat)
+    timings["convert"] = measure_with_setup(
+        convert, lambda: (get_tasks(sorted_interfaces, spec), spec), repeat=repeat
+    )
+
+    return {name: round(seconds, 6) for name, seconds in timings.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=MIN_REPEAT)
+    parser.add_argument("--baseline", default=BASELINE, help="Baseline to compare with, or to save to")
+    parser.add_argument("--save", action="store_true", help="Save results as baseline")
+    parser.add_argument("--output", help="Also write results to this file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slow down w.r.t baseline, as fraction of baseline"
+    )
+    args = parser.parse_args(argv)
+
+    if args.repeat < MIN_REPEAT and (args.save or os.path.exists(args.baseline)):
+        parser.error(f"--repeat should be at least {MIN_REPEAT} to save or compare with baseline")
+
+    results = {}
+    for case in args.cases:
+        spec = synthetic.generate_spec(**CASES[case])
+        with project(spec):
+            results[case] = bench(spec, args.repeat)
+
+    if args.output:
+        write_results(args.output, results)
+
+    if args.save:
+        if os.path.exists(args.baseline):
+            # Keep the cases which were not run this time
+            results = {**read_results(args.baseline), **results}
+        write_results(args.baseline, results)
+        print_table("Transform stages (seconds)", ["case", "benchmark", "seconds"], [
+            [case, name, f"{seconds:.4f}"] for case, timings in results.items() for name, seconds in timings.items()
+        ])
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = read_results(args.baseline) if os.path.exists(args.baseline) else {}
+    rows, regressions = compare_results(results, baseline, args.tolerance)
+    print_table(
+        "Transform stages (seconds)", ["case", "benchmark", "baseline", "current", "change", "status"], rows
+    )
+
+    if not regressions:
+        return 0
+
+    print(f"\n{len(regressions)} benchmarks are slower than baseline by more than {args.tolerance:.0%}")
+
+    if read_environment(args.baseline) != get_environment():
+        print("Baseline was recorded in another environment, so timings are not comparable. Save a baseline here")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+Compare YAML resource files with binary resource pool files (atlas.modules.resource_pool), for a profile with
+10 resources of 100k IDs each, as integers and as strings.
+
+Run: python -m benchmarks.bench_resource_pool
+"""
+
+import io
+
+from atlas.modules import resource_pool, yaml_io
+from benchmarks import synthetic
+from benchmarks.utils import measure, print_table
+
+RESOURCES = 10
+POOL_SIZE = 100000
+
+
+def bench(name, data, repeat=1):
+    yaml_content = yaml_io.dump(data)
+    pool_content = resource_pool.dumps(data)
+
+    assert resource_pool.loads(pool_content) == data
+
+    write_yaml = measure(yaml_io.dump, data, io.StringIO(), repeat=repeat)
+    write_pool = measure(resource_pool.dumps, data, repeat=repeat)
+    read_yaml = measure(yaml_io.load, yaml_content, repeat=repeat)
+    read_pool = measure(resource_pool.loads, pool_content, repeat=repeat)
+
+    return [
+        name, f"{len(yaml_content.encode('utf-8')) / 2 ** 20:.1f}", f"{len(pool_content) / 2 ** 20:.1f}",
+        f"{write_yaml:.3f}", f"{write_pool:.3f}", f"{write_yaml / write_pool:.0f}x",
+        f"{read_yaml:.3f}", f"{read_pool:.3f}", f"{read_yaml / read_pool:.0f}x",
+    ]
+
+
+def main():
+    integers = synthetic.generate_resources(resources=RESOURCES, pool_size=POOL_SIZE)
+    strings = {key: {f"{value:032x}" for value in values} for key, values in integers.items()}
+
+    rows = [bench("integer IDs", integers), bench("string IDs", strings)]
+
+    print_table(
+        f"Resources of a profile ({RESOURCES}x{POOL_SIZE // 1000}k), size in MB and time in seconds",
+        ["IDs", "YAML MB", "pool MB", "write YAML", "write pool", "speedup", "read YAML", "read pool", "speedup"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark peak memory and time of fetching IDs from a table of 1M rows in SQLite.
+Compares fetchall (previous implementation of fetch_ids), streamed fetch_ids, and reservoir sample of 10k rows.
+
+Run: python -m benchmarks.bench_sampling
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+from atlas.conf import settings
+from atlas.modules.resource_data_generator.database import client as db_client, utils
+from benchmarks.utils import print_table
+
+ROWS = 1000000
+SAMPLE_SIZE = 10000
+
+
+def create_database(path: str):
+    connection = sqlite3.connect(path)
+    connection.execute("create table items (id integer primary key, name text)")
+    connection.executemany("insert into items values (?, ?)", ((idx, f"item {idx}") for idx in range(ROWS)))
+    connection.commit()
+    connection.close()
+
+
+def bench(name: str, func, *args) -> list:
+    """
+    Time is measured without tracing memory, since tracing slows down allocations a lot
+    """
+
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return [name, len(result), f"{elapsed:.3f}", f"{peak / 2 ** 20:.1f}"]
+
+
+def main():
+    sql = "select id from items"
+
+    with tempfile.TemporaryDirectory() as path:
+        database = os.path.join(path, "bench.sqlite")
+        create_database(database)
+
+        with mock.patch.dict(settings.DATABASE, engine="sqlite", name=database):
+            client = db_client.Client()
+            rows = [
+                bench("fetchall", client.fetch_rows, sql, utils.flatten_list_of_tuples),
+                bench("streamed", client.fetch_ids, sql),
+                bench(f"reservoir {SAMPLE_SIZE}", client.fetch_sample_ids, sql, SAMPLE_SIZE),
+            ]
+            client.close_all()
+
+    print_table(f"IDs from {ROWS} rows", ["fetch", "ids", "seconds", "peak MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark `atlas transform` (Converter.handle) on a spec, where most operations share a few deeply nested definitions.
+Compares shared resolved schema cache with resolving every reference in every Task.
+
+Run: python -m benchmarks.bench_schema_resolver
+"""
+
+from unittest import mock
+
+from atlas.modules.helpers import references, swagger_schema_resolver
+from atlas.modules.transformer.commands.converter import Converter
+from benchmarks import synthetic
+from benchmarks.utils import measure, print_table, project
+
+
+def resolve_reference_without_cache(self, ref, is_field=False):
+    return self.resolve(references.resolve(self.spec, ref), is_field)
+
+
+def convert():
+    Converter().handle(type="artillery")
+
+
+def bench(name, spec, repeat=3):
+
+    with project(spec):
+        with mock.patch.object(
+                swagger_schema_resolver.SchemaResolver, "resolve_reference", resolve_reference_without_cache
+        ):
+            without_cache = measure(convert, repeat=repeat)
+
+        swagger_schema_resolver.stats.clear()
+        with_cache = measure(convert, repeat=repeat)
+        stats = dict(swagger_schema_resolver.stats)
+
+    return [
+        name, len(spec["paths"]) * 5 // 2, f"{without_cache:.3f}", f"{with_cache:.3f}",
+        f"{without_cache / with_cache:.1f}x", stats.get(swagger_schema_resolver.HITS, 0) // repeat,
+        stats.get(swagger_schema_resolver.MISSES, 0) // repeat
+    ]
+
+
+def main():
+    rows = [
+        bench("10 defs, depth 5", synthetic.generate_spec(definitions=10, paths=100, nesting_depth=5)),
+        bench("10 defs, depth 10", synthetic.generate_spec(definitions=10, paths=100, nesting_depth=10)),
+        bench("20 defs, depth 12", synthetic.generate_spec(definitions=20, paths=200, nesting_depth=12), repeat=1),
+    ]
+
+    print_table(
+        "Converter.handle (seconds)",
+        ["spec", "operations", "no cache", "cache", "speedup", "hits", "misses"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark DAG.topological_sort as graph grows to 100k nodes, for a chain and for random sparse DAGs.
+Compares with previous recursive DFS based sort, which runs into recursion limit on deep graphs.
+
+Run: python -m benchmarks.bench_topological_sort
+"""
+
+from collections import deque
+import random
+
+from atlas.modules.transformer.ordering.base import DAG
+from benchmarks.utils import measure, print_table
+
+
+def recursive_sort(graph):
+    visited = {node.get_id(): DAG.WHITE for node in graph}
+    order = deque()
+
+    def sort_helper(node_key):
+        if visited[node_key] == DAG.BLACK:
+            return
+        visited[node_key] = DAG.GREY
+        for neighbour in graph.get_node(node_key).get_connections():
+            sort_helper(neighbour.get_id())
+        visited[node_key] = DAG.BLACK
+        order.appendleft(node_key)
+
+    for node_key in graph.get_vertices():
+        if visited[node_key] == DAG.WHITE:
+            sort_helper(node_key)
+
+    return order
+
+
+def chain(size: int) -> DAG:
+    graph = DAG()
+    for idx in range(size - 1):
+        graph.add_edge(idx, idx + 1)
+    return graph
+
+
+def random_dag(size: int, edges_per_node: int = 3) -> DAG:
+    generator = random.Random(size)
+    graph = DAG()
+    for idx in range(size):
+        graph.add_node(idx)
+    for idx in range(1, size):
+        for _ in range(edges_per_node):
+            graph.add_edge(generator.randrange(idx), idx)
+    return graph
+
+
+def bench(name, graph):
+    kahn = measure(graph.topological_sort)
+
+    try:
+        recursive = f"{measure(recursive_sort, graph):.3f}"
+    except RecursionError:
+        recursive = "RecursionError"
+
+    edges = sum(len(node.connected_to) for node in graph)
+    return [name, graph.node_count, edges, recursive, f"{kahn:.3f}"]
+
+
+def main():
+    rows = []
+    for size in [1000, 10000, 100000]:
+        rows.append(bench("chain", chain(size)))
+        rows.append(bench("random", random_dag(size)))
+
+    print_table("DAG.topological_sort (seconds)", ["graph", "nodes", "edges", "recursive dfs", "kahn"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark peak memory of transform as number of scenarios grows, on a spec with 3000 operations.
+Every scenario has all the operations. Output is streamed, so peak should not grow with scenarios x operations.
+
+Run: python -m benchmarks.bench_writer
+"""
+
+import time
+import tracemalloc
+from unittest import mock
+
+from atlas.conf import settings
+from atlas.modules.helpers import pipeline
+from atlas.modules.transformer.commands.converter import Converter
+from benchmarks import synthetic
+from benchmarks.utils import print_table, project
+
+
+def transform(scenarios: dict) -> list:
+    context = pipeline.PipelineContext()
+    context.specs    # Parse the swagger upfront
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with mock.patch.object(settings, "LOAD_TEST_SCENARIOS", scenarios):
+        Converter().handle(type="artillery", incremental=False, context=context)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return [f"{elapsed:.3f}", f"{peak / 2 ** 20:.1f}"]
+
+
+def main():
+    spec = synthetic.generate_spec(definitions=600, nesting_depth=5, extra_properties=10)
+    op_ids = [
+        f"{method.upper()} {url}" for url, config in spec["paths"].items() for method in config if method != "parameters"
+    ]
+    counts = [1, 10, 20]
+    rows = []
+
+    # Scenarios are only part of output if some profile runs them
+    profiles = {"profile_1": {"scenarios": [f"scenario{idx}" for idx in range(max(counts))]}}
+
+    with project(spec, profiles=profiles):
+        for count in counts:
+            scenarios = {f"scenario{idx}": list(op_ids) for idx in range(count)}
+            rows.append([count] + transform(scenarios))
+
+    print_table("Transform of 3000 operations", ["scenarios", "seconds", "peak MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare pure python YAML read/write with libyaml backed atlas.modules.yaml_io
+
+Run: python -m benchmarks.bench_yaml_io
+"""
+
+import io
+
+import yaml
+
+from atlas.modules import yaml_io
+from benchmarks import synthetic
+from benchmarks.utils import measure, print_table
+
+
+def pure_load(content):
+    return yaml.safe_load(content)
+
+
+def pure_dump(data):
+    return yaml.dump(data, io.StringIO(), default_flow_style=False)
+
+
+def bench(name, data, repeat=3):
+    content = yaml_io.dump(data)
+
+    read_pure = measure(pure_load, content, repeat=repeat)
+    read_fast = measure(yaml_io.load, content, repeat=repeat)
+    write_pure = measure(pure_dump, data, repeat=repeat)
+    write_fast = measure(yaml_io.dump, data, io.StringIO(), repeat=repeat)
+
+    return [
+        name, f"{len(content) / 1024:.0f} KB",
+        f"{read_pure:.3f}", f"{read_fast:.3f}", f"{read_pure / read_fast:.1f}x",
+        f"{write_pure:.3f}", f"{write_fast:.3f}", f"{write_pure / write_fast:.1f}x",
+    ]
+
+
+def main():
+    if not yaml_io.HAS_LIBYAML:
+        print("PyYAML is not built with libyaml. yaml_io falls back to pure python, so there is no speedup")
+
+    rows = [
+        bench("spec (200 defs)", synthetic.generate_spec(definitions=200)),
+        bench("spec (1000 defs)", synthetic.generate_spec(definitions=1000), repeat=1),
+        bench("resources (50x1k)", synthetic.generate_resources(resources=50, pool_size=1000)),
+        bench("resources (10x20k)", synthetic.generate_resources(resources=10, pool_size=20000), repeat=1),
+    ]
+
+    print_table(
+        "YAML read/write (seconds)",
+        ["input", "size", "read py", "read C", "speedup", "write py", "write C", "speedup"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
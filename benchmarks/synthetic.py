@@ -0,0 +1,138 @@
+"""
+Synthetic Swagger 2 specifications, to measure how ATLAS scales with API size
+"""
+
+
+def definition_name(index: int) -> str:
+    return f"Model{index}"
+
+
+def resource_name(index: int) -> str:
+    # Resources of path parameters are looked up as definitions, so resource is named after its definition
+    return definition_name(index).lower()
+
+
+def make_definition(
+        index: int, ref_fan_out: int, nesting_depth: int = None, extra_properties: int = 0, resource_fields: int = 0
+) -> dict:
+    properties = {
+        "id": {"type": "integer", "readOnly": True},
+        "name": {"type": "string", "maxLength": 100, "description": f"Name of {definition_name(index)}"},
+        "created": {"type": "string", "format": "date-time"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    }
+
+    for field_index in range(extra_properties):
+        properties[f"field{field_index}"] = {
+            "type": "string",
+            "description": f"Field {field_index} of {definition_name(index)}",
+            "enum": [f"choice_{choice}" for choice in range(5)],
+            "x-nullable": True,
+        }
+
+    # Only refer to previous definitions, so that definitions do not have cycles
+    # With nesting depth, definitions are in groups of that size, and only refer to definitions in their group
+    first_index = index - index % nesting_depth if nesting_depth else 0
+
+    if resource_fields:
+        # ID is the primary resource of definition, and rest of the fields hold IDs of previous definitions
+        properties["id"]["resource"] = resource_name(index)
+        for ref_index in range(max(first_index, index - resource_fields + 1), index):
+            properties[f"{resource_name(ref_index)}_id"] = {"type": "integer", "resource": resource_name(ref_index)}
+
+    for ref_index in range(max(first_index, index - ref_fan_out), index):
+        properties[f"model{ref_index}"] = {"$ref": f"#/definitions/{definition_name(ref_index)}"}
+
+    return {"type": "object", "required": ["name"], "properties": properties}
+
+
+def make_paths(index: int, definition_index: int = None, resource_fields: int = 0) -> dict:
+    """
+    CRUD paths for resource, whose body and responses refer to definition
+    """
+    name = f"resource{index}"
+    ref = {"$ref": f"#/definitions/{definition_name(index if definition_index is None else definition_index)}"}
+    url = f"/{name}s/"
+
+    id_parameter = {"in": "path", "name": "id", "type": "integer", "required": True}
+    if resource_fields:
+        id_parameter["resource"] = resource_name(index if definition_index is None else definition_index)
+
+    return {
+        url: {
+            "get": {
+                "operationId": f"{name}_list",
+                "parameters": [{"in": "query", "name": "page", "type": "integer"}],
+                "responses": {"200": {"description": "List", "schema": {"type": "array", "items": ref}}}
+            },
+            "post": {
+                "operationId": f"{name}_create",
+                "parameters": [{"in": "body", "name": "data", "required": True, "schema": ref}],
+                "responses": {"201": {"description": "Created", "schema": ref}}
+            }
+        },
+        url + "{id}/": {
+            "parameters": [id_parameter],
+            "get": {
+                "operationId": f"{name}_read",
+                "responses": {"200": {"description": "Detail", "schema": ref}}
+            },
+            "put": {
+                "operationId": f"{name}_update",
+                "parameters": [{"in": "body", "name": "data", "required": True, "schema": ref}],
+                "responses": {"200": {"description": "Updated", "schema": ref}}
+            },
+            "delete": {
+                "operationId": f"{name}_delete",
+                "responses": {"204": {"description": "Deleted"}}
+            }
+        }
+    }
+
+
+def generate_spec(
+        definitions: int = 100, paths: int = None, ref_fan_out: int = 2, nesting_depth: int = None,
+        extra_properties: int = 0, resource_fields: int = 0
+) -> dict:
+    """
+    :param definitions: Number of definitions
+    :param paths: Number of resources with CRUD paths. Defaults to number of definitions.
+        Each of them adds 2 URLs and 5 operations, and refers to a definition (round-robin)
+    :param ref_fan_out: Number of other definitions each definition refers to
+    :param nesting_depth: Maximum depth of nested references in a definition. Defaults to no limit.
+        Since definition refers to ref_fan_out previous definitions, resolved size of definitions grows
+        exponentially with depth
+    :param extra_properties: Number of plain properties added to each definition, apart from the standard ones
+    :param resource_fields: Number of resource ID fields in each definition. First of them is ID of definition itself
+        (also used as resource of path parameters), and rest are IDs of previous definitions in the same group.
+        Defaults to no resources
+    """
+
+    paths = definitions if paths is None else paths
+
+    spec = {
+        "swagger": "2.0",
+        "info": {"title": "Synthetic API", "version": "1.0"},
+        "host": "localhost:8080",
+        "basePath": "/v1",
+        "schemes": ["http"],
+        "consumes": ["application/json"],
+        "produces": ["application/json"],
+        "paths": {},
+        "definitions": {
+            definition_name(idx): make_definition(idx, ref_fan_out, nesting_depth, extra_properties, resource_fields)
+            for idx in range(definitions)
+        }
+    }
+
+    for idx in range(paths):
+        spec["paths"].update(make_paths(idx, idx % definitions, resource_fields))
+
+    return spec
+
+
+def generate_resources(resources: int = 50, pool_size: int = 1000) -> dict:
+    """
+    Resource pool for a single profile, as written by resource data generator
+    """
+    return {f"resource_{idx}": set(range(idx * pool_size, (idx + 1) * pool_size)) for idx in range(resources)}
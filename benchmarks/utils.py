@@ -0,0 +1,152 @@
+import contextlib
+import json
+import os
+import platform
+import tempfile
+import time
+
+from atlas.conf import settings
+from atlas.modules import yaml_io
+
+
+def measure(func, *args, repeat: int = 3, **kwargs) -> float:
+    """
+    Run the function repeat times and return the best wall time in seconds
+    """
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure_with_setup(func, setup, repeat: int = 3) -> float:
+    """
+    Like measure, but with fresh arguments for each run, for functions which modify their input.
+    Setup returns the arguments of func, and is not timed
+    """
+
+    timings = []
+    for _ in range(repeat):
+        args = setup()
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(title: str, header: list, rows: list):
+    widths = [max(len(str(row[idx])) for row in [header] + rows) for idx in range(len(header))]
+
+    print(f"\n{title}")
+    for row in [header] + rows:
+        print("  ".join(str(value).rjust(widths[idx]) for idx, value in enumerate(row)))
+
+
+@contextlib.contextmanager
+def project(spec: dict, profiles: dict = None, resources: dict = None):
+    """
+    Create a temporary ATLAS project with spec as built Swagger, and switch to it.
+    :param spec: Swagger
+    :param profiles: Contents of profiles file. Defaults to single profile
+    :param resources: Resources for each profile
+    """
+
+    profiles = profiles or {"profile_1": {}}
+    resources = resources or {}
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as path:
+        for folder in [
+            settings.INPUT_FOLDER,
+            os.path.join(settings.OUTPUT_FOLDER, settings.RESOURCES_FOLDER),
+            os.path.join(settings.OUTPUT_FOLDER, settings.ARTILLERY_FOLDER, settings.ARTILLERY_LIB_FOLDER),
+        ]:
+            os.makedirs(os.path.join(path, folder))
+
+        files = [
+            (os.path.join(settings.INPUT_FOLDER, settings.SWAGGER_FILE), spec),
+            (os.path.join(settings.OUTPUT_FOLDER, settings.SWAGGER_FILE), spec),
+            (os.path.join(settings.INPUT_FOLDER, settings.PROFILES_FILE), profiles),
+        ]
+        files.extend(
+            (os.path.join(settings.OUTPUT_FOLDER, settings.RESOURCES_FOLDER, f"{profile}.yaml"),
+             resources.get(profile, {}))
+            for profile in profiles
+        )
+
+        for file_name, data in files:
+            with open(os.path.join(path, file_name), "w") as file_stream:
+                yaml_io.dump(data, file_stream)
+
+        os.chdir(path)
+        try:
+            yield path
+        finally:
+            os.chdir(cwd)
+
+
+def get_environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count()
+    }
+
+
+def write_results(path: str, results: dict):
+    """
+    Write benchmark results (map of case to map of benchmark to seconds) as JSON, along with environment they ran in
+    """
+
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+
+    with open(path, "w") as results_file:
+        json.dump({"environment": get_environment(), "results": results}, results_file, indent=2, sort_keys=True)
+        results_file.write("\n")
+
+
+def read_results(path: str) -> dict:
+    with open(path) as results_file:
+        return json.load(results_file).get("results", {})
+
+
+def read_environment(path: str) -> dict:
+    with open(path) as results_file:
+        return json.load(results_file).get("environment", {})
+
+
+def compare_results(results: dict, baseline: dict, tolerance: float, min_delta: float = 0.005) -> tuple:
+    """
+    Compare results with baseline.
+    A benchmark has regressed if it is slower than baseline by more than tolerance (fraction of baseline),
+    and by more than min_delta seconds, so that noise in very quick benchmarks is not reported.
+    :return: Table rows and list of regressed (case, benchmark)
+    """
+
+    rows = []
+    regressions = []
+
+    for case, timings in results.items():
+        for name, seconds in timings.items():
+            base = baseline.get(case, {}).get(name)
+
+            if base is None:
+                rows.append([case, name, "-", f"{seconds:.4f}", "-", "new"])
+                continue
+
+            change = (seconds - base) / base if base else 0
+            status = "ok"
+            if seconds > base * (1 + tolerance) and seconds - base > min_delta:
+                status = "REGRESSED"
+                regressions.append((case, name))
+
+            rows.append([case, name, f"{base:.4f}", f"{seconds:.4f}", f"{change:+.0%}", status])
+
+    return rows, regressions
@@ -0,0 +1,36 @@
+const resourcePool = require('../atlas/modules/data_provider/artillery/resourcePool');
+
+
+// Pools written by atlas.modules.resource_pool.dumps
+const POOLS = Buffer.from(
+    "QVRSUAEAAAAGAAAACwAAAHByb2ZpbGU6aWRzAQMAAAADAAAAAQAAAAIAAAALAAAAcHJvZmlsZTpiaWcCAQAAAAAAAAAAAQAADQAAAHByb2Zp" +
+    "bGU6ZmxvYXQDAQAAAAAAAAAAAPg/DQAAAHByb2ZpbGU6bmFtZXMEAgAAAAEAAAACAAAAYcO8DQAAAHByb2ZpbGU6bWl4ZWQFAwAAAA4AAABb" +
+    "MSwgImEiLCBudWxsXQ0AAABwcm9maWxlOmVtcHR5AQAAAAA=",
+    "base64"
+);
+
+
+describe('resource pool test cases', () => {
+
+    test('decode reads all types of pools', () => {
+        expect(resourcePool.decode(POOLS)).toEqual({
+            "profile:ids": [3, 1, 2],
+            "profile:big": [2 ** 40],
+            "profile:float": [1.5],
+            "profile:names": ["a", "ü"],
+            "profile:mixed": [1, "a", null],
+            "profile:empty": []
+        });
+    });
+
+    test('decode raises error for other files', () => {
+        expect(() => resourcePool.decode(Buffer.from("profile:\n  ids: [1]\n"))).toThrow();
+    });
+
+    test('decode raises error for other versions', () => {
+        const pools = Buffer.from(POOLS);
+        pools.writeUInt32LE(2, 4);
+
+        expect(() => resourcePool.decode(pools)).toThrow();
+    });
+});
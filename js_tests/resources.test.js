@@ -1,4 +1,5 @@
 const Resource = require('../atlas/modules/data_provider/artillery/resources').Resource;
+const resourcePool = require('../atlas/modules/data_provider/artillery/resourcePool');
 
 
 const resourceInstance = Resource.instance;
@@ -128,6 +129,19 @@ describe('resource test cases', () => {
         });
     });
 
+    test('loadPool sets non-empty resources', () => {
+        const read = jest.spyOn(resourcePool, 'read').mockReturnValue({
+            [Resource.getKey("profile", "resource")]: [1, 2, 3],
+            [Resource.getKey("profile", "empty")]: []
+        });
+
+        resourceInstance.loadPool("resources.pool");
+
+        expect(read).toBeCalledWith("resources.pool");
+        expect(resourceInstance.resources).toEqual({[Resource.getKey("profile", "resource")]: new Set([1, 2, 3])});
+        read.mockRestore();
+    });
+
     test('deleteResource deletes resource', () => {
         resourceInstance.resources = {
             [Resource.getKey("profile", "resource")]: new Set([1, 2, 3])
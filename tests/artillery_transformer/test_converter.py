@@ -1,10 +1,16 @@
+import json
 import os
+import shutil
+import subprocess
 from unittest import mock
 
 import pytest
 import yaml
 
-from atlas.modules.transformer.commands.converter import Converter
+from atlas.modules.commands.base import CommandError
+from atlas.modules.helpers import pipeline
+from atlas.modules.transformer.commands.converter import Converter, CONVERTER_MAP
+from atlas.modules.transformer import interface
 from atlas.conf import settings
 
 
@@ -47,3 +53,254 @@ class TestArtilleryConverter:
                 {"function": "endResponse"},
             ]
             assert contents["scenarios"][0]["name"] == "default"
+
+
+class TestConverterTasks:
+
+    load_conf = CONVERTER_MAP["artillery"]
+
+    @pytest.fixture
+    def interfaces(self):
+        interfaces = []
+        for url in ["/pets", "/users"]:
+            op = interface.OpenAPITaskInterface()
+            op.method = "get"
+            op.url = url
+            op.func_name = url.strip("/")
+            interfaces.append(op)
+        return interfaces
+
+    def test_get_tasks_without_manifest(self, interfaces):
+        tasks = Converter.get_tasks(self.load_conf, interfaces, {})
+        assert all(isinstance(task, self.load_conf["task"]) for task in tasks)
+
+    def test_get_tasks_with_manifest(self, interfaces):
+        manifest = mock.MagicMock()
+        manifest.get.side_effect = [None, {"statements": ["reused"], "width": 1}]
+
+        tasks = Converter.get_tasks(self.load_conf, interfaces, {}, manifest)
+
+        assert isinstance(tasks[0], self.load_conf["task"])
+        assert isinstance(tasks[1], self.load_conf["fragment"])
+        assert tasks[1].convert(1) == ["reused"]
+        assert manifest.fingerprint.call_count == 2
+
+    def test_record_tasks(self, interfaces):
+        manifest = mock.MagicMock()
+        tasks = Converter.get_tasks(self.load_conf, interfaces, {})
+        for task in tasks:
+            task.convert(1)
+
+        Converter.record_tasks(self.load_conf, tasks, manifest)
+
+        assert manifest.record.call_args_list == [
+            mock.call("GET /pets", mock.ANY), mock.call("GET /users", mock.ANY)
+        ]
+        manifest.save.assert_called_once()
+
+
+class TestConverterJobs:
+
+    @staticmethod
+    def make_spec():
+        paths = {}
+        for idx in range(8):
+            ref = {"$ref": f"#/definitions/Model{idx % 3}"}
+            paths[f"/resource{idx}s/{{id}}/"] = {
+                "parameters": [{"in": "path", "name": "id", "type": "integer", "required": True}],
+                "get": {
+                    "operationId": f"resource{idx}_read",
+                    "resourceDependencies": {f"resource_{name}" for name in "abcdefgh"},
+                    "responses": {"200": {"description": "Detail", "schema": ref}}
+                },
+                "put": {
+                    "operationId": f"resource{idx}_update",
+                    "tags": ["update"],
+                    "parameters": [{"in": "body", "name": "data", "required": True, "schema": ref}],
+                    "responses": {"200": {"description": "Updated", "schema": ref}}
+                }
+            }
+
+        return {
+            "swagger": "2.0",
+            "host": "localhost",
+            "basePath": "/v1",
+            "paths": paths,
+            "definitions": {
+                f"Model{idx}": {"type": "object", "properties": {
+                    "id": {"type": "integer", "readOnly": True},
+                    "name": {"type": "string", "maxLength": 10 + idx},
+                }} for idx in range(3)
+            }
+        }
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        os.makedirs(tmp_path / settings.OUTPUT_FOLDER / settings.ARTILLERY_FOLDER)
+        os.makedirs(tmp_path / settings.INPUT_FOLDER)
+        (tmp_path / settings.INPUT_FOLDER / settings.PROFILES_FILE).write_text("profile_1: {}\n")
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def convert(self, project, **options) -> tuple:
+        context = pipeline.PipelineContext()
+        context.specs = self.make_spec()
+
+        with mock.patch('atlas.modules.transformer.commands.converter.yaml_to_js.Converter'):
+            Converter().handle(type="artillery", context=context, **options)
+
+        output_folder = project / settings.OUTPUT_FOLDER / settings.ARTILLERY_FOLDER
+        return tuple(
+            (output_folder / file_name).read_bytes() for file_name in [settings.ARTILLERY_FILE, settings.ARTILLERY_YAML]
+        )
+
+    def test_output_is_deterministic(self, project):
+        serial = self.convert(project, jobs=1, incremental=False)
+
+        assert self.convert(project, jobs=3, incremental=False) == serial
+        assert self.convert(project, jobs=3, incremental=False) == serial
+
+    def test_output_with_manifest(self, project):
+        serial = self.convert(project, jobs=1, incremental=False)
+
+        assert self.convert(project, jobs=3, incremental=True) == serial
+        assert self.convert(project, jobs=1, incremental=True) == serial
+
+    def test_dependent_resources_are_sorted(self, project):
+        processor, _ = self.convert(project, jobs=3, incremental=False)
+
+        related = str([f"resource_{name}" for name in "abcdefgh"])
+        assert f"provider.getRelatedResources({related});".encode() in processor
+
+    def test_parallel_steps(self, project):
+        with mock.patch.object(settings, "LOAD_TEST_PARALLEL_STEPS", True):
+            _, artillery_yaml = self.convert(project, incremental=False)
+
+        flow = yaml.safe_load(artillery_yaml)["scenarios"][0]["flow"]
+        steps = [step for item in flow[2:-1] for step in item.get("parallel", [item])]
+
+        assert "parallel" in flow[2]
+        assert len(steps) == 16
+
+    @pytest.mark.parametrize("jobs", [0, -1])
+    def test_invalid_jobs(self, jobs):
+        with pytest.raises(CommandError):
+            Converter().handle(type="artillery", jobs=jobs)
+
+
+# Stand-ins for libraries which processor requires, recording what requests do with them
+PROCESSOR_LIBS = {
+    "node_modules/lodash/index.js": """
+exports.cloneDeep = value => JSON.parse(JSON.stringify(value || {}));
+exports.forIn = (object, func) => Object.keys(object).forEach(key => func(object[key], key));
+exports.assign = Object.assign;
+""",
+    "hooks.js": "exports.hookRegister = [];",
+    "libs/hooks.js": "exports.hook = {call: (name, ...args) => args};",
+    "libs/settings.js": "",
+    "libs/profiles.js": "exports.profiles = {};",
+    "libs/influx.js": "exports.client = {writeMeasurement: () => null};",
+    "libs/statsCollector.js": """
+exports.StatsCollector = class {
+    constructor() { this.rows = []; }
+    write(row) { this.rows.push({url: row.url, statusCode: row.statusCode, timed: row.startTime > 0}); }
+};
+""",
+    "libs/providers.js": """
+exports.rollbacks = [];
+exports.Provider = class {
+    constructor(profile) { this.profile = profile; }
+    resolveObject(config) {
+        return Object.fromEntries(Object.entries(config).map(([key, value]) => [key, value.resource + "-1"]));
+    }
+    rollBackDelete(resource, value) { exports.rollbacks.push([this.profile, resource, value]); }
+    reset() {}
+};
+exports.ResponseDataParser = class {};
+""",
+}
+
+# Both requests of parallel step are sent before either of them gets its response. Pets fail, and Owners succeed
+PARALLEL_REQUESTS = """
+const processor = require('./processor');
+const providers = require('./libs/providers');
+const StatsCollector = require('./libs/statsCollector').StatsCollector;
+
+const context = {vars: {provider: new providers.Provider('profile_1'), stats: new StatsCollector()}, _uid: 1};
+const ee = {emit: () => null};
+const next = () => null;
+const pets = {}, owners = {};
+
+processor.petsDeletePreReq(pets, context, ee, next);
+processor.ownersDeletePreReq(owners, context, ee, next);
+processor.petsDeletePostRes(pets, {statusCode: 500, request: {method: 'DELETE'}}, context, ee, next);
+processor.ownersDeletePostRes(owners, {statusCode: 204, request: {method: 'DELETE'}}, context, ee, next);
+
+const result = {urls: [pets.url, owners.url], stats: context.vars.stats.rows, rollbacks: providers.rollbacks};
+console.log(JSON.stringify(result));
+"""
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="Node is needed to run processor")
+class TestParallelSteps:
+
+    @staticmethod
+    def make_spec():
+        paths = {
+            f"/{name}s/{{id}}/": {"delete": {
+                "operationId": f"{name}s_delete",
+                "parameters": [{"in": "path", "name": "id", "type": "integer", "required": True, "resource": name}],
+                "responses": {"204": {"description": "Deleted"}}
+            }} for name in ["pet", "owner"]
+        }
+
+        return {
+            "swagger": "2.0",
+            "host": "localhost",
+            "basePath": "/v1",
+            "paths": paths,
+            "definitions": {
+                name.title(): {"type": "object", "properties": {"id": {"type": "integer", "resource": name}}}
+                for name in ["pet", "owner"]
+            }
+        }
+
+    @pytest.fixture
+    def output_folder(self, tmp_path, monkeypatch):
+        os.makedirs(tmp_path / settings.OUTPUT_FOLDER / settings.ARTILLERY_FOLDER)
+        os.makedirs(tmp_path / settings.INPUT_FOLDER)
+        (tmp_path / settings.INPUT_FOLDER / settings.PROFILES_FILE).write_text("profile_1: {}\n")
+        monkeypatch.chdir(tmp_path)
+
+        context = pipeline.PipelineContext()
+        context.specs = self.make_spec()
+
+        with mock.patch.object(settings, "LOAD_TEST_PARALLEL_STEPS", True):
+            with mock.patch('atlas.modules.transformer.commands.converter.yaml_to_js.Converter'):
+                Converter().handle(type="artillery", context=context, incremental=False)
+
+        output_folder = tmp_path / settings.OUTPUT_FOLDER / settings.ARTILLERY_FOLDER
+        for file_name, content in PROCESSOR_LIBS.items():
+            os.makedirs((output_folder / file_name).parent, exist_ok=True)
+            (output_folder / file_name).write_text(content)
+        (output_folder / "run.js").write_text(PARALLEL_REQUESTS)
+
+        return output_folder
+
+    def test_requests_keep_their_own_state(self, output_folder):
+        with open(output_folder / settings.ARTILLERY_YAML) as yaml_file:
+            flow = yaml.safe_load(yaml_file)["scenarios"][0]["flow"]
+        assert [step["delete"]["url"] for step in flow[2]["parallel"]] == ["/owners/{id}/", "/pets/{id}/"]
+
+        output = subprocess.run(
+            ["node", "run.js"], cwd=output_folder, capture_output=True, text=True, check=True
+        ).stdout
+
+        assert json.loads(output) == {
+            "urls": ["/pets/pet-1/", "/owners/owner-1/"],
+            "stats": [
+                {"url": "/pets/{id}/", "statusCode": 500, "timed": True},
+                {"url": "/owners/{id}/", "statusCode": 204, "timed": True},
+            ],
+            "rollbacks": [["profile_1", "pet", "pet-1"]]
+        }
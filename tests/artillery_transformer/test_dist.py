@@ -3,6 +3,7 @@ from os import path
 from unittest import mock
 
 from atlas.modules.transformer.artillery.dist import ArtilleryDist, settings
+from atlas.modules.transformer.commands.dist import Dist
 
 
 class TestDist:
@@ -159,3 +160,39 @@ class TestDist:
         instance.create_folder('folder')
 
         patched_makedir.assert_called()
+
+
+class TestDistCommand:
+
+    @mock.patch('atlas.modules.transformer.commands.dist.Dist.artillery_dist')
+    @mock.patch('atlas.modules.transformer.commands.dist.converter')
+    @mock.patch('atlas.modules.transformer.commands.dist.setup')
+    @mock.patch('atlas.modules.transformer.commands.dist.fetch_data')
+    @mock.patch('atlas.modules.transformer.commands.dist.create_resource')
+    @mock.patch('atlas.modules.transformer.commands.dist.validate')
+    def test_pipeline_with_profile(self, *patched_stages):
+        profiler = Dist.get_profiler(profile=True)
+        profiler.write_report = mock.MagicMock(return_value="")
+
+        with mock.patch.object(Dist, "get_profiler", return_value=profiler):
+            Dist().handle(
+                type="artillery", validate=True, detect_resources=True, fetch_data=True, setup=True, profile=True
+            )
+
+        assert [stage["name"] for stage in profiler.get_report()["stages"]] == [
+            "validate", "detect_resources", "fetch_data", "setup", "transform", "dist"
+        ]
+        profiler.write_report.assert_called_once_with()
+        for patched_stage in patched_stages:
+            assert patched_stage.mock_calls
+
+    def test_get_profiler(self):
+        assert not Dist.get_profiler().enabled
+
+        profiler = Dist.get_profiler(profile=True)
+        assert profiler.enabled and not profiler.trace_memory
+        assert set(profiler.counters) == {
+            "refs_resolved", "sql_queries", "resource_fetches", "resource_fetches_reused", "resource_cache_hits"
+        }
+
+        assert Dist.get_profiler(profile_memory=True).trace_memory
@@ -3,7 +3,8 @@ from unittest import mock
 import pytest
 
 from atlas.modules.transformer.base.models import ResourceFieldMap
-from atlas.modules.transformer.artillery.models import Task, constants
+from atlas.modules.transformer.artillery.models import Task, TaskFragment, TaskSet, constants
+from atlas.modules import exceptions
 from atlas.modules.transformer import interface
 
 
@@ -56,7 +57,7 @@ class TestTask:
         instance.delete_url_resource = ResourceFieldMap('resource', 'name')
 
         assert (
-            "context.vars._delete_resource = { resource: 'resource', value: urlConfig[1].name };"
+            "requestState.deleteResource = { resource: 'resource', value: urlConfig[1].name };"
             in instance.body_definition()
         )
 
@@ -121,3 +122,84 @@ class TestTask:
 
         statements = instance.convert(0)
         assert len(statements) == 3
+
+
+class TestTaskFragment:
+
+    @pytest.fixture
+    def task(self):
+        open_api = interface.OpenAPITaskInterface()
+        open_api.method = constants.GET
+        open_api.url = "/pets"
+        open_api.func_name = "list_pets"
+
+        task = Task(open_api)
+        task.convert(1)
+        return task
+
+    def test_from_task(self, task):
+        fragment = TaskFragment.from_task(task)
+
+        assert fragment.open_api_op is task.open_api_op
+        assert fragment.before_func_name == "listPetsPreReq"
+        assert fragment.yaml_task == task.yaml_task
+        assert fragment.convert(1) == task.statements
+
+    def test_state_round_trip(self, task):
+        state = TaskFragment.from_task(task).get_state()
+
+        assert "open_api_op" not in state
+        assert TaskFragment(task.open_api_op, state).get_state() == state
+
+    def test_convert_with_other_width(self, task):
+        with pytest.raises(exceptions.ImproperInterfaceException):
+            TaskFragment.from_task(task).convert(2)
+
+
+class TestTaskSet:
+
+    @pytest.fixture
+    def tasks(self):
+        tasks = []
+        for name in ["a", "b", "c", "d"]:
+            open_api = interface.OpenAPITaskInterface()
+            open_api.method = constants.GET
+            open_api.url = f"/{name}"
+            task = Task(open_api)
+            task.yaml_task = {"get": {"url": f"/{name}"}}
+            tasks.append(task)
+        return tasks
+
+    @staticmethod
+    def get_flow(task_set, scenario):
+        task_set.construct_task_map()
+        return task_set.make_yaml_scenario("default", scenario)["flow"][2:-1]
+
+    def test_make_yaml_scenario(self, tasks):
+        task_set = TaskSet(tasks)
+
+        assert self.get_flow(task_set, ["GET /a", "GET /b"]) == [{"get": {"url": "/a"}}, {"get": {"url": "/b"}}]
+
+    def test_make_yaml_scenario_with_levels(self, tasks):
+        task_set = TaskSet(tasks, levels=[["GET /a", "GET /b", "GET /c"], ["GET /d"]])
+
+        assert self.get_flow(task_set, ["GET /a", "GET /b", "GET /c", "GET /d"]) == [
+            {"parallel": [{"get": {"url": "/a"}}, {"get": {"url": "/b"}}, {"get": {"url": "/c"}}]},
+            {"get": {"url": "/d"}}
+        ]
+
+    def test_make_yaml_scenario_with_levels_keeps_scenario_order(self, tasks):
+        task_set = TaskSet(tasks, levels=[["GET /a", "GET /b", "GET /c"], ["GET /d"]])
+
+        assert self.get_flow(task_set, ["GET /a", "GET /d", "GET /b", "GET /b", "GET /c"]) == [
+            {"get": {"url": "/a"}},
+            {"get": {"url": "/d"}},
+            {"get": {"url": "/b"}},
+            {"parallel": [{"get": {"url": "/b"}}, {"get": {"url": "/c"}}]}
+        ]
+
+    def test_make_yaml_scenario_with_invalid_key(self, tasks):
+        task_set = TaskSet(tasks, levels=[["GET /a"]])
+
+        with pytest.raises(exceptions.InvalidSettingsException):
+            self.get_flow(task_set, ["GET /x"])
@@ -0,0 +1,42 @@
+import io
+from unittest import mock
+
+import pytest
+
+from atlas.modules import yaml_io
+from atlas.modules.transformer.artillery.transformer import ArtilleryFileConfig
+
+
+class TestArtilleryFileConfig:
+
+    @pytest.fixture
+    def task_set(self):
+        task = {"get": {"url": "/pets/" + "very-long-segment/" * 10, "beforeRequest": "listPetsPreReq"}}
+        flow = [
+            {"flow": [{"function": f"{name}SetProfiles"}, task, task], "name": name} for name in ["default", "admin"]
+        ]
+
+        task_set = mock.MagicMock()
+        task_set.iter_yaml_flow.return_value = flow
+        return task_set
+
+    @pytest.fixture
+    def instance(self, task_set):
+        return ArtilleryFileConfig(task_set, {"host": "localhost", "basePath": "/v1"})
+
+    def test_write_yaml(self, instance, task_set):
+        stream = io.StringIO()
+        instance.write_yaml(stream)
+
+        # Same as writing the complete configuration, with every task copied in its scenario
+        expected = {**instance.get_yaml_config(), "scenarios": task_set.iter_yaml_flow.return_value}
+        assert stream.getvalue() == yaml_io.dump(expected, aliases=False)
+        assert "&id" not in stream.getvalue()
+
+    def test_write_yaml_with_no_scenarios(self, instance, task_set):
+        task_set.iter_yaml_flow.return_value = []
+
+        stream = io.StringIO()
+        instance.write_yaml(stream)
+
+        assert stream.getvalue() == yaml_io.dump({**instance.get_yaml_config(), "scenarios": []})
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from atlas.modules import resource_pool, yaml_io
+from atlas.modules.transformer.artillery.yaml_to_js import Converter, settings
+
+
+class TestConverter:
+
+    @pytest.fixture
+    def instance(self, tmp_path):
+        resources_dir = tmp_path / settings.OUTPUT_FOLDER / settings.RESOURCES_FOLDER
+        os.makedirs(resources_dir)
+        os.makedirs(tmp_path / settings.OUTPUT_FOLDER / settings.ARTILLERY_FOLDER / settings.ARTILLERY_LIB_FOLDER)
+
+        resource_pool.dump({"res": {1, 2}, "empty": set()}, str(resources_dir / "profile_1.pool"))
+        with open(resources_dir / "custom.yaml", "w") as yaml_stream:
+            yaml_io.dump({"res": {"a"}}, yaml_stream)
+
+        instance = Converter(
+            profile_configs={"profile_1": {}, "profile_2": {"resource_file": "custom.yaml"}, "profile_3": {}},
+            profile_resources={"profile_3": {"res": {3}}}
+        )
+        instance.path = str(tmp_path)
+        instance.profiles = ["profile_1", "profile_2", "profile_3"]
+        return instance
+
+    def test_get_resources(self, instance):
+        assert instance.get_resources() == {"profile_1:res": {1, 2}, "profile_2:res": {"a"}, "profile_3:res": {3}}
+
+    def test_convert_resources(self, instance, tmp_path):
+        instance.convert_resources()
+
+        lib_dir = tmp_path / settings.OUTPUT_FOLDER / settings.ARTILLERY_FOLDER / settings.ARTILLERY_LIB_FOLDER
+        assert resource_pool.load(str(lib_dir / settings.ARTILLERY_RESOURCE_POOL)) == instance.get_resources()
+
+        with open(lib_dir / settings.ARTILLERY_RESOURCES) as js_stream:
+            contents = js_stream.read()
+        assert "this.loadPool(path.join(__dirname, 'resources.pool'));" in contents
+        assert "let dynamicResources;" not in contents
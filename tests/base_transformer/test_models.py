@@ -276,7 +276,7 @@ class TestTaskParseParameters:
             {"name": {"in": "formData", "type": "string", "required": True, "name": "name"}}
         )
 
-    @mock.patch('atlas.modules.transformer.base.models.utils.resolve_reference')
+    @mock.patch('atlas.modules.transformer.base.models.references.resolve')
     def test_with_ref(self, patched_ref, instance):
         patched_ref.return_value = {"in": "formData", "type": "string", "required": True, "name": "name"}
         instance.schema_resolver.spec = "ref"
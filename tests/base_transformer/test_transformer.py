@@ -28,7 +28,7 @@ class TestTransformer:
     def test_write_to_file_no_file_name_no_sub_path(self, patched_get_path, patched_open, instance):
         patched_get_path.return_value = ""
         instance.OUT_FILE = "out_file"
-        instance.convert = mock.MagicMock()
+        instance.iter_convert = mock.MagicMock(return_value=[])
 
         instance.write_to_file()
 
@@ -39,7 +39,7 @@ class TestTransformer:
     def test_write_to_file_with_file_name(self, patched_get_path, patched_open, instance):
         patched_get_path.return_value = ""
         instance.OUT_FILE = "out_file"
-        instance.convert = mock.MagicMock()
+        instance.iter_convert = mock.MagicMock(return_value=[])
 
         instance.write_to_file(file_name="xyz")
 
@@ -50,7 +50,7 @@ class TestTransformer:
     def test_write_to_file_with_sub_path(self, patched_get_path, patched_open, instance):
         patched_get_path.return_value = ""
         instance.OUT_FILE = "out_file"
-        instance.convert = mock.MagicMock()
+        instance.iter_convert = mock.MagicMock(return_value=[])
 
         instance.write_to_file(sub_path="sub")
 
@@ -61,15 +61,40 @@ def test_transformer_convert():
     task_set = TaskSet([])
     instance = FileConfig(task_set)
     instance.task_set = mock.MagicMock()
-    instance.task_set.convert = mock.MagicMock(return_value="c")
+    instance.task_set.iter_convert = mock.MagicMock(return_value=["c", "d"])
     instance.get_imports = mock.MagicMock(return_value="a")
     instance.get_global_vars = mock.MagicMock(return_value="b")
 
-    assert instance.convert() == "a\n\nb\n\nc"
+    assert instance.convert() == "a\n\nb\n\ncd"
 
     instance.get_imports.assert_called_once()
     instance.get_global_vars.assert_called_once()
-    instance.task_set.convert.assert_called_once_with(width=1)
+    instance.task_set.iter_convert.assert_called_once_with(width=1)
+
+
+def test_transformer_convert_skips_empty_components():
+    task_set = TaskSet([])
+    instance = FileConfig(task_set)
+    instance.task_set = mock.MagicMock()
+    instance.task_set.iter_convert = mock.MagicMock(return_value=["", "c"])
+    instance.get_imports = mock.MagicMock(return_value="a")
+    instance.get_global_vars = mock.MagicMock(return_value="")
+
+    assert instance.convert() == "a\n\nc"
+
+
+@mock.patch('atlas.modules.transformer.base.transformer.open')
+@mock.patch('atlas.modules.transformer.base.transformer.utils.get_project_path')
+def test_transformer_write_to_file_streams(patched_get_path, patched_open):
+    patched_get_path.return_value = ""
+    instance = FileConfig(TaskSet([]))
+    instance.OUT_FILE = "out_file"
+    instance.iter_convert = mock.MagicMock(return_value=["a", "b"])
+
+    instance.write_to_file()
+
+    write = patched_open.return_value.__enter__.return_value.write
+    assert write.call_args_list == [mock.call("a"), mock.call("b"), mock.call("\n")]
 
 
 @mock.patch('atlas.modules.transformer.base.transformer.settings')
@@ -12,6 +12,9 @@ influx = require('./libs/influx').client;
 const Provider = utils.Provider, ResponseDataParser = utils.ResponseDataParser;
 let respDataParser, defaultHeaders;
 
+// State of each request (its provider, URL, start time and deleted resource), from before request to after response
+const requestStates = new WeakMap();
+
 
 module.exports = {
     setUp: setUp,
@@ -83,11 +86,11 @@ function extractBody(response, requestParams, context) {
     return typeof body === 'object' ? body : JSON.parse(body);
 }
 
-function statsWrite(response, context, ee) {
-    let stats = {url: context.vars._rawURL, method: response.request.method};
-    if (context.vars._startTime) {
-        let responseTime = Date.now() - context.vars._startTime;
-        stats.startTime = context.vars._startTime;
+function statsWrite(response, requestState, context) {
+    let stats = {url: requestState.rawURL, method: response.request.method};
+    if (requestState.startTime) {
+        let responseTime = Date.now() - requestState.startTime;
+        stats.startTime = requestState.startTime;
         stats.responseTime = responseTime;
     }
     stats.isSuccess = (response.statusCode >= 200 && response.statusCode < 300) ? 1: 0;
@@ -130,10 +133,12 @@ function defaultSetProfiles(context, event, done) {
 }
 
 function apiCreatePreReq(requestParams, context, ee, next) {
-    const provider = context.vars['provider'];
+    const provider = new Provider(context.vars['provider'].profile);
+    const requestState = {provider: provider};
+    requestStates.set(requestParams, requestState);
     const bodyConfig = {"id": {"resource": "pet"}, "category": {"type": "object", "properties": {"id": {"resource": "category"}, "name": {"type": "string"}}}, "name": {"type": "string", "example": "doggie"}, "photoUrls": {"type": "array", "xml": {"wrapped": true}, "items": {"type": "string"}}, "status": {"type": "string", "enum": ["available", "pending", "sold"]}};
     let url = '/pet';
-    context.vars._rawURL = url;
+    requestState.rawURL = url;
     let headers = _.cloneDeep(defaultHeaders);
     let reqParams = {'headers': headers};
     let body = {};
@@ -149,24 +154,25 @@ function apiCreatePreReq(requestParams, context, ee, next) {
     requestParams.json = reqArgs[1];
     requestParams.url = reqArgs[0];
     requestParams.headers = reqArgs[2].headers;
-    context.vars._startTime = Date.now();
+    requestState.startTime = Date.now();
     return next();
 }
 
 function apiCreatePostRes(requestParams, response, context, ee, next) {
-    statsWrite(response, context, ee);
-    const provider = context.vars['provider'];
+    const requestState = requestStates.get(requestParams) || {provider: context.vars['provider']};
+    requestStates.delete(requestParams);
+    statsWrite(response, requestState, context);
+    const provider = requestState.provider;
     const status = response.statusCode;
     if (!status || status < 200 || status > 300) {
-        if (context.vars._delete_resource) {
-            const rollback = context.vars._delete_resource;
+        if (requestState.deleteResource) {
+            const rollback = requestState.deleteResource;
             provider.rollBackDelete(rollback.resource, rollback.value);
         }
         ee.emit('error', 'Non 2xx Response');
     } else {
         context.vars['respDataParser'].resolve({"id": {"resource": "pet"}, "category": {"type": "object", "properties": {"id": {"resource": "category"}, "name": {"type": "string"}}}, "name": {"type": "string", "example": "doggie"}, "photoUrls": {"type": "array", "xml": {"wrapped": true}, "items": {"type": "string"}}, "status": {"type": "string", "enum": ["available", "pending", "sold"]}}, extractBody(response, requestParams, context), provider.configResourceMap);
     }
-    provider.reset();
     return next();
 }
 
@@ -176,9 +182,11 @@ function apiCreateCondition(contextVars) {
 }
 
 function apiReadPreReq(requestParams, context, ee, next) {
-    const provider = context.vars['provider'];
+    const provider = new Provider(context.vars['provider'].profile);
+    const requestState = {provider: provider};
+    requestStates.set(requestParams, requestState);
     let url = '/pet/{petId}';
-    context.vars._rawURL = url;
+    requestState.rawURL = url;
     let urlConfig = [];
     const queryConfig = {};
     const pathConfig = {'petId': {'resource': 'pet'}};
@@ -195,24 +203,25 @@ function apiReadPreReq(requestParams, context, ee, next) {
     let reqArgs = hook.call('GET /pet/{petId}', ...[url, reqParams]);
     requestParams.url = reqArgs[0];
     requestParams.headers = reqArgs[1].headers;
-    context.vars._startTime = Date.now();
+    requestState.startTime = Date.now();
     return next();
 }
 
 function apiReadPostRes(requestParams, response, context, ee, next) {
-    statsWrite(response, context, ee);
-    const provider = context.vars['provider'];
+    const requestState = requestStates.get(requestParams) || {provider: context.vars['provider']};
+    requestStates.delete(requestParams);
+    statsWrite(response, requestState, context);
+    const provider = requestState.provider;
     const status = response.statusCode;
     if (!status || status < 200 || status > 300) {
-        if (context.vars._delete_resource) {
-            const rollback = context.vars._delete_resource;
+        if (requestState.deleteResource) {
+            const rollback = requestState.deleteResource;
             provider.rollBackDelete(rollback.resource, rollback.value);
         }
         ee.emit('error', 'Non 2xx Response');
     } else {
         context.vars['respDataParser'].resolve({"id": {"resource": "pet"}, "category": {"type": "object", "properties": {"id": {"resource": "category"}, "name": {"type": "string"}}}, "name": {"type": "string", "example": "doggie"}, "photoUrls": {"type": "array", "xml": {"wrapped": true}, "items": {"type": "string"}}, "status": {"type": "string", "enum": ["available", "pending", "sold"]}}, extractBody(response, requestParams, context), provider.configResourceMap);
     }
-    provider.reset();
     return next();
 }
 
@@ -0,0 +1,57 @@
+import pytest
+
+from atlas.modules.helpers import open_api
+
+
+class TestElementConfig:
+
+    def test_ref(self):
+        assert open_api.ElementConfig({"$ref": "#/definitions/Pet"}).ref == "#/definitions/Pet"
+
+    def test_array_ref(self):
+        assert open_api.ElementConfig({"type": "array", "items": {"$ref": "#/definitions/Pet"}}).ref == (
+            "#/definitions/Pet"
+        )
+
+    def test_no_copy(self):
+        config = {"type": "string"}
+        element = open_api.ElementConfig(config)
+
+        config["$ref"] = "#/definitions/Pet"
+
+        assert element.ref == "#/definitions/Pet"
+
+    def test_read_only(self):
+        element = open_api.ElementConfig({"type": "string"})
+
+        with pytest.raises(TypeError):
+            element.resolved_config["type"] = "integer"
+
+
+class TestReferenceField:
+
+    @pytest.mark.parametrize("name, config, primary", [
+        ("id", {"resource": "pet"}, True),
+        ("id", {}, False),
+        ("name", {"resource": "pet"}, False),
+    ])
+    def test_can_contain_primary_resource(self, name, config, primary):
+        assert bool(open_api.ReferenceField(name, config).can_contain_primary_resource) == primary
+
+
+class TestSchema:
+
+    def test_get_all_refs_direct(self):
+        assert open_api.Schema({"$ref": "#/definitions/Pet"}).get_all_refs() == ["#/definitions/Pet"]
+
+    def test_get_all_refs_nested(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "pet": {"$ref": "#/definitions/Pet"},
+                "tags": {"type": "array", "items": {"$ref": "#/definitions/Tag"}},
+                "name": {"type": "string"}
+            }
+        }
+
+        assert open_api.Schema(schema).get_all_refs() == ["#/definitions/Pet", "#/definitions/Tag"]
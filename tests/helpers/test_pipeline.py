@@ -0,0 +1,70 @@
+from unittest import mock
+
+import pytest
+
+from atlas.modules.helpers import references
+from atlas.modules.helpers.pipeline import PipelineContext
+
+
+class TestPipelineContext:
+
+    @pytest.fixture
+    def instance(self):
+        return PipelineContext()
+
+    @mock.patch('atlas.modules.helpers.pipeline.open_api_reader.SpecsFile')
+    def test_input_specs_loaded_once(self, patched_specs, instance):
+        patched_specs.return_value.inp_file_load.return_value = {"paths": {}}
+
+        assert instance.input_specs == {"paths": {}}
+        assert instance.input_specs is instance.input_specs
+        patched_specs.return_value.inp_file_load.assert_called_once_with()
+
+    @mock.patch('atlas.modules.helpers.pipeline.open_api_reader.SpecsFile')
+    def test_specs_from_file(self, patched_specs, instance):
+        patched_specs.return_value.file_load.return_value = {"paths": {}}
+
+        assert instance.specs == {"paths": {}}
+        patched_specs.return_value.file_load.assert_called_once_with()
+
+    @mock.patch('atlas.modules.helpers.pipeline.open_api_reader.SpecsFile')
+    def test_specs_set(self, patched_specs, instance):
+        instance.specs = {"paths": {"/b": {}, "/a": {}}, "info": {"resources": {"b", "a"}}}
+
+        assert list(instance.specs) == ["info", "paths"]
+        assert list(instance.specs["paths"]) == ["/a", "/b"]
+        patched_specs.assert_not_called()
+
+    def test_specs_set_forgets_old_resolvers(self, instance):
+        instance.specs = {"paths": {}}
+        old_specs = instance.specs
+        references.get_resolver(old_specs)
+
+        instance.specs = {"paths": {"/a": {}}}
+
+        assert id(old_specs) not in references._resolvers
+
+    def test_resource_map(self, instance):
+        resource_map = instance.resource_map
+
+        assert resource_map == instance.read_file_from_input("resource_mapping.yaml")
+        assert instance.resource_map is resource_map
+
+    def test_resource_map_set(self, instance):
+        instance.resource_map = {"b": {}, "a": {}}
+        assert list(instance.resource_map) == ["a", "b"]
+
+    def test_profiles(self, instance):
+        assert instance.profiles == instance.read_file_from_input("profiles.yaml")
+
+    def test_set_profile_resources(self, instance):
+        instance.set_profile_resources({"profile_1": {"b": {2, 1}, "a": set()}})
+        assert instance.profile_resources == {"profile_1": {"a": set(), "b": {1, 2}}}
+        assert list(instance.profile_resources["profile_1"]) == ["a", "b"]
+
+    def test_default_profiler_is_disabled(self, instance):
+        assert not instance.profiler.enabled
+
+    def test_profiler(self):
+        profiler = mock.MagicMock()
+        assert PipelineContext(profiler=profiler).profiler is profiler
@@ -0,0 +1,115 @@
+from collections import Counter
+import json
+from unittest import mock
+
+import pytest
+
+from atlas.modules.helpers.profiler import BuildProfiler
+
+
+class TestBuildProfiler:
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        with mock.patch('atlas.modules.helpers.profiler.utils.get_project_path', return_value=str(tmp_path)):
+            yield tmp_path
+
+    @pytest.fixture
+    def queries(self):
+        return Counter()
+
+    @pytest.fixture
+    def instance(self, project, queries):
+        return BuildProfiler(counters={"sql_queries": (queries, "queries")})
+
+    def test_nested_stages(self, instance, queries):
+        with instance.stage("transform"):
+            queries["queries"] += 1
+            with instance.stage("ordering"):
+                queries["queries"] += 2
+                instance.count("operations", 5)
+
+        transform = instance.get_report()["stages"][0]
+        ordering = transform["stages"][0]
+
+        assert transform["name"] == "transform" and ordering["name"] == "ordering"
+        assert transform["counts"] == {"sql_queries": 3, "operations": 5}
+        assert ordering["counts"] == {"sql_queries": 2, "operations": 5}
+        assert transform["wall_time"] >= ordering["wall_time"]
+        assert transform["peak_traced_memory"] is None
+
+    def test_bytes_written(self, instance, project):
+        build = project / "build"
+        (build / "artillery").mkdir(parents=True)
+        (build / "artillery" / "old.txt").write_text("old")
+
+        with instance.stage("write", outputs=["build/artillery", "build/profile.json"]):
+            (build / "artillery" / "new.txt").write_text("12345")
+            (build / "profile.json").write_text("{}")
+            (build / "other.txt").write_text("not an output")
+
+        assert instance.get_report()["stages"][0]["counts"]["bytes_written"] == 7
+
+    def test_bytes_written_skips_caches(self, instance, project):
+        build = project / "build"
+        (build / ".cache").mkdir(parents=True)
+        (build / "node_modules").mkdir()
+
+        with instance.stage("write", outputs=["build"]):
+            (build / ".cache" / "manifest.json").write_text("cached")
+            (build / "node_modules" / "index.js").write_text("installed")
+
+        assert instance.get_report()["stages"][0]["counts"]["bytes_written"] == 0
+
+    def test_outputs_are_walked_only_for_stages_which_name_them(self, instance):
+        with mock.patch.object(instance, "get_file_states", return_value={}) as get_file_states:
+            with instance.stage("transform", outputs=["build/artillery"]):
+                with instance.stage("ordering"):
+                    pass
+
+        assert get_file_states.call_args_list == [mock.call(["build/artillery"])] * 2
+
+    def test_trace_memory(self, project):
+        instance = BuildProfiler(trace_memory=True)
+
+        with instance.stage("outer"):
+            with instance.stage("inner"):
+                data = [0] * 100000
+            del data
+
+        outer = instance.get_report()["stages"][0]
+        assert outer["stages"][0]["peak_traced_memory"] >= 800000
+        assert outer["peak_traced_memory"] >= outer["stages"][0]["peak_traced_memory"]
+
+    def test_stage_with_error(self, instance):
+        with pytest.raises(ValueError):
+            with instance.stage("validate"):
+                raise ValueError
+
+        assert instance.get_report()["stages"][0]["name"] == "validate"
+
+        # Later stages are not nested in the failed one
+        with instance.stage("dist"):
+            pass
+        assert len(instance.get_report()["stages"]) == 2
+
+    def test_write_report(self, instance, project):
+        with instance.stage("validate"):
+            pass
+
+        path = instance.write_report()
+
+        with open(path) as report_file:
+            report = json.load(report_file)
+        assert path == str(project / "build" / "profile.json")
+        assert report["stages"][0]["name"] == "validate"
+
+    def test_disabled(self, project):
+        instance = BuildProfiler(enabled=False)
+
+        with instance.stage("validate"):
+            instance.count("operations")
+
+        assert instance.get_report()["stages"] == []
+        assert instance.write_report() == ""
+        assert not (project / "build").exists()
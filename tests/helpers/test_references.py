@@ -0,0 +1,144 @@
+from unittest import mock
+
+import pytest
+
+from atlas.modules import exceptions
+from atlas.modules.helpers import references
+
+
+@pytest.fixture
+def spec():
+    return {
+        "paths": {
+            "/pets/{id}": {
+                "parameters": [{"$ref": "#/parameters/id"}],
+                "get": {"responses": {"200": {"schema": {"$ref": "#/definitions/Pet"}}}}
+            }
+        },
+        "parameters": {"id": {"in": "path", "name": "id"}},
+        "definitions": {
+            "Pet": {"properties": {"tag": {"$ref": "#/definitions/a~1b"}, "bad": {"$ref": "#/definitions/None"}}},
+            "a/b": {"type": "string"}
+        }
+    }
+
+
+class TestReferenceResolver:
+
+    def test_get_refs(self, spec):
+        assert references.ReferenceResolver.get_refs(spec) == {
+            "#/parameters/id", "#/definitions/Pet", "#/definitions/a~1b", "#/definitions/None"
+        }
+
+    def test_get_refs_with_shared_objects(self):
+        shared = {"$ref": "#/a"}
+        assert references.ReferenceResolver.get_refs({"a": [shared, shared], "b": shared}) == {"#/a"}
+
+    def test_index(self, spec):
+        instance = references.ReferenceResolver(spec)
+
+        assert {ref: target for ref, (target, _) in instance.index.items()} == {
+            "#/parameters/id": spec["parameters"]["id"],
+            "#/definitions/Pet": spec["definitions"]["Pet"],
+            "#/definitions/a~1b": spec["definitions"]["a/b"]
+        }
+
+    def test_walk(self):
+        instance = references.ReferenceResolver({"a": [{"b": 1}]})
+
+        target, links = instance.walk("#/a/0/b")
+
+        assert target == 1
+        assert [(key, value) for _, key, value in links] == [("a", [{"b": 1}]), (0, {"b": 1}), ("b", 1)]
+
+    def test_resolve_from_index(self, spec):
+        instance = references.ReferenceResolver(spec)
+
+        with mock.patch('atlas.modules.helpers.references.utils.resolve_reference') as patched:
+            assert instance.resolve("#/definitions/Pet") is spec["definitions"]["Pet"]
+            patched.assert_not_called()
+
+    def test_resolve_not_in_index(self, spec):
+        instance = references.ReferenceResolver(spec)
+        spec["definitions"]["Tag"] = {"type": "string"}
+        misses = references.stats[references.INDEX_MISSES]
+
+        assert instance.resolve("#/definitions/Tag") == {"type": "string"}
+        assert instance.resolve("#/definitions/Tag") == {"type": "string"}
+        assert references.stats[references.INDEX_MISSES] == misses + 1
+
+    @pytest.mark.parametrize("edit", [
+        lambda spec: spec["definitions"].update({"Pet": {"type": "object"}}),
+        lambda spec: spec.update({"definitions": {"Pet": {"type": "object"}}}),
+    ])
+    def test_resolve_replaced_target(self, spec, edit):
+        instance = references.ReferenceResolver(spec)
+        instance.schemas["cached"] = "schema"
+
+        edit(spec)
+
+        assert instance.resolve("#/definitions/Pet") is spec["definitions"]["Pet"]
+        assert instance.schemas == {}
+
+    def test_resolve_removed_target(self, spec):
+        instance = references.ReferenceResolver(spec)
+        del spec["definitions"]["Pet"]
+
+        with pytest.raises(exceptions.ImproperSwaggerException):
+            instance.resolve("#/definitions/Pet")
+
+    @pytest.mark.parametrize("ref", ["#/paths/~1pets~1{id}/parameters/7", "#/paths/~1pets~1{id}/parameters/id"])
+    def test_resolve_invalid_list_index(self, spec, ref):
+        spec["definitions"]["Owner"] = {"$ref": ref}
+        instance = references.ReferenceResolver(spec)
+
+        assert ref not in instance.index
+        with pytest.raises(exceptions.ImproperSwaggerException):
+            instance.resolve(ref)
+
+    def test_resolve_invalid(self, spec):
+        instance = references.ReferenceResolver(spec)
+
+        with pytest.raises(exceptions.ImproperSwaggerException):
+            instance.resolve("#/definitions/None")
+
+
+class TestGetResolver:
+
+    def test_same_spec(self, spec):
+        assert references.get_resolver(spec) is references.get_resolver(spec)
+
+    def test_different_specs(self, spec):
+        assert references.get_resolver(spec) is not references.get_resolver(dict(spec))
+
+    def test_max_resolvers(self, spec):
+        resolver = references.get_resolver(spec)
+
+        for _ in range(references.MAX_RESOLVERS):
+            references.get_resolver({})
+
+        assert references.get_resolver(spec) is not resolver
+
+    def test_reused_id(self, spec):
+        resolver = references.get_resolver(spec)
+        other_spec = {}
+
+        # As if spec was garbage collected, and its ID given to other spec
+        references._resolvers[id(other_spec)] = resolver
+
+        assert references.get_resolver(other_spec).spec is other_spec
+
+    def test_forget(self, spec):
+        resolver = references.get_resolver(spec)
+
+        references.forget(dict(spec))
+        assert references.get_resolver(spec) is resolver
+
+        references.forget(spec)
+        assert id(spec) not in references._resolvers
+
+    def test_resolve(self, spec):
+        resolved = references.stats[references.RESOLVED]
+
+        assert references.resolve(spec, "#/parameters/id") == {"in": "path", "name": "id"}
+        assert references.stats[references.RESOLVED] == resolved + 1
@@ -0,0 +1,90 @@
+import os
+from unittest import mock
+
+import pytest
+import yaml
+
+from atlas.modules.helpers import open_api_reader
+from atlas.modules.helpers.spec_cache import SpecCache, HITS, MISSES
+
+
+class TestSpecCache:
+
+    @pytest.fixture
+    def spec_file(self, tmp_path):
+        _file = tmp_path / "swagger.yaml"
+        _file.write_text("paths:\n  /pets:\n    get: {}\n")
+        return str(_file)
+
+    @pytest.fixture
+    def instance(self, tmp_path):
+        return SpecCache(str(tmp_path / "cache"))
+
+    def test_load_miss_then_hit(self, instance, spec_file):
+        converter = mock.MagicMock(side_effect=yaml.safe_load)
+
+        first = instance.load(spec_file, "yaml", converter)
+        second = instance.load(spec_file, "yaml", converter)
+
+        assert first == second == {"paths": {"/pets": {"get": {}}}}
+        converter.assert_called_once()
+        assert instance.info() == {"entries": 1, "size": mock.ANY, HITS: 1, MISSES: 1}
+
+    def test_load_returns_fresh_copy(self, instance, spec_file):
+        first = instance.load(spec_file, "yaml", yaml.safe_load)
+        first["paths"].pop("/pets")
+
+        assert instance.load(spec_file, "yaml", yaml.safe_load) == {"paths": {"/pets": {"get": {}}}}
+
+    def test_load_after_file_change(self, instance, spec_file):
+        instance.load(spec_file, "yaml", yaml.safe_load)
+
+        with open(spec_file, "w") as _file:
+            _file.write("paths: {}\n")
+
+        assert instance.load(spec_file, "yaml", yaml.safe_load) == {"paths": {}}
+        assert instance.info()[MISSES] == 2
+
+    def test_load_with_corrupt_entry(self, instance, spec_file):
+        instance.load(spec_file, "yaml", yaml.safe_load)
+
+        for entry in instance.get_entries():
+            with open(entry, "wb") as _file:
+                _file.write(b"corrupt")
+
+        assert instance.load(spec_file, "yaml", yaml.safe_load) == {"paths": {"/pets": {"get": {}}}}
+        assert instance.info()[MISSES] == 2
+
+    def test_prune(self, instance, spec_file):
+        instance.MAX_ENTRIES = 1
+        instance.load(spec_file, "yaml", yaml.safe_load)
+        instance.load(spec_file, "json_like", yaml.safe_load)
+
+        assert len(instance.get_entries()) == 1
+
+    def test_clear(self, instance, spec_file):
+        instance.load(spec_file, "yaml", yaml.safe_load)
+
+        instance.clear()
+
+        assert instance.info() == {"entries": 0, "size": 0, HITS: 0, MISSES: 0}
+
+
+class TestSpecsFileCache:
+
+    @mock.patch('atlas.modules.helpers.open_api_reader.spec_cache.SpecCache')
+    def test_load_with_cache(self, patched_cache):
+        open_api_reader.SpecsFile(use_cache=True).inp_file_load()
+        patched_cache.return_value.load.assert_called_once()
+
+    @mock.patch('atlas.modules.helpers.open_api_reader.spec_cache.SpecCache')
+    def test_load_without_cache(self, patched_cache):
+        specs = open_api_reader.SpecsFile(use_cache=False).inp_file_load()
+
+        patched_cache.assert_not_called()
+        with open(os.path.join("conf", "swagger.yaml")) as _file:
+            assert specs == yaml.safe_load(_file)
+
+    def test_load_cache_folder(self):
+        open_api_reader.SpecsFile(use_cache=True).file_load()
+        assert os.path.exists(SpecCache().path)
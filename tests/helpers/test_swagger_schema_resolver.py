@@ -0,0 +1,103 @@
+import pytest
+
+from atlas.modules import utils
+from atlas.modules.helpers import swagger_schema_resolver
+from atlas.modules.helpers.swagger_schema_resolver import SchemaResolver
+
+
+@pytest.fixture
+def spec():
+    return {
+        "definitions": {
+            "Pet": {
+                "properties": {
+                    "id": {"type": "integer", "readOnly": True},
+                    "name": {"type": "string"},
+                    "category": {"$ref": "#/definitions/Category"}
+                }
+            },
+            "Category": {
+                "properties": {
+                    "name": {"type": "string"},
+                    "parent": {"$ref": "#/definitions/Category"},
+                    "pet": {"$ref": "#/definitions/Pet"}
+                }
+            },
+            "Self": {"allOf": [{"$ref": "#/definitions/Self"}, {"properties": {"name": {"type": "string"}}}]}
+        }
+    }
+
+
+def resolve(spec, schema, read_only=False):
+    # Every resolution is first done on the resolver, so that schema is not resolved at top level
+    resolver = SchemaResolver(spec)
+    resolver.resolve({})
+    resolver.is_top_level = False
+    return resolver.resolve_with_read_only_fields(schema) if read_only else resolver.resolve(schema)
+
+
+class TestSchemaResolver:
+
+    def test_resolve_with_cycles(self, spec):
+        assert SchemaResolver(spec).resolve({"$ref": "#/definitions/Pet"}) == {
+            "name": {"type": "string"},
+            "category": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "parent": {"$ref": "#/definitions/Category"},
+                    "pet": {"$ref": "#/definitions/Pet"}
+                }
+            }
+        }
+
+    def test_resolve_with_top_level_cycle(self, spec):
+        assert SchemaResolver(spec).resolve({"$ref": "#/definitions/Self"}) == {"name": {"type": "string"}}
+
+    def test_cache_shared_across_resolvers(self, spec):
+        first = resolve(spec, {"pet": {"$ref": "#/definitions/Pet"}})
+
+        hits = swagger_schema_resolver.stats[swagger_schema_resolver.HITS]
+        second = resolve(spec, {"pet": {"$ref": "#/definitions/Pet"}})
+
+        assert first == second
+        assert first["pet"]["properties"] is second["pet"]["properties"]
+        assert swagger_schema_resolver.stats[swagger_schema_resolver.HITS] == hits + 1
+
+    def test_cache_with_read_only(self, spec):
+        resolve(spec, {"pet": {"$ref": "#/definitions/Pet"}})
+
+        assert resolve(spec, {"pet": {"$ref": "#/definitions/Pet"}}, read_only=True)["pet"]["properties"]["id"] == {
+            "type": "integer"
+        }
+
+    def test_cache_depends_on_visited_refs(self, spec):
+        # Category is resolved while Pet is visited, and so its pet field is not expanded
+        resolve(spec, {"pet": {"$ref": "#/definitions/Pet"}})
+
+        category = resolve(spec, {"category": {"$ref": "#/definitions/Category"}})["category"]["properties"]
+
+        assert category["pet"]["properties"]["category"] == {"$ref": "#/definitions/Category"}
+
+    def test_same_as_without_cache(self, spec):
+        schemas = [{"category": {"$ref": "#/definitions/Category"}}, {"pet": {"$ref": "#/definitions/Pet"}}]
+
+        cached = [resolve(spec, schema) for schema in schemas]
+        expected = [resolve(dict(spec), schema) for schema in reversed(schemas)]
+
+        assert cached == list(reversed(expected))
+
+    def test_cached_schema_immutable(self, spec):
+        schema = resolve(spec, {"pet": {"$ref": "#/definitions/Pet"}})
+
+        with pytest.raises(TypeError):
+            schema["pet"]["properties"]["name"]["type"] = "integer"
+
+    def test_top_level_reference_mutable(self, spec):
+        resolver = SchemaResolver(spec)
+        resolver.is_top_level = False
+
+        schema = resolver.resolve({"$ref": "#/definitions/Pet"})
+        schema["extra"] = {}
+
+        assert not isinstance(schema, utils.FrozenDict)
@@ -45,6 +45,7 @@ class TestDirectedGraph:
 
         assert instance.node_count == 1
         assert instance.nodes == {"key": ret}
+        assert ret.index == 0
 
     def test_add_node_existing_node(self, instance):
         sample = Node("sample")
@@ -70,6 +71,27 @@ class TestDirectedGraph:
 
         assert node_1.connected_to == {node_2: 2}
 
+    def test_add_edge_new_nodes(self, instance):
+        instance.add_edge("node_1", "node_2")
+        instance.add_edge("node_1", "node_3")
+
+        assert instance.node_count == 3
+        assert [node.index for node in instance] == [0, 1, 2]
+        assert set(instance.get_node("node_1").get_connections()) == {
+            instance.get_node("node_2"), instance.get_node("node_3")
+        }
+
+    def test_get_adjacency(self, instance):
+        for edge in [("a", "b"), ("a", "c"), ("c", "b")]:
+            instance.add_edge(*edge)
+        instance.add_node("d")
+
+        keys, offsets, targets = instance.get_adjacency()
+
+        assert keys == ["a", "b", "c", "d"]
+        assert list(offsets) == [0, 2, 2, 3, 3]
+        assert list(targets) == [1, 2, 1]
+
     def test_get_vertices(self, instance):
         node_1 = Node("node_1")
         node_2 = Node("node_2")
@@ -101,6 +123,18 @@ class TestDirectedGraph:
         assert instance.dfs(node_1) == [node_1, node_2]
         assert instance.dfs(node_2) == [node_2]
 
+    def test_dfs_visits_shared_node_once(self, instance):
+        for edge in [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]:
+            instance.add_edge(*edge)
+
+        assert [node.get_id() for node in instance.dfs(instance.get_node("a"))] == ["a", "b", "d", "c"]
+
+    def test_dfs_deep_chain(self, instance):
+        for idx in range(5000):
+            instance.add_edge(idx, idx + 1)
+
+        assert len(instance.dfs(instance.get_node(0))) == 5001
+
 
 class TestDAG:
 
@@ -134,5 +168,53 @@ class TestDAG:
         node_2 = instance.get_node("node_2")
         instance.add_edge_by_node(node_2, node_1)
 
-        with pytest.raises(exceptions.OrderingException):
+        with pytest.raises(exceptions.OrderingException) as exc:
+            instance.topological_sort()
+
+        assert "node_1 -> node_2 -> node_1" in str(exc.value)
+
+    def test_topological_sort_reports_cycle_path(self):
+        instance = DAG()
+        for edge in [("a", "b"), ("b", "c"), ("c", "d"), ("d", "b"), ("d", "e")]:
+            instance.add_edge(*edge)
+
+        with pytest.raises(exceptions.OrderingException) as exc:
             instance.topological_sort()
+
+        assert "b -> c -> d -> b" in str(exc.value)
+
+    def test_topological_sort_deep_chain(self):
+        instance = DAG()
+        for idx in range(5000):
+            instance.add_edge(idx, idx + 1)
+
+        assert instance.topological_sort() == list(range(5001))
+
+    def test_topological_sort_tie_break(self):
+        """
+        Order should only depend upon order of nodes, and not that of edges
+        """
+        orders = []
+
+        for edges in [[("a", "d"), ("b", "d"), ("c", "d")], [("c", "d"), ("b", "d"), ("a", "d")]]:
+            instance = DAG()
+            for key in "dcba":
+                instance.add_node(key)
+            for edge in edges:
+                instance.add_edge(*edge)
+            orders.append(instance.topological_sort())
+
+        assert orders == [["c", "b", "a", "d"], ["c", "b", "a", "d"]]
+
+    def test_topological_levels(self):
+        instance = DAG()
+        for edge in [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("a", "d"), ("e", "c")]:
+            instance.add_edge(*edge)
+
+        assert instance.topological_levels() == [["a", "e"], ["b", "c"], ["d"]]
+
+    def test_topological_levels_with_cycle(self, instance):
+        instance.add_edge("node_2", "node_3")
+
+        with pytest.raises(exceptions.OrderingException):
+            instance.topological_levels()
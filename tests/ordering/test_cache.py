@@ -0,0 +1,185 @@
+import datetime
+from unittest import mock
+
+import pytest
+
+from atlas.modules import constants
+from atlas.modules.transformer.interface import OpenAPITaskInterface
+from atlas.modules.transformer.ordering import cache as ordering_cache
+from atlas.modules.transformer.ordering.cache import OrderingCache, get_ordering_subset, stats, HITS, MISSES
+from atlas.modules.transformer.ordering.ordering import Ordering
+
+
+def test_get_ordering_subset():
+    config = {
+        "description": "Pet",
+        "properties": {
+            "description": {"type": "string", "description": "Description of pet"},
+            "owner": {"$ref": "#/definitions/User", "example": {"id": 1}}
+        },
+        "allOf": [{"title": "Base", "$ref": "#/definitions/Base"}]
+    }
+
+    assert get_ordering_subset(config) == {
+        "properties": {
+            "description": {"type": "string"},
+            "owner": {"$ref": "#/definitions/User"}
+        },
+        "allOf": [{"$ref": "#/definitions/Base"}]
+    }
+
+
+class TestOrderingCache:
+
+    @pytest.fixture
+    def spec(self):
+        return {
+            "definitions": {
+                "Pet": {"properties": {"id": {"type": "integer"}, "owner": {"$ref": "#/definitions/User"}}},
+                "User": {"properties": {"id": {"type": "integer"}}, "description": "User of pet store"}
+            },
+            "paths": {
+                "/pets": {
+                    "post": {"responses": {"201": {"description": "Pet", "schema": {"$ref": "#/definitions/Pet"}}}},
+                    "get": {"summary": "List Pets"}
+                }
+            }
+        }
+
+    @pytest.fixture
+    def interfaces(self):
+        interfaces = []
+        for method, url in [(constants.POST, "/pets"), (constants.GET, "/pets")]:
+            interface = OpenAPITaskInterface()
+            interface.method = method
+            interface.url = url
+            interfaces.append(interface)
+        return interfaces
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        stats.clear()
+        return str(tmp_path / "order.json")
+
+    def test_fingerprint_with_documentation_change(self, spec, interfaces, path):
+        instance = OrderingCache(spec, interfaces, path)
+        spec_digest, fingerprint = instance.spec_digest, instance.fingerprint
+
+        spec["definitions"]["User"]["description"] = "Owner of pet"
+        spec["paths"]["/pets"]["get"]["summary"] = "Pets"
+
+        instance = OrderingCache(spec, interfaces, path)
+        assert instance.spec_digest != spec_digest
+        assert instance.fingerprint == fingerprint
+
+    def test_fingerprint_with_definition_change(self, spec, interfaces, path):
+        fingerprint = OrderingCache(spec, interfaces, path).fingerprint
+
+        spec["definitions"]["User"]["properties"]["pet"] = {"$ref": "#/definitions/Pet"}
+
+        assert OrderingCache(spec, interfaces, path).fingerprint != fingerprint
+
+    def test_fingerprint_with_operation_change(self, spec, interfaces, path):
+        fingerprint = OrderingCache(spec, interfaces, path).fingerprint
+
+        assert OrderingCache(spec, interfaces[::-1], path).fingerprint != fingerprint
+
+    def test_fingerprint_with_custom_dependencies(self, spec, interfaces, path):
+        fingerprint = OrderingCache(spec, interfaces, path).fingerprint
+
+        dependencies = [("GET /pets", "POST /pets")]
+        with mock.patch.object(ordering_cache.settings, "SWAGGER_OPERATION_DEPENDENCIES", dependencies):
+            assert OrderingCache(spec, interfaces, path).fingerprint != fingerprint
+
+    def test_fingerprint_with_unsupported_values(self, spec, interfaces, path):
+        spec["info"] = {"date": datetime.date(2020, 1, 1)}
+        assert OrderingCache(spec, interfaces, path).spec_digest
+
+    def test_save_and_get(self, spec, interfaces, path):
+        OrderingCache(spec, interfaces, path).save(interfaces[::-1], {"pet"})
+
+        instance = OrderingCache(spec, interfaces, path)
+        assert instance.get() == interfaces[::-1]
+        assert instance.no_producer_resources == ["pet"]
+
+        assert OrderingCache(spec, interfaces[:1], path).get() is None
+        assert stats == {HITS: 1, MISSES: 1}
+
+    def test_save_and_get_levels(self, spec, interfaces, path):
+        OrderingCache(spec, interfaces, path).save(interfaces)
+        assert OrderingCache(spec, interfaces, path).get(levels=True) is None
+
+        OrderingCache(spec, interfaces, path).save(interfaces, levels=[interfaces])
+
+        assert OrderingCache(spec, interfaces, path).get(levels=True) == [interfaces]
+        assert OrderingCache(spec, interfaces, path).get() == interfaces
+
+    def test_get_with_documentation_change(self, spec, interfaces, path):
+        OrderingCache(spec, interfaces, path).save(interfaces)
+
+        spec["definitions"]["User"]["description"] = "Pet owner"
+        instance = OrderingCache(spec, interfaces, path)
+
+        assert instance.get() == interfaces
+        assert instance.read()["spec_digest"] == instance.spec_digest
+        assert stats == {HITS: 1}
+
+    def test_get_with_documentation_change_after_cold_build(self, spec, interfaces, path):
+        instance = OrderingCache(spec, interfaces, path)
+        assert instance.get() is None
+        instance.save(interfaces)
+
+        spec["paths"]["/pets"]["get"]["description"] = "List of pets"
+        spec["definitions"]["User"]["example"] = {"name": "John"}
+
+        assert OrderingCache(spec, interfaces, path).get() == interfaces
+        assert stats == {HITS: 1, MISSES: 1}
+
+    def test_get_with_change(self, spec, interfaces, path):
+        OrderingCache(spec, interfaces, path).save(interfaces)
+
+        spec["definitions"]["User"]["properties"]["pet"] = {"$ref": "#/definitions/Pet"}
+
+        assert OrderingCache(spec, interfaces, path).get() is None
+
+    def test_get_with_corrupt_cache(self, spec, interfaces, path):
+        with open(path, "w") as order_file:
+            order_file.write("corrupt")
+
+        assert OrderingCache(spec, interfaces, path).get() is None
+
+
+class TestOrderingWithCache:
+
+    @pytest.fixture
+    def instance(self, tmp_path):
+        interface = OpenAPITaskInterface()
+        interface.method = constants.GET
+        interface.url = "/pets"
+
+        with mock.patch.object(ordering_cache.utils, "get_project_path", return_value=str(tmp_path)):
+            yield Ordering(specs={"definitions": {}}, interfaces=[interface], use_cache=True)
+
+    def test_order_from_cache(self, instance):
+        order = instance.order()
+
+        with mock.patch.object(Ordering, "get_resource_graph") as patched_graph:
+            assert instance.order() == order
+        patched_graph.assert_not_called()
+
+    def test_order_levels(self, instance):
+        order = instance.order()
+        levels = instance.order(levels=True)
+
+        assert levels == [order]
+        assert instance.order(levels=True) == levels
+
+    def test_order_without_cache(self, instance):
+        instance.use_cache = False
+        order = instance.order()
+
+        with mock.patch.object(
+                Ordering, "get_resource_graph", autospec=True, side_effect=Ordering.get_resource_graph
+        ) as patched_graph:
+            assert instance.order() == order
+        patched_graph.assert_called()
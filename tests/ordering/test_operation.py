@@ -1,3 +1,4 @@
+import random
 from unittest import mock
 
 import pytest
@@ -31,16 +32,54 @@ class TestOperation:
         instance.new_graph([interface])
 
         assert instance.operations == {interface.op_id: interface}
-        assert instance.nodes == {interface.op_id: Operation(interface.op_id)}
+        assert list(instance.nodes) == [interface.op_id]
+        assert isinstance(instance.nodes[interface.op_id], Operation)
+        assert instance.nodes[interface.op_id].get_id() == interface.op_id
 
     @mock.patch('atlas.modules.transformer.ordering.operation.OperationGraph.add_edge')
-    def test_add_cartesian_edges(self, add_edge_patch, instance):
+    def test_add_cartesian_edges(self, add_edge_patch):
+        instance = OperationGraph(compress=False)
         instance.add_cartesian_edges({1, 2, 3, 4}, {1, 3, 5, 7})
 
         assert add_edge_patch.call_args_list == [
             ((2, 1),), ((2, 3),), ((2, 5),), ((2, 7),), ((4, 1),), ((4, 3),), ((4, 5),), ((4, 7),)
         ]
 
+    def test_add_cartesian_edges_compressed(self, instance):
+        instance.add_cartesian_edges({1, 2, 3}, {4, 5, 6})
+        instance.add_cartesian_edges({1, 2, 3}, {7})
+
+        assert instance.barriers == {frozenset({1, 2, 3}): "$BARRIER-0"}
+        assert {node.get_id() for node in instance.get_node(1).get_connections()} == {"$BARRIER-0"}
+        assert {node.get_id() for node in instance.get_node("$BARRIER-0").get_connections()} == {4, 5, 6, 7}
+
+    def test_add_cartesian_edges_compressed_small_sets(self, instance):
+        instance.add_cartesian_edges({1, 2}, {3, 4})
+        instance.add_cartesian_edges({5}, set())
+
+        assert instance.barriers == {}
+        assert {node.get_id() for node in instance.get_node(1).get_connections()} == {3, 4}
+        assert 5 not in instance
+
+    def test_topological_sort_compressed(self):
+        interfaces = [self.create_interface(url=f"url_{index}") for index in range(40)]
+        graphs = [OperationGraph(compress=False), OperationGraph(compress=True)]
+        random_gen = random.Random(7)
+
+        for graph in graphs:
+            graph.new_graph(interfaces)
+
+        for _ in range(30):
+            # Only go forward, so that there are no cycles
+            start = random_gen.randrange(25)
+            parents = {interface.op_id for interface in random_gen.sample(interfaces[start:start + 10], 4)}
+            children = {interface.op_id for interface in random_gen.sample(interfaces[start + 10:], 5)}
+            for graph in graphs:
+                graph.add_cartesian_edges(parents, children)
+
+        assert graphs[1].barriers
+        assert graphs[1].topological_sort() == graphs[0].topological_sort()
+
     @mock.patch('atlas.modules.transformer.ordering.operation.settings')
     @mock.patch('atlas.modules.transformer.ordering.operation.OperationGraph.add_edge')
     def test_add_custom_ordering_dependencies(self, add_edge_patch, patched_settings, instance):
@@ -69,6 +108,34 @@ class TestOperation:
         # Since delete operations are shuffled back, we get(1-2- (3, 4))
         assert instance.topological_sort() == [interface_1, interface_2, interface_4, interface_3]
 
+    def test_topological_sort_dummy_operations(self, instance):
+        interface_1 = self.create_interface(url="url_1")
+        interface_2 = self.create_interface(url="url_2")
+
+        instance.new_graph([interface_1, interface_2])
+
+        # Dummy operations are ordered by key, and after operations which are ready at same time
+        instance.add_edge("$b-PRODUCER", interface_1.op_id)
+        instance.add_edge("$a-PRODUCER", interface_2.op_id)
+
+        assert instance.get_priority("$a-PRODUCER", 3) < instance.get_priority("$b-PRODUCER", 2)
+        assert instance.get_priority(interface_2.op_id, 1) < instance.get_priority("$a-PRODUCER", 3)
+        assert instance.topological_sort() == [interface_2, interface_1]
+
+    def test_topological_levels(self, instance):
+        interfaces = [self.create_interface(url=f"url_{index}") for index in range(5)]
+        delete_interface = self.create_interface(url="url_5", method=constants.DELETE)
+        instance.new_graph(interfaces + [delete_interface])
+        op_ids = [interface.op_id for interface in interfaces]
+
+        # Barrier between (0, 1, 2) and (3, 4), and dummy operation before 0. Neither of them is a level
+        instance.add_cartesian_edges(set(op_ids[:3]), set(op_ids[3:]))
+        instance.add_edge("$a-PRODUCER", op_ids[0])
+        instance.add_edge(op_ids[3], delete_interface.op_id)
+
+        assert instance.barrier_keys
+        assert instance.topological_levels() == [interfaces[:3], interfaces[3:], [delete_interface]]
+
     @mock.patch('atlas.modules.transformer.ordering.operation.OperationGraph.add_cartesian_edges')
     def test_transform_operation(self, patched_add_cartesian_edge, instance):
         res_instance = Resource("resource")
@@ -117,3 +184,29 @@ class TestOperation:
         instance.transform_dfs(res_instance, set(), set(), visited)
 
         assert patched_transform_op.assert_not_called
+
+    def test_transform_dfs_order(self, instance):
+        resources = [Resource(f"res_{idx}") for idx in range(4)]
+        resources[0].add_neighbour(resources[1])
+        resources[0].add_neighbour(resources[2])
+        resources[1].add_neighbour(resources[3])
+        resources[2].add_neighbour(resources[3])
+        visited = {resource.get_id(): instance.WHITE for resource in resources}
+
+        with mock.patch.object(instance, "transform_operation", return_value=(set(), set())) as patched:
+            instance.transform_dfs(resources[0], set(), set(), visited)
+
+        assert [call[0][0].get_id() for call in patched.call_args_list] == ["res_0", "res_1", "res_3", "res_2"]
+        assert set(visited.values()) == {instance.BLACK}
+
+    def test_transform_dfs_deep_chain(self, instance):
+        resources = [Resource(f"res_{idx}") for idx in range(5000)]
+        for resource, next_resource in zip(resources, resources[1:]):
+            resource.add_neighbour(next_resource)
+            resource.producers = {f"{resource.get_id()}_create"}
+        visited = {resource.get_id(): instance.WHITE for resource in resources}
+
+        instance.transform_dfs(resources[0], set(), set(), visited)
+
+        connections = {node.get_id() for node in instance.get_node("res_4997_create").get_connections()}
+        assert "res_4998_create" in connections
@@ -1,3 +1,4 @@
+import random
 from unittest import mock
 
 import pytest
@@ -275,7 +276,7 @@ class TestResourceGraph:
         assert dummy_resource.producers == set()
         assert dummy_resource.destructors == set()
 
-    @mock.patch('atlas.modules.transformer.ordering.resource.utils.resolve_reference')
+    @mock.patch('atlas.modules.transformer.ordering.resource.references.resolve')
     def test_parse_request_parameters_with_ref(self, patched_reference, instance):
 
         interface = OpenAPITaskInterface()
@@ -339,6 +340,68 @@ class TestResourceGraph:
 
         assert ref_graph == {"ref_1": "producer", "ref_2": "consumer", "ref_3": "producer"}
 
+    @staticmethod
+    def make_graph(instance, edges, consumers, producers):
+        for edge in edges:
+            instance.add_edge(*edge)
+        for key, op_ids in consumers.items():
+            instance.add_node(key).consumers = set(op_ids)
+        for key, op_ids in producers.items():
+            instance.add_node(key).producers = set(op_ids)
+
+    def test_remove_dependent_producers_diamond(self, instance):
+        # "a" is nested in "b" and "c", both of which are nested in "d"
+        self.make_graph(
+            instance, [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")],
+            consumers={"b": {"get_b"}, "c": {"get_c"}, "d": {"get_d"}},
+            producers={"a": {"get_b", "get_c", "get_d", "post_a"}, "b": {"get_c", "get_d", "post_b"}, "d": {"get_b"}}
+        )
+        producers = instance.get_node("a").producers
+
+        instance.remove_dependent_producers()
+
+        assert instance.get_node("a").producers == {"post_a"}
+        assert instance.get_node("a").producers is producers
+        assert instance.get_node("b").producers == {"get_c", "post_b"}
+        assert instance.get_node("d").producers == {"get_b"}
+
+    def test_remove_dependent_producers_deep_chain(self, instance):
+        size = 5000
+        self.make_graph(
+            instance, [(idx, idx + 1) for idx in range(size)],
+            consumers={size: {"get_last"}}, producers={idx: {"get_last", f"post_{idx}"} for idx in range(size + 1)}
+        )
+
+        instance.remove_dependent_producers()
+
+        assert instance.get_node(0).producers == {"post_0"}
+        assert instance.get_node(size - 1).producers == {f"post_{size - 1}"}
+        assert instance.get_node(size).producers == {"get_last", f"post_{size}"}
+
+    def test_remove_dependent_producers_random(self, instance):
+        random_gen = random.Random(3)
+        op_ids = [f"op_{idx}" for idx in range(30)]
+        edges = {(random_gen.randrange(idx), idx) for idx in range(1, 40) for _ in range(2)}
+        consumers = {idx: set(random_gen.sample(op_ids, 3)) for idx in range(40)}
+        producers = {idx: set(random_gen.sample(op_ids, 5)) for idx in range(40)}
+        self.make_graph(instance, edges, consumers, producers)
+
+        # Producers lose consumers of all resources which are reachable from them
+        expected = {}
+        for node in instance:
+            reachable = instance.dfs(node)[1:]
+            expected[node.key] = producers[node.key] - set().union(*[consumers[child.key] for child in reachable])
+
+        instance.remove_dependent_producers()
+
+        assert {node.key: node.producers for node in instance} == expected
+
+    def test_remove_dependent_producers_with_cycle(self, instance):
+        self.make_graph(instance, [("a", "b"), ("b", "a")], consumers={}, producers={})
+
+        with pytest.raises(exceptions.OrderingException):
+            instance.remove_dependent_producers()
+
 
 class TestSwaggerResourceValidator:
 
@@ -131,7 +131,7 @@ class TestAutoGeneratorUnit:
         ) == set()
         assert instance.resource_params == set()
 
-    @mock.patch('atlas.modules.resource_creator.creators.utils.resolve_reference')
+    @mock.patch('atlas.modules.resource_creator.creators.references.resolve')
     def test_params_params_with_ref(self, patch, instance):
         patch.return_value = {"in": "path", "name": "xyz"}
         instance.extract_resource_name_from_param = mock.MagicMock(return_value='patched_res')
@@ -161,7 +161,7 @@ class TestAutoGeneratorUnit:
         assert instance.processed_refs.issuperset({"all_of_test"})
         assert instance.resource_params.issuperset({"alloftest"})
 
-    @mock.patch('atlas.modules.resource_creator.creators.utils.resolve_reference')
+    @mock.patch('atlas.modules.resource_creator.creators.references.resolve')
     def test_invalid_ref(self, patch, instance):
         instance.get_ref_name_and_config(123)
         patch.assert_not_called()
@@ -7,7 +7,28 @@ class TestGenerate:
 
     @mock.patch('atlas.modules.resource_creator.commands.generate.AutoGenerator')
     def test_handle(self, patch):
+        context = mock.MagicMock()
+        resource_map = context.resource_map
+
         instance = Generate()
-        instance.handle()
+        instance.handle(context=context)
+
+        assert patch.mock_calls == [
+            mock.call(specs=context.input_specs, resource_mapping=resource_map),
+            mock.call().parse(),
+            mock.call().update(),
+            mock.call().get_resource_mapping()
+        ]
+        assert context.specs == patch.return_value.specs
+        assert context.resource_map == patch.return_value.get_resource_mapping.return_value
+
+    @mock.patch('atlas.modules.resource_creator.commands.generate.pipeline.PipelineContext')
+    @mock.patch('atlas.modules.resource_creator.commands.generate.AutoGenerator')
+    def test_handle_without_context(self, patch, patched_context):
+        context = patched_context.return_value
+        resource_map = context.resource_map
+
+        Generate().handle()
 
-        assert patch.mock_calls == [mock.call(), mock.call().parse(), mock.call().update()]
+        patched_context.assert_called_once_with()
+        patch.assert_called_once_with(specs=context.input_specs, resource_mapping=resource_map)
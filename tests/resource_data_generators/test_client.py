@@ -0,0 +1,102 @@
+import sqlite3
+import threading
+from unittest import mock
+
+import pytest
+from playhouse.pool import PooledMySQLDatabase, PooledPostgresqlDatabase, PooledSqliteDatabase
+
+from atlas.modules.resource_data_generator.database.client import Client, settings
+
+
+class TestClient:
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        path = str(tmp_path / "db.sqlite")
+        connection = sqlite3.connect(path)
+        connection.execute("create table items (id integer)")
+        connection.executemany("insert into items values (?)", [(idx, ) for idx in range(5)])
+        connection.execute("create table numbers (id integer)")
+        connection.executemany("insert into numbers values (?)", [(idx, ) for idx in range(1000)])
+        connection.commit()
+        connection.close()
+
+        with mock.patch.dict(settings.DATABASE, engine="sqlite", name=path):
+            yield path
+
+    @pytest.mark.parametrize("engine, engine_class", [
+        ("postgres", PooledPostgresqlDatabase), ("mysql", PooledMySQLDatabase), ("sqlite", PooledSqliteDatabase)
+    ])
+    def test_connect_to_db(self, engine, engine_class):
+        with mock.patch.dict(settings.DATABASE, engine=engine, name="db", max_connections=4, stale_timeout=10):
+            db = Client.connect_to_db()
+
+        assert isinstance(db, engine_class)
+        assert db.is_closed()
+        assert db.database == "db"
+        assert db._max_connections == 4 and db._stale_timeout == 10
+
+    def test_connect_to_db_with_no_engine(self):
+        with mock.patch.dict(settings.DATABASE, engine=""):
+            assert Client().db is None
+
+    def test_lazy_connect(self, database):
+        client = Client()
+        assert client._db is None
+
+        assert sorted(client.fetch_ids("select id from items")) == [0, 1, 2, 3, 4]
+        assert not client.db.is_closed()
+
+        client.close()
+        assert client.db.is_closed()
+
+    def test_shared_by_threads(self, database):
+        client = Client()
+        results = []
+
+        def fetch():
+            results.append(client.fetch_rows("select count(*) from items"))
+            client.close()
+
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [[(5, )]] * 4
+
+        # All connections are back in pool, and are re-used
+        assert not client.db._in_use
+        connections = len(client.db._connections)
+        client.fetch_rows("select 1")
+        assert len(client.db._connections) == connections - 1
+
+        client.close_all()
+        assert not client.db._connections and not client.db._in_use
+
+    def test_iter_rows(self, database):
+        client = Client()
+
+        batches = list(client.iter_rows("select id from numbers order by id", batch_size=300))
+
+        assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+        assert [row[0] for batch in batches for row in batch] == list(range(1000))
+
+    def test_fetch_sample(self, database):
+        client = Client()
+
+        sample = client.fetch_sample_ids("select id from numbers", 100)
+        assert len(sample) == len(set(sample)) == 100
+        assert set(sample) <= set(range(1000))
+
+        # Sample is spread over all rows, and not just the first ones
+        assert max(sample) >= 100
+
+        assert client.fetch_sample("select id from items", 10, mapper=len) == 5
+
+    def test_sampling_queries(self, database):
+        client = Client()
+
+        assert client.fetch_ids("select id from numbers order by random() limit 10;") != tuple(range(10))
+        assert client.fetch_ids("select id from numbers order by id desc limit 3;") == (999, 998, 997)
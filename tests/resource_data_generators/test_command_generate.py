@@ -1,14 +1,73 @@
 from unittest import mock
 
-from atlas.modules.resource_data_generator.commands.generate import Generate
+import pytest
+
+from atlas.modules.resource_data_generator.commands.generate import CommandError, Generate, result_cache
 
 
 class TestGenerate:
 
     @mock.patch('atlas.modules.resource_data_generator.commands.generate.ProfileResourceDataGenerator')
     def test_handle(self, patch):
+        context = mock.MagicMock()
 
         instance = Generate()
-        instance.handle()
+        output = instance.handle(context=context)
+
+        assert patch.mock_calls == [
+            mock.call(
+                resource_map=context.resource_map, profile_configs=context.profiles, jobs=None, full_refresh=False,
+                refresh=False
+            ),
+            mock.call().parse()
+        ]
+        context.set_profile_resources.assert_called_once_with(patch.return_value.profile_resources)
+        assert output == "Resource queries and scripts: 0 requested, 0 run\n"
+
+    @mock.patch('atlas.modules.resource_data_generator.commands.generate.ProfileResourceDataGenerator')
+    def test_handle_with_jobs(self, patch):
+        context = mock.MagicMock()
+
+        Generate().handle(context=context, jobs=4)
+
+        patch.assert_called_once_with(
+            resource_map=context.resource_map, profile_configs=context.profiles, jobs=4, full_refresh=False,
+            refresh=False
+        )
+
+    @mock.patch('atlas.modules.resource_data_generator.commands.generate.ProfileResourceDataGenerator')
+    def test_handle_with_full_refresh(self, patch):
+        context = mock.MagicMock()
+
+        Generate().handle(context=context, full_refresh=True)
+
+        assert patch.call_args[1]["full_refresh"] is True
+
+    @pytest.mark.parametrize("argv, full_refresh", [
+        ([], False), (["--full_refresh"], True), (["--no-full_refresh"], False)
+    ])
+    def test_full_refresh_argument(self, argv, full_refresh):
+        parser = Generate().create_parser("atlas", "fetch_data")
+        assert parser.parse_args(argv).full_refresh is full_refresh
+
+    @pytest.mark.parametrize("argv, refresh", [([], False), (["--refresh"], True), (["--no-refresh"], False)])
+    def test_refresh_argument(self, argv, refresh):
+        parser = Generate().create_parser("atlas", "fetch_data")
+        assert parser.parse_args(argv).refresh is refresh
+
+    @mock.patch('atlas.modules.resource_data_generator.commands.generate.ProfileResourceDataGenerator')
+    def test_handle_with_cache(self, patch):
+        def parse():
+            result_cache.stats[result_cache.HITS] += 2
+            result_cache.stats[result_cache.MISSES] += 1
+
+        patch.return_value.parse.side_effect = parse
+
+        output = Generate().handle(context=mock.MagicMock(), refresh=True)
+
+        assert patch.call_args[1]["refresh"] is True
+        assert output.endswith("Resource query cache: 2 served from cache, 1 from database\n")
 
-        assert patch.mock_calls == [mock.call(), mock.call().parse()]
+    def test_handle_with_invalid_jobs(self):
+        with pytest.raises(CommandError):
+            Generate().handle(context=mock.MagicMock(), jobs=0)
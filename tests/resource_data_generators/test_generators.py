@@ -1,12 +1,19 @@
+import threading
+import time
 from unittest import mock
 
 import pytest
 
+from atlas.modules import resource_pool
+from atlas.modules.resource_data_generator import result_cache, watermarks
 from atlas.modules.resource_data_generator.generators import (
     exceptions,
     ProfileResourceDataGenerator,
     resource_constants as constants,
-    settings
+    settings,
+    stats,
+    REQUESTED,
+    REUSED
 )
 
 
@@ -23,7 +30,7 @@ class TestProfileResourceDataGenerator:
         db_obj.fetch_rows.return_value = [3, 4]
 
         obj = ProfileResourceDataGenerator()
-        obj.write_file = mock.MagicMock()
+        obj.write_resources = mock.MagicMock()
 
         obj.parse()
 
@@ -41,7 +48,7 @@ class TestProfileResourceDataGenerator:
         db_obj.fetch_rows.return_value = [3, 4]
 
         obj = ProfileResourceDataGenerator()
-        obj.write_file = mock.MagicMock()
+        obj.write_resources = mock.MagicMock()
 
         obj.parse()
 
@@ -50,10 +57,77 @@ class TestProfileResourceDataGenerator:
             "inherit_override": {1, 2}, "data_from_func": {7, 8}
         }
 
-        write_args, _ = obj.write_file.call_args
+        write_args, _ = obj.write_resources.call_args
         assert expected_resources in write_args
 
 
+    @mock.patch('atlas.modules.resource_data_generator.generators.db_client.Client')
+    def test_resources_fetched_with_jobs(self, db_patch):
+        db_obj = db_patch.return_value
+        db_obj.fetch_ids.return_value = [1, 2]
+        db_obj.fetch_rows.return_value = [3, 4]
+
+        obj = ProfileResourceDataGenerator(jobs=3)
+        obj.write_resources = mock.MagicMock()
+
+        obj.parse()
+
+        write_args, _ = obj.write_resources.call_args
+        assert list(write_args[1]) == [
+            "simple", "sql", "construct_sql", "minimal_construct_sql", "inherit_override", "data_from_func"
+        ]
+        assert write_args[1]["inherit_override"] == {1, 2}
+
+        # Workers share the client, and return their connections when they are done
+        db_patch.assert_called_once_with()
+        assert db_obj.close.call_count == 3
+        db_obj.close_all.assert_called_once_with()
+
+
+    @mock.patch('atlas.modules.resource_data_generator.generators.db_client.Client')
+    def test_queries_deduplicated_across_profiles(self, db_patch):
+        db_obj = db_patch.return_value
+        db_obj.fetch_ids.return_value = [1, 2]
+        db_obj.fetch_rows.return_value = [3, 4]
+        stats.clear()
+
+        obj = ProfileResourceDataGenerator(
+            profile_configs={"profile_1": {"token": "a"}, "profile_2": {"token": "b"}}, resource_map={
+                "sql": {"sql": "select id from t1 where token = '{token}'"},
+                "construct_sql": {"table": "t2"},
+                "data_from_func": {"source": "script", "func": "get_data"}
+            }
+        )
+        obj.write_resources = mock.MagicMock()
+
+        obj.parse()
+
+        assert db_obj.fetch_rows.mock_calls == [
+            mock.call(sql="select id from t1 where token = 'a'", mapper=None),
+            mock.call(sql="select id from t1 where token = 'b'", mapper=None)
+        ]
+        db_obj.fetch_ids.assert_called_once_with(sql="select id from t2 limit 50;", mapper=None)
+        assert stats == {REQUESTED: 6, REUSED: 2}
+        assert obj.profile_resources["profile_1"] == obj.profile_resources["profile_2"] == {
+            "sql": {3, 4}, "construct_sql": {1, 2}, "data_from_func": {7, 8}
+        }
+
+    @mock.patch('atlas.modules.resource_data_generator.generators.db_client.Client')
+    def test_queries_not_deduplicated(self, db_patch):
+        db_obj = db_patch.return_value
+        db_obj.fetch_ids.return_value = [1, 2]
+
+        with mock.patch.object(settings, "FETCH_DATA_DEDUPLICATE", False):
+            obj = ProfileResourceDataGenerator(
+                profile_configs={"profile_1": {}, "profile_2": {}}, resource_map={"construct_sql": {"table": "t2"}}
+            )
+        obj.write_resources = mock.MagicMock()
+
+        obj.parse()
+
+        assert db_obj.fetch_ids.call_count == 2
+
+
 class TestProfileResourceDataGeneratorUnit:
     """
     Unit Test cases to test the edge cases of ProfileResourceDataGenerator
@@ -136,3 +210,230 @@ class TestProfileResourceDataGeneratorUnit:
         instance.profiles = ["b", "c"]
 
         assert instance.get_profiles() == {"b": {}}
+
+    def test_fetch_resources_with_jobs(self, instance):
+        instance.jobs = 4
+        instance.client = mock.MagicMock()
+        fetch_threads = set()
+        close_threads = set()
+
+        def parse_for_resource(resource, config):
+            # Later items finish first
+            time.sleep(config["delay"])
+            fetch_threads.add(threading.get_ident())
+            return [resource]
+
+        instance.parse_for_resource = parse_for_resource
+        instance.client.close.side_effect = lambda: close_threads.add(threading.get_ident())
+
+        results = instance.fetch_resources([(f"res_{idx}", {"delay": (8 - idx) / 1000}) for idx in range(8)])
+
+        assert results == [[f"res_{idx}"] for idx in range(8)]
+        assert len(fetch_threads) > 1
+        assert fetch_threads <= close_threads and threading.get_ident() not in close_threads
+
+    def test_fetch_resources_with_error(self, instance):
+        instance.jobs = 2
+        instance.parse_for_resource = mock.MagicMock(side_effect=[[1], exceptions.ResourcesException, [3]])
+
+        with pytest.raises(exceptions.ResourcesException):
+            instance.fetch_resources([("a", {}), ("b", {}), ("c", {})])
+
+    def test_fetch_once_concurrent(self, instance):
+        started = threading.Event()
+        release = threading.Event()
+        fetch = mock.MagicMock(side_effect=lambda: started.set() or release.wait() and [1])
+
+        thread = threading.Thread(target=instance.fetch_once, args=(("key", ), fetch))
+        thread.start()
+        started.wait()
+
+        waiter_results = []
+        waiter = threading.Thread(target=lambda: waiter_results.append(instance.fetch_once(("key", ), fetch)))
+        waiter.start()
+        release.set()
+        thread.join()
+        waiter.join()
+
+        assert waiter_results == [[1]]
+        fetch.assert_called_once_with()
+
+    def test_fetch_once_with_error(self, instance):
+        fetch = mock.MagicMock(side_effect=exceptions.ResourcesException)
+
+        for _ in range(2):
+            with pytest.raises(exceptions.ResourcesException):
+                instance.fetch_once(("key", ), fetch)
+
+        fetch.assert_called_once_with()
+
+    @pytest.mark.parametrize("strategy, engine, query", [
+        ("first", "postgres", "select id from t1 where active limit 10;"),
+        ("random", "postgres", "select id from t1 where active order by random() limit 10;"),
+        ("random", "mysql", "select id from t1 where active order by rand() limit 10;"),
+        ("recent", "postgres", "select id from t1 where active order by id desc limit 10;"),
+        ("reservoir", "postgres", "select id from t1 where active;"),
+    ])
+    def test_construct_fetch_query_with_strategy(self, instance, strategy, engine, query):
+        with mock.patch.dict(settings.DATABASE, engine=engine):
+            assert instance.construct_fetch_query("t1", "id", "active", strategy, 10) == query
+
+    def test_construct_query_with_sampling(self, instance):
+        query = instance.construct_query(
+            {"table": "t1", "strategy": "recent", "order_by": "created"}, {"sample_size": 5, "filters": "active"}
+        )
+        assert query == "select id from t1 where active order by created desc limit 5;"
+
+    @pytest.mark.parametrize("config", [
+        {"strategy": "latest"}, {"sample_size": 0}, {"sample_size": "10"}, {"sample_size": True}
+    ])
+    def test_get_sampling_invalid(self, instance, config):
+        with pytest.raises(exceptions.ResourcesException):
+            instance.get_sampling(config, {})
+
+    def test_get_sampling_from_globals(self, instance):
+        assert instance.get_sampling({"sample_size": 5}, {"strategy": "random", "sample_size": 10}) == ("random", 5)
+        assert instance.get_sampling({}, {}) == (None, None)
+
+    def test_parse_db_source_with_reservoir(self, instance):
+        instance.client = mock.MagicMock()
+        instance.active_profile_config = {}
+
+        instance.parse_db_source({"table": "t1", "strategy": "reservoir", "sample_size": 1000}, {})
+
+        instance.client.fetch_sample_ids.assert_called_once_with(
+            sql="select id from t1;", sample_size=1000, mapper=None
+        )
+        instance.client.fetch_ids.assert_not_called()
+
+    def test_parse_db_source_sql_with_sampling(self, instance):
+        instance.client = mock.MagicMock()
+        instance.active_profile_config = {}
+
+        instance.parse_db_source({"sql": "select id, name from t1;", "strategy": "recent", "order_by": "id"}, {})
+        instance.parse_db_source({"sql": "select id from t2", "strategy": "reservoir"}, {})
+
+        instance.client.fetch_rows.assert_called_once_with(
+            sql="select * from (select id, name from t1) as sample order by id desc limit 50;", mapper=None
+        )
+        instance.client.fetch_sample.assert_called_once_with(sql="select id from t2", sample_size=50, mapper=None)
+
+    def test_parse_db_source_sql_recent_without_order(self, instance):
+        instance.active_profile_config = {}
+
+        with pytest.raises(exceptions.ResourcesException):
+            instance.parse_db_source({"sql": "select id from t1", "strategy": "recent"}, {})
+
+    @pytest.mark.parametrize("filters, last_watermark, query", [
+        (None, None, "select id, updated from t1 order by updated desc limit 5;"),
+        ("active", None, "select id, updated from t1 where active order by updated desc limit 5;"),
+        ("active", 10, "select id, updated from t1 where (active) and (updated > 10) order by updated desc limit 5;"),
+        (None, "2020-01-01", "select id, updated from t1 where updated > '2020-01-01' order by updated desc limit 5;"),
+    ])
+    def test_construct_watermark_query(self, instance, filters, last_watermark, query):
+        assert instance.construct_watermark_query("t1", "id", "updated", filters, 5, last_watermark) == query
+
+    def test_parse_incremental_source(self, instance, tmp_path):
+        instance.client = mock.MagicMock()
+        instance.deduplicate = False
+        instance.watermarks = watermarks.WatermarkStore(str(tmp_path / "watermarks.json"))
+        instance.active_profile, instance.active_profile_config = "profile", {"org": 1}
+        config = {"table": "t1", "watermark": "seq", "filters": "org = {org}", "sample_size": 4}
+
+        instance.client.fetch_rows.return_value = [(3, 30), (2, 20), (1, 10)]
+        assert instance.parse_incremental_source("res", config, {}) == [3, 2, 1]
+
+        # Only new rows are fetched, and added to front of pool. Oldest are dropped once pool is full
+        instance.client.fetch_rows.return_value = [(5, 50), (2, 40)]
+        assert instance.parse_incremental_source("res", config, {}) == [5, 2, 3, 1]
+        instance.client.fetch_rows.return_value = []
+        assert instance.parse_incremental_source("res", config, {}) == [5, 2, 3, 1]
+
+        assert [call[2]["sql"] for call in instance.client.fetch_rows.mock_calls] == [
+            "select id, seq from t1 where org = 1 order by seq desc limit 4;",
+            "select id, seq from t1 where (org = 1) and (seq > 30) order by seq desc limit 4;",
+            "select id, seq from t1 where (org = 1) and (seq > 50) order by seq desc limit 4;",
+        ]
+
+        # Watermark of each profile is separate. Change in query and full refresh fetch the pool in full
+        instance.client.fetch_rows.return_value = [(6, 60)]
+        instance.active_profile = "other_profile"
+        assert instance.parse_incremental_source("res", config, {}) == [6]
+        instance.active_profile_config = {"org": 2}
+        assert instance.parse_incremental_source("res", config, {}) == [6]
+        instance.full_refresh = True
+        assert instance.parse_incremental_source("res", config, {}) == [6]
+
+        assert [call[2]["sql"] for call in instance.client.fetch_rows.mock_calls[3:]] == [
+            "select id, seq from t1 where org = 1 order by seq desc limit 4;",
+            "select id, seq from t1 where org = 2 order by seq desc limit 4;",
+            "select id, seq from t1 where org = 2 order by seq desc limit 4;",
+        ]
+
+    @pytest.mark.parametrize("config", [
+        {"watermark": "seq"}, {"watermark": "seq", "table": "t1", "sql": "select id from t1"},
+        {"watermark": "seq", "table": "t1", "strategy": "random"}
+    ])
+    def test_parse_incremental_source_invalid(self, instance, config):
+        with pytest.raises(exceptions.ResourcesException):
+            instance.parse_incremental_source("res", config, {})
+
+    @mock.patch('atlas.modules.resource_data_generator.generators.db_client.Client')
+    def test_parse_saves_watermarks(self, db_patch, tmp_path):
+        db_obj = db_patch.return_value
+        db_obj.fetch_rows.return_value = [(2, 20), (1, 10)]
+
+        obj = ProfileResourceDataGenerator(
+            profile_configs={"profile_1": {}}, resource_map={"res": {"table": "t1", "watermark": "seq"}}
+        )
+        obj.watermarks = watermarks.WatermarkStore(str(tmp_path / "watermarks.json"))
+        obj.write_resources = mock.MagicMock()
+
+        obj.parse()
+
+        assert obj.profile_resources["profile_1"] == {"res": {1, 2}}
+        state = watermarks.WatermarkStore(str(tmp_path / "watermarks.json")).profiles["profile_1"]["res"]
+        assert state["watermark"] == 20 and state["pool"] == [2, 1]
+
+    def test_parse_db_source_with_cache(self, instance, tmp_path):
+        instance.client = mock.MagicMock()
+        instance.client.fetch_ids.return_value = (1, 2)
+        instance.result_cache = result_cache.ResultCache(str(tmp_path / "results.sqlite"))
+        instance.active_profile_config = {}
+
+        for _ in range(2):
+            instance.fetched = {}
+            assert instance.parse_db_source({"table": "t1", "cache_ttl": 60}, {}) == (1, 2)
+            assert instance.parse_db_source({"table": "t2"}, {}) == (1, 2)
+
+        # Only the resource with TTL is served from cache
+        assert instance.client.fetch_ids.mock_calls == [
+            mock.call(sql="select id from t1 limit 50;", mapper=None),
+            mock.call(sql="select id from t2 limit 50;", mapper=None),
+            mock.call(sql="select id from t2 limit 50;", mapper=None)
+        ]
+
+    def test_get_cache_ttl(self, instance):
+        assert instance.get_cache_ttl({}, {}) == 0
+        assert instance.get_cache_ttl({}, {"cache_ttl": 60}) == 60
+        assert instance.get_cache_ttl({"cache_ttl": 0.5}, {"cache_ttl": 60}) == 0.5
+
+        with mock.patch.object(settings, "FETCH_DATA_CACHE_TTL", 10):
+            assert instance.get_cache_ttl({}, {}) == 10
+
+    @pytest.mark.parametrize("ttl", [-1, "60", True, None])
+    def test_get_cache_ttl_invalid(self, instance, ttl):
+        with pytest.raises(exceptions.ResourcesException):
+            instance.get_cache_ttl({"cache_ttl": ttl}, {})
+
+    @pytest.mark.parametrize("yaml_export", [False, True])
+    def test_write_resources(self, instance, tmp_path, yaml_export):
+        instance.get_project_folder = mock.MagicMock(return_value=str(tmp_path))
+
+        with mock.patch.object(settings, "RESOURCES_YAML_EXPORT", yaml_export):
+            instance.write_resources("profile.yaml", {"res": {1, 2}, "names": {"a"}}, "resources")
+
+        assert resource_pool.load(str(tmp_path / "profile.pool")) == {"res": {1, 2}, "names": {"a"}}
+        assert (tmp_path / "profile.yaml").exists() == yaml_export
+        assert instance.read_resources("profile.yaml", "resources") == {"res": {1, 2}, "names": {"a"}}
+        assert instance.read_resources("other.yaml", "resources") == {}
@@ -0,0 +1,79 @@
+import time
+from unittest import mock
+
+import pytest
+
+from atlas.modules.resource_data_generator.result_cache import HITS, MISSES, ResultCache, settings, stats
+
+
+class TestResultCache:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "cache" / "results.sqlite")
+
+    def test_fetch(self, path):
+        stats.clear()
+        cache = ResultCache(path)
+        fetch = mock.MagicMock(return_value=(1, 2))
+
+        assert cache.fetch(["ids", "select id from t1;", None], 60, fetch) == (1, 2)
+        assert cache.fetch(["ids", "select id from t1;", None], 60, fetch) == (1, 2)
+        cache.close()
+
+        # Results persist across runs
+        assert ResultCache(path).fetch(["ids", "select id from t1;", None], 60, fetch) == (1, 2)
+
+        fetch.assert_called_once_with()
+        assert stats == {HITS: 2, MISSES: 1}
+
+    def test_fetch_expired(self, path):
+        cache = ResultCache(path)
+        fetch = mock.MagicMock(side_effect=[(1, ), (2, ), (3, )])
+        now = time.time()
+
+        cache.fetch(["ids", "sql", None], 60, fetch)
+
+        with mock.patch("atlas.modules.resource_data_generator.result_cache.time.time", return_value=now + 30):
+            assert cache.fetch(["ids", "sql", None], 60, fetch) == (1, )
+
+            # TTL of resource is shortened, and applies to result already in cache
+            assert cache.fetch(["ids", "sql", None], 10, fetch) == (2, )
+
+        with mock.patch("atlas.modules.resource_data_generator.result_cache.time.time", return_value=now + 100):
+            assert cache.fetch(["ids", "sql", None], 60, fetch) == (3, )
+
+    def test_fetch_with_refresh(self, path):
+        ResultCache(path).fetch(["ids", "sql", None], 60, mock.MagicMock(return_value=(1, )))
+
+        cache = ResultCache(path, refresh=True)
+        assert cache.fetch(["ids", "sql", None], 60, mock.MagicMock(return_value=(2, ))) == (2, )
+
+        # Fresh result is served to later runs
+        assert ResultCache(path).fetch(["ids", "sql", None], 60, mock.MagicMock()) == (2, )
+
+    def test_key(self, path):
+        cache = ResultCache(path)
+
+        assert cache.get_key(["ids", "sql", None]) != cache.get_key(["ids", "sql", "mapper"])
+        assert cache.get_key(["ids", "sql", None]) != cache.get_key(["rows", "sql", None])
+
+        key = cache.get_key(["ids", "sql", None])
+        with mock.patch.dict(settings.DATABASE, host="other_host"):
+            assert cache.get_key(["ids", "sql", None]) != key
+        with mock.patch.dict(settings.DATABASE, password="changed"):
+            assert cache.get_key(["ids", "sql", None]) == key
+
+    def test_corrupt_entry(self, path):
+        cache = ResultCache(path)
+        cache.fetch(["ids", "sql", None], 60, mock.MagicMock(return_value=(1, )))
+
+        with cache.connection:
+            cache.connection.execute("update results set result = ?", (b"corrupt", ))
+
+        assert cache.fetch(["ids", "sql", None], 60, mock.MagicMock(return_value=(2, ))) == (2, )
+
+    def test_no_file_if_unused(self, path, tmp_path):
+        ResultCache(path).close()
+
+        assert not (tmp_path / "cache").exists()
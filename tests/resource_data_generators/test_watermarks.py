@@ -0,0 +1,48 @@
+import datetime
+
+import pytest
+
+from atlas.modules.resource_data_generator.watermarks import to_sql_literal, WatermarkStore
+
+
+@pytest.mark.parametrize("value, literal", [
+    (10, "10"), (1.5, "1.5"), ("2020-01-01", "'2020-01-01'"), ("it's", "'it''s'"),
+    (datetime.datetime(2020, 1, 1, 10), "'2020-01-01 10:00:00'")
+])
+def test_to_sql_literal(value, literal):
+    assert to_sql_literal(value) == literal
+
+
+class TestWatermarkStore:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "cache" / "watermarks.json")
+
+    def test_save_and_get(self, path):
+        store = WatermarkStore(path)
+        store.set("profile", "res", "query", datetime.datetime(2020, 1, 1), [2, 1])
+        store.save()
+
+        store = WatermarkStore(path)
+        assert store.get("profile", "res", "query") == {
+            "query": "query", "watermark": "2020-01-01 00:00:00", "pool": [2, 1]
+        }
+        assert store.get("profile", "res", "other query") is None
+        assert store.get("other_profile", "res", "query") is None
+
+    def test_save_without_changes(self, path):
+        WatermarkStore(path).save()
+
+        assert WatermarkStore(path).profiles == {}
+
+    @pytest.mark.parametrize("content", ["{corrupt", '{"version": 0, "profiles": {"profile": {}}}', "[]"])
+    def test_read_invalid(self, path, content):
+        store = WatermarkStore(path)
+        store.set("profile", "res", "query", 1, [1])
+        store.save()
+
+        with open(path, "w") as stream:
+            stream.write(content)
+
+        assert WatermarkStore(path).profiles == {}
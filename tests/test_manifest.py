@@ -0,0 +1,105 @@
+from unittest import mock
+
+import pytest
+
+from atlas.modules.transformer import interface
+from atlas.modules.transformer.manifest import BuildManifest, stats, REUSED, GENERATED
+
+
+class TestBuildManifest:
+
+    @pytest.fixture
+    def spec(self):
+        return {
+            "definitions": {
+                "Pet": {"properties": {"owner": {"$ref": "#/definitions/User"}}},
+                "User": {"properties": {"name": {"type": "string"}}},
+                "Tag": {"properties": {"name": {"type": "string"}}}
+            }
+        }
+
+    @pytest.fixture
+    def pet_op(self):
+        op = interface.OpenAPITaskInterface()
+        op.method = "get"
+        op.url = "/pets"
+        op.func_name = "list_pets"
+        op.responses = {"200": {"schema": {"$ref": "#/definitions/Pet"}}}
+        return op
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "manifest.pickle")
+
+    def test_fingerprint_is_stable(self, spec, pet_op, path):
+        assert BuildManifest(spec, path).fingerprint(pet_op) == BuildManifest(spec, path).fingerprint(pet_op)
+
+    def test_fingerprint_with_transitive_ref_change(self, spec, pet_op, path):
+        fingerprint = BuildManifest(spec, path).fingerprint(pet_op)
+
+        spec["definitions"]["User"]["properties"]["age"] = {"type": "integer"}
+
+        assert BuildManifest(spec, path).fingerprint(pet_op) != fingerprint
+
+    def test_fingerprint_with_unrelated_ref_change(self, spec, pet_op, path):
+        fingerprint = BuildManifest(spec, path).fingerprint(pet_op)
+
+        spec["definitions"]["Tag"]["properties"]["age"] = {"type": "integer"}
+
+        assert BuildManifest(spec, path).fingerprint(pet_op) == fingerprint
+
+    def test_fingerprint_with_op_change(self, spec, pet_op, path):
+        fingerprint = BuildManifest(spec, path).fingerprint(pet_op)
+
+        pet_op.tags = ["pets"]
+
+        assert BuildManifest(spec, path).fingerprint(pet_op) != fingerprint
+
+    def test_fingerprint_with_invalid_ref(self, spec, pet_op, path):
+        pet_op.responses = {"200": {"schema": {"$ref": "#/definitions/Missing"}}}
+        assert BuildManifest(spec, path).fingerprint(pet_op)
+
+    def test_fingerprint_with_settings_change(self, spec, pet_op, path):
+        fingerprint = BuildManifest(spec, path).fingerprint(pet_op)
+
+        with mock.patch("atlas.modules.transformer.manifest.settings.HIT_ALL_QUERY_PARAMS", True):
+            assert BuildManifest(spec, path).fingerprint(pet_op) != fingerprint
+
+    def test_save_and_get(self, spec, pet_op, path):
+        manifest = BuildManifest(spec, path)
+        manifest.fingerprint(pet_op)
+        manifest.record(pet_op.op_id, {"statements": []})
+        manifest.save()
+
+        stats.clear()
+        manifest = BuildManifest(spec, path)
+
+        assert manifest.get(pet_op.op_id, manifest.fingerprint(pet_op)) == {"statements": []}
+        assert manifest.get(pet_op.op_id, "other") is None
+        assert manifest.get("GET /other", "other") is None
+        assert stats == {REUSED: 1, GENERATED: 2}
+
+    def test_save_drops_old_entries(self, spec, pet_op, path):
+        manifest = BuildManifest(spec, path)
+        manifest.fingerprint(pet_op)
+        manifest.record(pet_op.op_id, {})
+        manifest.save()
+
+        BuildManifest(spec, path).save()
+
+        assert BuildManifest(spec, path).entries == {}
+
+    def test_load_with_corrupt_manifest(self, spec, path):
+        with open(path, "wb") as manifest_file:
+            manifest_file.write(b"corrupt")
+
+        assert BuildManifest(spec, path).entries == {}
+
+    def test_load_with_environment_change(self, spec, pet_op, path):
+        manifest = BuildManifest(spec, path)
+        manifest.fingerprint(pet_op)
+        manifest.record(pet_op.op_id, {})
+        manifest.save()
+
+        with mock.patch.object(BuildManifest, "get_environment_digest", return_value="other"):
+            assert BuildManifest(spec, path).entries == {}
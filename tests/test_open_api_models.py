@@ -2,7 +2,7 @@ from unittest import mock
 
 import pytest
 
-from atlas.modules.transformer.open_api_models import Response, swagger_constants as constants, RESOURCES, DEF
+from atlas.modules.transformer.open_api_models import Response, swagger_constants as constants, RESOURCES, DEF, REFERENCES
 
 
 class TestResponse:
@@ -32,31 +32,91 @@ class TestResponse:
     def test_get_definition_ref_with_no_ref(self, instance):
         assert instance.get_definition_ref({}) is None
 
+    @staticmethod
+    def make_definitions(refs, resources=None):
+        resources = resources or {}
+        return {
+            name: {
+                constants.ALL_OF: [{constants.REF: f"#/definitions/{ref}"} for ref in refs_] + [
+                    {constants.RESOURCE: resources.get(name)}
+                ]
+            } for name, refs_ in refs.items()
+        }
+
     def test_resolve_definitions_with_definitions(self, instance):
         instance.specs = {
-            constants.DEFINITIONS: {
-                "def_1": {}
-            }
+            constants.DEFINITIONS: self.make_definitions(
+                {"Pet": ["User", "Tag"], "User": ["Address"], "Address": [], "Tag": []},
+                {"Pet": "pet", "User": "user", "Address": "address"}
+            )
         }
-        instance.parse_definitions = mock.MagicMock()
-        instance.resolve_nested_definition = mock.MagicMock(return_value="a")
-        instance.definitions = {"def_1": {}}
 
         instance.resolve_definitions()
 
-        assert instance.definitions == {"def_1": {RESOURCES: "a"}}
+        assert instance.definitions["pet"][RESOURCES] == {"pet", "user", "address"}
+        assert instance.definitions["user"][RESOURCES] == {"user", "address"}
+        assert instance.definitions["tag"][RESOURCES] == set()
+        assert instance.definitions["pet"][REFERENCES] == {"pet", "user", "tag"}
+        assert instance.definitions["address"][REFERENCES] == {"address"}
 
     def test_resolve_definitions_with_no_definitions(self, instance):
         instance.specs = {
             constants.DEFINITIONS: {}
         }
-        instance.parse_definitions = mock.MagicMock()
-        instance.resolve_nested_definition = mock.MagicMock(return_value="a")
-        instance.definitions = {"def_1": {}}
 
         instance.resolve_definitions()
 
-        assert instance.definitions == {"def_1": {}}
+        assert instance.definitions == {}
+
+    def test_resolve_definitions_with_cycle(self, instance):
+        instance.specs = {
+            constants.DEFINITIONS: self.make_definitions(
+                {"A": ["B"], "B": ["C"], "C": ["A", "D"], "D": ["D"], "E": ["A"]},
+                {"A": "a", "B": "b", "D": "d", "E": "e"}
+            )
+        }
+
+        instance.resolve_definitions()
+
+        for name in ["a", "b", "c"]:
+            assert instance.definitions[name][RESOURCES] == {"a", "b", "d"}
+        assert instance.definitions["d"][RESOURCES] == {"d"}
+        assert instance.definitions["e"][RESOURCES] == {"a", "b", "d", "e"}
+        assert instance.definitions["c"][REFERENCES] == {"c", "a", "d"}
+
+        # Members of a cycle do not share the set
+        assert instance.definitions["a"][RESOURCES] is not instance.definitions["b"][RESOURCES]
+
+    def test_resolve_definitions_with_unknown_ref(self, instance):
+        instance.specs = {constants.DEFINITIONS: self.make_definitions({"A": ["Missing"]}, {"A": "a"})}
+
+        instance.resolve_definitions()
+
+        assert instance.definitions["a"][RESOURCES] == {"a"}
+        assert instance.definitions["a"][REFERENCES] == {"a", "missing"}
+
+    def test_resolve_definitions_with_deep_chain(self, instance):
+        count = 2000
+        instance.specs = {
+            constants.DEFINITIONS: self.make_definitions(
+                {f"D{index}": [f"D{index + 1}"] if index < count - 1 else [] for index in range(count)},
+                {f"D{index}": f"r{index}" for index in range(count)}
+            )
+        }
+
+        instance.resolve_definitions()
+
+        assert len(instance.definitions["d0"][RESOURCES]) == count
+        assert instance.definitions[f"d{count - 1}"][RESOURCES] == {f"r{count - 1}"}
+
+    def test_get_components(self, instance):
+        instance.definitions = {
+            "a": {DEF: {"b"}}, "b": {DEF: {"a", "c"}}, "c": {DEF: {"unknown"}}, "d": {DEF: {"b"}}
+        }
+
+        components = [sorted(component) for component in instance.get_components()]
+
+        assert components == [["c"], ["a", "b"], ["d"]]
 
     def test_parse_field_config_with_resource(self, instance):
         instance.get_properties = mock.MagicMock(return_value={
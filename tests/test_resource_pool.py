@@ -0,0 +1,74 @@
+import datetime
+
+import pytest
+
+from atlas.modules import resource_pool, yaml_io
+
+
+class TestResourcePool:
+
+    @pytest.mark.parametrize("values, value_type", [
+        ([], resource_pool.INT32),
+        ([1, -2 ** 31, 2 ** 31 - 1], resource_pool.INT32),
+        ([1, 2 ** 40], resource_pool.INT64),
+        ([1.5, 2.0], resource_pool.FLOAT64),
+        (["a", "ü"], resource_pool.STRING),
+        ([1, "a"], resource_pool.JSON),
+        ([1, 2 ** 70], resource_pool.JSON),
+        ([True, False], resource_pool.JSON),
+        ([1, None], resource_pool.JSON),
+    ])
+    def test_get_type(self, values, value_type):
+        assert resource_pool.get_type(values) == value_type
+
+    def test_round_trip(self):
+        pools = {
+            "int32": {1, 2, -3}, "int64": {2 ** 40, -2 ** 40}, "float": {1.5}, "string": {"a", "ü", ""},
+            "mixed": {1, "a", None, True, 1.5}, "huge": {2 ** 70}, "empty": set(), "ключ": {1}
+        }
+
+        assert resource_pool.loads(resource_pool.dumps(pools)) == pools
+
+    def test_dumps_is_compact(self):
+        content = resource_pool.dumps({"ids": set(range(1000))})
+
+        assert len(content) == 12 + 4 + len("ids") + 5 + 4 * 1000
+
+    @pytest.mark.parametrize("values", [
+        [{"k": 1}], [[1, 2]], [1, {"k": 1}], [datetime.date(2020, 1, 1)], ["a", datetime.datetime(2020, 1, 1)]
+    ])
+    def test_dumps_invalid_values(self, values):
+        # Such values would not be read back as they were written
+        with pytest.raises(ValueError):
+            resource_pool.dumps({"pool": values})
+
+    @pytest.mark.parametrize("content", [
+        b"", b"ATRP", b"YAML\x01\x00\x00\x00\x00\x00\x00\x00", b"ATRP\x02\x00\x00\x00\x00\x00\x00\x00"
+    ])
+    def test_loads_invalid(self, content):
+        with pytest.raises(ValueError):
+            resource_pool.loads(content)
+
+    @pytest.mark.parametrize("pools", [{"ids": {1, 2}}, {"names": {"a", "b"}}, {"mixed": {1, "a"}}])
+    def test_loads_truncated(self, pools):
+        content = resource_pool.dumps(pools)
+
+        for length in [len(content) - 1, len(content) - 5, 14]:
+            with pytest.raises(ValueError):
+                resource_pool.loads(content[:length])
+
+        with pytest.raises(ValueError):
+            resource_pool.loads(content + b"\x00")
+
+    def test_read_profile_resources(self, tmp_path):
+        with open(tmp_path / "profile.yaml", "w") as yaml_stream:
+            yaml_io.dump({"res": {1, 2}}, yaml_stream)
+
+        # Resources of builds before pool files are read from YAML
+        assert resource_pool.read_profile_resources(str(tmp_path), "profile.yaml") == {"res": {1, 2}}
+
+        resource_pool.dump({"res": {3}}, str(tmp_path / "profile.pool"))
+        assert resource_pool.read_profile_resources(str(tmp_path), "profile.yaml") == {"res": {3}}
+
+        with pytest.raises(FileNotFoundError):
+            resource_pool.read_profile_resources(str(tmp_path), "other.yaml")
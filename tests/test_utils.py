@@ -1,3 +1,5 @@
+import copy
+import pickle
 from unittest import mock
 
 import pytest
@@ -10,6 +12,9 @@ class TestGetRefPathArray:
     def test_local_reference(self):
         assert utils.get_ref_path_array("#/definition/Sample") == ["definition", "Sample"]
 
+    def test_escaped_reference(self):
+        assert utils.get_ref_path_array("#/paths/~1pets~1{id}/x~0y~01") == ["paths", "/pets/{id}", "x~y~1"]
+
     def test_external_reference(self):
         with pytest.raises(exceptions.ImproperSwaggerException):
             utils.get_ref_path_array("document.json#/sample")
@@ -53,6 +58,20 @@ class TestResolveReference:
 
         patched_ref_array.assert_called_with("definition")
 
+    def test_valid_reference_with_list(self, patched_ref_array):
+        patched_ref_array.return_value = ["a", "1"]
+        specs = {"a": [{"b": 1}, {"c": 2}]}
+
+        assert utils.resolve_reference(specs, "definition") == {"c": 2}
+
+    @pytest.mark.parametrize("element", ["7", "x", "-1"])
+    def test_invalid_reference_in_list(self, patched_ref_array, element):
+        patched_ref_array.return_value = ["a", element]
+        specs = {"a": [{"b": 1}, {"c": 2}]}
+
+        with pytest.raises(exceptions.ImproperSwaggerException):
+            utils.resolve_reference(specs, "definition")
+
     def test_invalid_reference(self, patched_ref_array):
         patched_ref_array.return_value = ["a", "c"]
         specs = {"a": {"b": 1}}
@@ -124,3 +143,40 @@ class TestExtractResourceNameFromParam:
 
     def test_without_suffix_with_singular(self):
         assert utils.extract_resource_name_from_param("id", "pets/{id}/y/{y_id}/z/{abc}", constants.PATH_PARAM) == "pet"
+
+
+class TestFreeze:
+
+    def test_freeze(self):
+        shared = {"b": [1, 2]}
+        frozen = utils.freeze({"a": shared, "c": shared, "d": 1})
+
+        assert frozen == {"a": {"b": [1, 2]}, "c": {"b": [1, 2]}, "d": 1}
+        assert isinstance(frozen["a"]["b"], utils.FrozenList)
+        assert frozen["a"] is frozen["c"]
+
+    def test_frozen_dict_immutable(self):
+        frozen = utils.freeze({"a": 1})
+
+        with pytest.raises(TypeError):
+            frozen["b"] = 2
+
+        with pytest.raises(TypeError):
+            frozen.update({"b": 2})
+
+    def test_frozen_list_immutable(self):
+        frozen = utils.freeze([1])
+
+        with pytest.raises(TypeError):
+            frozen.append(2)
+
+    def test_pickle(self):
+        frozen = utils.freeze({"a": [1, {"b": 2}]})
+        loaded = pickle.loads(pickle.dumps(frozen))
+
+        assert loaded == frozen
+        assert isinstance(loaded["a"][1], utils.FrozenDict)
+
+    def test_copy(self):
+        frozen = utils.freeze({"a": [1]})
+        assert copy.deepcopy(frozen) == {"a": [1]}
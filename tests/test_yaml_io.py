@@ -0,0 +1,37 @@
+import io
+
+from atlas.modules import yaml_io
+
+
+class TestYamlIO:
+
+    def test_round_trip(self):
+        data = {"b": [1, 2], "a": {"c": "d"}, "ids": {1, 2}}
+
+        assert yaml_io.load(yaml_io.dump(data)) == data
+
+    def test_dump_sorted_block_style(self):
+        assert yaml_io.dump({"b": 1, "a": [1]}) == "a:\n- 1\nb: 1\n"
+
+    def test_dump_tuple_as_list(self):
+        stream = io.StringIO()
+        yaml_io.dump({"a": (1, 2)}, stream)
+        assert stream.getvalue() == "a:\n- 1\n- 2\n"
+
+    def test_dump_without_aliases(self):
+        shared = {"a": 1}
+
+        assert "&id" in yaml_io.dump([shared, shared])
+        assert yaml_io.dump([shared, shared], aliases=False) == "- a: 1\n- a: 1\n"
+
+    def test_normalize(self):
+        shared = {"z": 1, "a": (1, 2)}
+        data = {"b": shared, "a": shared, 200: {"y", "x"}}
+
+        normalized = yaml_io.normalize(data)
+
+        assert list(normalized) == list(yaml_io.load(yaml_io.dump(data)))
+        assert list(normalized["a"]) == ["a", "z"]
+        assert normalized["a"]["a"] == [1, 2]
+        assert normalized["a"] is normalized["b"]
+        assert normalized == yaml_io.load(yaml_io.dump(data))